@@ -1,189 +1,574 @@
 #
 # The Chess AI class
-# Will utilize minimax and alpha beta pruning
+# Will utilize negamax and alpha beta pruning
 #
 # Author: Boo Sung Kim
 # Note: Code inspired from the pseudocode by Sebastian Lague
 # from enums import Player
-# TODO: switch undo moves to stack data structure
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import chess_engine
 from enums import Player
+from bitboard import PAWN, QUEEN, NO_PIECE, PIECE_NAMES
+from move_encoding import PROMOTE_QUEEN
+from evaluation import PIECE_VALUES, tapered_score, pawn_structure, piece_bitboards
+from move_ordering import move_orderer
+from static_exchange import static_exchange
+from transposition_table import transposition_table, DEFAULT_SIZE_MB, EXACT, LOWER_BOUND, UPPER_BOUND
+from evaluation_cache import evaluation_cache, DEFAULT_SIZE_MB as DEFAULT_EVAL_CACHE_MB
+from pawn_hash import pawn_hash_table, DEFAULT_SIZE_MB as DEFAULT_PAWN_HASH_MB
+
+# Scores are from the point of view of the side to move; a mate found n plies from the root scores
+# MATE_SCORE - n, so that shorter mates are preferred
+MATE_SCORE = 5000000
+DRAW_SCORE = 0
+INFINITY = 10000000
+# Deepest iteration iterative_deepening will start
+MAX_DEPTH = 64
+# The clock and node limit are looked at once every CHECK_LIMITS_MASK + 1 nodes
+CHECK_LIMITS_MASK = 63
+# Quiescence skips a capture that cannot bring the score back up to alpha even with this much to spare
+DELTA_MARGIN = 20
+# Iterations from ASPIRATION_DEPTH on search the root with a window of ASPIRATION_WINDOW either side of the previous
+# iteration's score, doubled on the side the score falls out of until it lands inside
+ASPIRATION_DEPTH = 3
+ASPIRATION_WINDOW = 15
+# Selective search, see negamax; each technique can be switched off in chess_ai's constructor
+# null move pruning searches the null move NULL_MOVE_REDUCTION plies shallower, from NULL_MOVE_MIN_DEPTH on
+NULL_MOVE_REDUCTION = 2
+NULL_MOVE_MIN_DEPTH = 2
+# late move reductions start at the LMR_MOVE_INDEX-th move of nodes at least LMR_MIN_DEPTH deep, and reduce by two
+# plies from twice that move index and depth
+LMR_MOVE_INDEX = 3
+LMR_MIN_DEPTH = 3
+# margins by depth left (1, 2, ...) for futility pruning and razoring, in evaluate_board units (a pawn is 10)
+FUTILITY_MARGINS = [30, 60]
+RAZOR_MARGINS = [40, 80]
+# Scores beyond MATE_BOUND are mates; they are stored in the transposition table relative to the node instead of the
+# root, so that they stay right when the position is reached again at another ply
+MATE_BOUND = MATE_SCORE - 1000
 
 
 class chess_ai:
     '''
-    call minimax with alpha beta pruning
+    call negamax with alpha beta pruning
     evaluate board
     get the value of each piece
     '''
-    def minimax_white(self, game_state, depth, alpha, beta, maximizing_player, player_color):
-        csc_lookup = {
-            (True, 0): 5000000,
-            (True, 1): -5000000,
-            (True, 2): 100,
-            (False, 1): 5000000,
-            (False, 0): -5000000,
-            (False, 2): 100
-        }
-        csc = game_state.checkmate_stalemate_checker()
-        if (maximizing_player, csc) in csc_lookup:
-            return csc_lookup[(maximizing_player, csc)]
-
-        if depth <= 0 or csc != 3:
-            return self.evaluate_board(game_state, Player.PLAYER_1)
-
-        if maximizing_player:
-            max_evaluation = -10000000
-            all_possible_moves = game_state.get_all_legal_moves("black")
-            for move_pair in all_possible_moves:
-                game_state.move_piece(move_pair[0], move_pair[1], True)
-                evaluation = self.minimax_white(game_state, depth - 1, alpha, beta, False, "white")
-                game_state.undo_move()
-
-                if max_evaluation < evaluation:
-                    max_evaluation = evaluation
-                    best_possible_move = move_pair
-                alpha = max(alpha, evaluation)
-                if beta <= alpha:
+    def __init__(self, tt_size_mb=DEFAULT_SIZE_MB, null_move_pruning=True, late_move_reductions=True,
+                 futility_pruning=True, razoring=True, eval_cache_size_mb=DEFAULT_EVAL_CACHE_MB,
+                 pawn_hash_size_mb=DEFAULT_PAWN_HASH_MB):
+        self.null_move_pruning = null_move_pruning
+        self.late_move_reductions = late_move_reductions
+        self.futility_pruning = futility_pruning
+        self.razoring = razoring
+        # kept from move to move, so a search starts with what the previous ones learned
+        self.transposition_table = transposition_table(tt_size_mb)
+        self.move_orderer = move_orderer()
+        self.evaluation_cache = evaluation_cache(eval_cache_size_mb)
+        self.pawn_hash = pawn_hash_table(pawn_hash_size_mb)
+        # search statistics and limits, reset by every search
+        self.nodes = 0
+        self.stopped = False
+        self.deadline = None
+        self.node_limit = None
+        self.completed_depth = 0
+        # principal variation of the last completed iteration, searched first in the next one
+        self.previous_pv = []
+        # worker processes of parallel_search, started on first use: (workers, executor, shared alpha)
+        self._pool = None
+        # worker processes of lazy_smp_search, started on first use: (workers, executor, shared table, stop flag)
+        self._smp_pool = None
+        # set by lazy_smp_search to stop its helper workers' searches
+        self.stop_flag = None
+
+    def search(self, game_state, depth):
+        '''
+        search the side to move's moves to the given depth
+        returns (best move, score, principal variation), with packed moves (see move_encoding.py) and the score
+        from the side to move's point of view; the best move is None when there are no legal moves
+        '''
+        self.nodes = 0
+        self.stopped = False
+        self.deadline = None
+        self.node_limit = None
+        self.previous_pv = []
+        self.transposition_table.new_search()
+        self.move_orderer.new_search()
+        pv = []
+        score = self.negamax(game_state, depth, -INFINITY, INFINITY, 0, pv)
+        self.completed_depth = depth
+        best_move = pv[0] if pv else None
+        return best_move, score, pv
+
+    def iterative_deepening(self, game_state, movetime=None, nodes=None, max_depth=MAX_DEPTH):
+        '''
+        search depth 1, 2, 3, ... until movetime (milliseconds) runs out, nodes positions have been searched or
+        max_depth is done; each iteration searches the previous principal variation first
+        returns (best move, score, principal variation) of the last completed iteration, like search
+        depth 1 always completes, so there is a move to play even with a tiny budget
+        '''
+        start = time.monotonic()
+        self.nodes = 0
+        self.stopped = False
+        self.deadline = None
+        self.node_limit = None
+        self.previous_pv = []
+        self.completed_depth = 0
+        self.transposition_table.new_search()
+        self.move_orderer.new_search()
+        best_move, best_score, best_pv = None, 0, []
+        for depth in range(1, max_depth + 1):
+            score, pv = self.aspiration_search(game_state, depth, best_score)
+            if self.stopped:
+                break
+            best_move, best_score, best_pv = (pv[0] if pv else None), score, pv
+            self.completed_depth = depth
+            self.previous_pv = pv
+            # no legal moves, or a forced mate that deeper iterations cannot improve
+            if best_move is None or abs(score) >= MATE_SCORE - depth:
+                break
+            if movetime is not None:
+                self.deadline = start + movetime / 1000.0
+                if time.monotonic() >= self.deadline:
                     break
-            if depth == 3:
-                return best_possible_move
-            else:
-                return max_evaluation
-        else:
-            min_evaluation = 10000000
-            all_possible_moves = game_state.get_all_legal_moves("white")
-            for move_pair in all_possible_moves:
-                game_state.move_piece(move_pair[0], move_pair[1], True)
-                evaluation = self.minimax_white(game_state, depth - 1, alpha, beta, True, "black")
-                game_state.undo_move()
-
-                if min_evaluation > evaluation:
-                    min_evaluation = evaluation
-                    best_possible_move = move_pair
-                beta = min(beta, evaluation)
-                if beta <= alpha:
+            if nodes is not None:
+                self.node_limit = nodes
+                if self.nodes >= nodes:
                     break
-            if depth == 3:
-                return best_possible_move
+        return best_move, best_score, best_pv
+
+    def parallel_search(self, game_state, depth, workers=1):
+        '''
+        fixed depth search like search, with the root moves shared out among worker processes
+        the first root move is searched alone to set alpha, then every other one is a task of its own, searched
+        with the best score found so far by any worker as alpha; workers send each other that score through a
+        shared multiprocessing.Value, and only get compact snapshots of the position (see game_state.snapshot)
+        with workers=1 the moves are searched in this process, one after the other, so the result is deterministic
+        self.nodes adds up the nodes of all workers; call close() to stop the worker processes
+        '''
+        self.nodes = 0
+        self.stopped = False
+        self.deadline = None
+        self.node_limit = None
+        self.previous_pv = []
+        self.transposition_table.new_search()
+        self.move_orderer.new_search()
+        player = Player.PLAYER_1 if game_state.whose_turn() else Player.PLAYER_2
+        moves = game_state.get_legal_move_list(player)
+        if not moves:
+            return None, self.terminal_score(game_state, player, 0), []
+        entry = self.transposition_table.probe(game_state.zobrist_key)
+        moves = self.move_orderer.order_moves(game_state, moves, 0, entry[3] if entry is not None else None)
+
+        if workers == 1:
+            shared_alpha = multiprocessing.Value('q', -INFINITY)
+            results = []
+            for move in moves:
+                results.append(self.search_root_move(game_state, move, depth, shared_alpha))
+                self.nodes += results[-1][4]
+        else:
+            executor, shared_alpha = self._process_pool(workers)
+            shared_alpha.value = -INFINITY
+            snapshot = game_state.snapshot()
+            results = [executor.submit(_search_root_move_in_worker, snapshot, moves[0], depth).result()]
+            futures = [executor.submit(_search_root_move_in_worker, snapshot, move, depth) for move in moves[1:]]
+            results.extend(future.result() for future in futures)
+            self.nodes = sum(result[4] for result in results)
+
+        # a score at or below the alpha its move was searched with is only a bound, and the first move always has
+        # an exact one; ties go to the move ordered first
+        best_move, best_score, best_pv = None, -INFINITY, []
+        for move, score, pv, alpha, _ in results:
+            if score > alpha and score > best_score:
+                best_move, best_score, best_pv = move, score, pv
+        self.completed_depth = depth
+        return best_move, best_score, best_pv
+
+    def search_root_move(self, game_state, move, depth, shared_alpha):
+        '''
+        one task of parallel_search: search the root move to depth with shared_alpha.value as alpha, and raise
+        shared_alpha when it does better
+        returns (move, score, principal variation, the alpha it was searched with, nodes)
+        '''
+        nodes = self.nodes
+        self.nodes = 0
+        alpha = shared_alpha.value
+        child_pv = []
+        game_state.make_move(move)
+        score = -self.negamax(game_state, depth - 1, -INFINITY, -alpha, 1, child_pv)
+        game_state.unmake_move()
+        if score > alpha:
+            with shared_alpha.get_lock():
+                if score > shared_alpha.value:
+                    shared_alpha.value = score
+        searched_nodes, self.nodes = self.nodes, nodes
+        return move, score, [move] + child_pv, alpha, searched_nodes
+
+    def _process_pool(self, workers):
+        # (executor, shared alpha) with the given number of workers, started with this chess_ai's settings
+        if self._pool is not None and self._pool[0] != workers:
+            self._close_process_pool()
+        if self._pool is None:
+            shared_alpha = multiprocessing.Value('q', -INFINITY)
+            executor = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                           initargs=(shared_alpha, self._worker_options()))
+            self._pool = (workers, executor, shared_alpha)
+        return self._pool[1], self._pool[2]
+
+    def lazy_smp_search(self, game_state, depth, workers=2):
+        '''
+        lazy SMP: workers processes all run iterative_deepening on the same position and share one transposition
+        table in shared memory, so each finds the others' results there and they spread out over the tree on
+        their own; every odd worker goes one ply deeper than depth to stagger them
+        returns (best move, score, principal variation) of worker 0, which searches to depth, once it is done; the
+        others are stopped then, and self.nodes adds up the nodes of all workers
+        call close() to stop the worker processes and free the table
+        '''
+        executor, table, stop_flag = self._lazy_smp_pool(workers)
+        stop_flag.value = 0
+        snapshot = game_state.snapshot()
+        futures = [executor.submit(_lazy_smp_worker, snapshot, depth + (index & 1)) for index in range(workers)]
+        best_move, score, pv, nodes = futures[0].result()
+        stop_flag.value = 1
+        self.nodes = nodes + sum(future.result()[3] for future in futures[1:])
+        self.completed_depth = depth
+        return best_move, score, pv
+
+    def _lazy_smp_pool(self, workers):
+        # (executor, shared table, stop flag) with the given number of workers, started with this chess_ai's settings
+        if self._smp_pool is not None and self._smp_pool[0] != workers:
+            self._close_lazy_smp_pool()
+        if self._smp_pool is None:
+            table = transposition_table(self.transposition_table.size_in_bytes() / (1024 * 1024), shared=True)
+            stop_flag = multiprocessing.Value('b', 0, lock=False)
+            executor = ProcessPoolExecutor(workers, initializer=_init_lazy_smp_worker,
+                                           initargs=(table.shared_memory.name, table.size_in_bytes(), stop_flag,
+                                                     self._worker_options()))
+            self._smp_pool = (workers, executor, table, stop_flag)
+        return self._smp_pool[1:]
+
+    # Keyword arguments that give a worker's chess_ai this one's settings
+    def _worker_options(self):
+        return {'tt_size_mb': self.transposition_table.size_in_bytes() / (1024 * 1024),
+                'null_move_pruning': self.null_move_pruning, 'late_move_reductions': self.late_move_reductions,
+                'futility_pruning': self.futility_pruning, 'razoring': self.razoring,
+                'eval_cache_size_mb': self.evaluation_cache.size_in_bytes() / (1024 * 1024),
+                'pawn_hash_size_mb': self.pawn_hash.size_in_bytes() / (1024 * 1024)}
+
+    # Stop the worker processes of parallel_search and lazy_smp_search, if any were started
+    def close(self):
+        self._close_process_pool()
+        self._close_lazy_smp_pool()
+
+    def _close_process_pool(self):
+        if self._pool is not None:
+            self._pool[1].shutdown()
+            self._pool = None
+
+    def _close_lazy_smp_pool(self):
+        if self._smp_pool is not None:
+            self._smp_pool[1].shutdown()
+            self._smp_pool[2].close()
+            self._smp_pool = None
+
+    def aspiration_search(self, game_state, depth, previous_score):
+        '''
+        one iteration of iterative_deepening: search the root with a narrow window around previous_score, which
+        costs fewer nodes than the full window when the score barely moves, and widen it until the score fits
+        returns (score, principal variation)
+        '''
+        delta = ASPIRATION_WINDOW
+        if depth >= ASPIRATION_DEPTH and abs(previous_score) < MATE_BOUND:
+            alpha, beta = previous_score - delta, previous_score + delta
+        else:
+            alpha, beta = -INFINITY, INFINITY
+        while True:
+            pv = []
+            score = self.negamax(game_state, depth, alpha, beta, 0, pv, True)
+            if self.stopped or alpha < score < beta:
+                return score, pv
+            delta *= 2
+            # a mate score is only exact with the window open all the way on its side
+            if score <= alpha:
+                alpha = score - delta if score > -MATE_BOUND else -INFINITY
             else:
-                return min_evaluation
-
-    def minimax_black(self, game_state, depth, alpha, beta, maximizing_player, player_color):
-        csc_lookup = {
-            (True, 0): 5000000,
-            (True, 1): -5000000,
-            (True, 2): 100,
-            (False, 1): 5000000,
-            (False, 0): -5000000,
-            (False, 2): 100
-        }
-        csc = game_state.checkmate_stalemate_checker()
-        if (maximizing_player, csc) in csc_lookup:
-            return csc_lookup[(maximizing_player, csc)]
-
-        if depth <= 0 or csc != 3:
-            return self.evaluate_board(game_state, Player.PLAYER_2)
-
-        if maximizing_player:
-            max_evaluation = -10000000
-            all_possible_moves = game_state.get_all_legal_moves("white")
-            for move_pair in all_possible_moves:
-                game_state.move_piece(move_pair[0], move_pair[1], True)
-                evaluation = self.minimax_black(game_state, depth - 1, alpha, beta, False, "black")
-                game_state.undo_move()
-
-                if max_evaluation < evaluation:
-                    max_evaluation = evaluation
-                    best_possible_move = move_pair
-                alpha = max(alpha, evaluation)
-                if beta <= alpha:
-                    break
-            if depth == 3:
-                return best_possible_move
+                beta = score + delta if score < MATE_BOUND else INFINITY
+
+    def negamax(self, game_state, depth, alpha, beta, ply, pv, on_pv=False, allow_null_move=True):
+        '''
+        alpha beta search of the position, scored for the side to move
+        pv is filled with the best line found when the score lands inside (alpha, beta)
+        on_pv is true while following the previous iteration's principal variation, whose move is searched first;
+        otherwise the transposition table's best move is searched first, and its score ends the search of the node
+        when it was searched deep enough (never at the root, which must return a move); the other moves follow in
+        move_orderer's order, searched with a null window (principal variation search)
+        away from the principal variation (beta - alpha == 1) the selective techniques switched on in __init__ may
+        cut the node short or skip and reduce moves; allow_null_move is false right after a null move
+        once a time or node limit is hit, self.stopped is set and every node returns at once with a meaningless 0
+        at the horizon the position is handed to quiescence
+        '''
+        if depth <= 0:
+            return self.quiescence(game_state, alpha, beta, ply)
+        if self.count_node():
+            return 0
+
+        player = Player.PLAYER_1 if game_state.whose_turn() else Player.PLAYER_2
+        opponent = Player.PLAYER_2 if player == Player.PLAYER_1 else Player.PLAYER_1
+
+        key = game_state.zobrist_key
+        tt_move = None
+        entry = self.transposition_table.probe(key)
+        if entry is not None:
+            tt_depth, tt_score, tt_bound, tt_move = entry
+            if tt_depth >= depth and ply > 0:
+                tt_score = score_from_table(tt_score, ply)
+                if tt_bound == EXACT or (tt_bound == LOWER_BOUND and tt_score >= beta) or \
+                        (tt_bound == UPPER_BOUND and tt_score <= alpha):
+                    if tt_bound == EXACT or tt_score > alpha:
+                        pv[:] = [tt_move] if tt_move else []
+                    return tt_score
+
+        in_check = game_state.in_check(player)
+        selective = ply > 0 and beta - alpha == 1 and not in_check and abs(beta) < MATE_BOUND
+        static_score = self.evaluate(game_state, player) if selective else None
+
+        # razoring: far below alpha close to the horizon, only a capture can still help
+        if selective and self.razoring and depth <= len(RAZOR_MARGINS) and \
+                static_score + RAZOR_MARGINS[depth - 1] <= alpha:
+            score = self.quiescence(game_state, alpha, beta, ply)
+            if score <= alpha or self.stopped:
+                return score
+
+        # null move pruning: if passing the turn still fails high, a real move will too, so a shallower search
+        # of the null move is enough to cut off; not with only pawns left, where passing may really be best
+        if selective and self.null_move_pruning and allow_null_move and depth >= NULL_MOVE_MIN_DEPTH and \
+                static_score >= beta and game_state.has_non_pawn_material(player):
+            game_state.make_null_move()
+            score = -self.negamax(game_state, depth - 1 - NULL_MOVE_REDUCTION, -beta, -beta + 1, ply + 1, [],
+                                  allow_null_move=False)
+            game_state.unmake_null_move()
+            if self.stopped:
+                return 0
+            if score >= beta:
+                return beta if score >= MATE_BOUND else score
+
+        all_possible_moves = game_state.get_legal_move_list(player)
+        if not all_possible_moves:
+            return self.terminal_score(game_state, player, ply)
+        pv_move = None
+        if on_pv and ply < len(self.previous_pv) and self.previous_pv[ply] in all_possible_moves:
+            pv_move = self.previous_pv[ply]
+        all_possible_moves = self.move_orderer.order_moves(game_state, all_possible_moves, ply, pv_move or tt_move)
+
+        # futility pruning: quiet moves cannot lift a score this far below alpha in the last plies
+        futile = selective and self.futility_pruning and depth <= len(FUTILITY_MARGINS) and \
+            static_score + FUTILITY_MARGINS[depth - 1] <= alpha
+        alpha_original = alpha
+        best_score = -INFINITY
+        best_move = 0
+        for index, move in enumerate(all_possible_moves):
+            # the first move is never pruned or reduced, nor are captures, promotions and checks
+            quiet = index > 0 and not in_check and not self.move_orderer.is_tactical(game_state, move)
+            reduction = 0
+            if quiet and self.late_move_reductions and index >= LMR_MOVE_INDEX and depth >= LMR_MIN_DEPTH:
+                reduction = 2 if index >= 2 * LMR_MOVE_INDEX and depth >= 2 * LMR_MIN_DEPTH else 1
+            child_pv = []
+            game_state.make_move(move)
+            if (futile or reduction) and quiet and game_state.in_check(opponent):
+                quiet, reduction = False, 0
+            if futile and quiet:
+                game_state.unmake_move()
+                best_score = max(best_score, static_score + FUTILITY_MARGINS[depth - 1])
+                continue
+            if index == 0:
+                score = -self.negamax(game_state, depth - 1, -beta, -alpha, ply + 1, child_pv, move == pv_move)
             else:
-                return max_evaluation
+                # principal variation search: prove the move is no better than alpha with a null window, and
+                # only search it again with the full window when that fails
+                # late move reductions: a quiet move ordered late is searched shallower first, and again at full
+                # depth if it beats alpha after all
+                score = -self.negamax(game_state, depth - 1 - reduction, -alpha - 1, -alpha, ply + 1, child_pv)
+                if reduction and score > alpha:
+                    score = -self.negamax(game_state, depth - 1, -alpha - 1, -alpha, ply + 1, child_pv)
+                if alpha < score < beta:
+                    child_pv = []
+                    score = -self.negamax(game_state, depth - 1, -beta, -alpha, ply + 1, child_pv)
+            game_state.unmake_move()
+            if self.stopped:
+                return 0
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    pv[:] = [move] + child_pv
+                    if alpha >= beta:
+                        self.move_orderer.record_cutoff(game_state, move, depth, ply)
+                        break
+
+        if best_score >= beta:
+            bound = LOWER_BOUND
+        elif best_score > alpha_original:
+            bound = EXACT
         else:
-            min_evaluation = 10000000
-            all_possible_moves = game_state.get_all_legal_moves("black")
-            for move_pair in all_possible_moves:
-                game_state.move_piece(move_pair[0], move_pair[1], True)
-                evaluation = self.minimax_black(game_state, depth - 1, alpha, beta, True, "white")
-                game_state.undo_move()
-
-                if min_evaluation > evaluation:
-                    min_evaluation = evaluation
-                    best_possible_move = move_pair
-                beta = min(beta, evaluation)
-                if beta <= alpha:
-                    break
-            if depth == 3:
-                return best_possible_move
-            else:
-                return min_evaluation
+            bound = UPPER_BOUND
+        self.transposition_table.store(key, depth, score_to_table(best_score, ply), bound, best_move)
+        return best_score
+
+    def quiescence(self, game_state, alpha, beta, ply):
+        '''
+        search only captures and promotions until the position is quiet, so the horizon never falls in the middle of
+        an exchange; the side to move may also stand pat on the static evaluation instead of capturing, and captures
+        that lose material by static exchange evaluation are skipped
+        in check every evasion is searched and there is no standing pat
+        '''
+        if self.count_node():
+            return 0
+
+        player = Player.PLAYER_1 if game_state.whose_turn() else Player.PLAYER_2
+        in_check = game_state.in_check(player)
+        if in_check:
+            moves = game_state.get_legal_move_list(player)
+            if not moves:
+                return self.terminal_score(game_state, player, ply)
+            best_score = -INFINITY
+        else:
+            moves = game_state.get_capture_move_list(player)
+            if not moves and not game_state.has_legal_move(player):
+                return DRAW_SCORE
+            best_score = self.evaluate(game_state, player)
+            if best_score >= beta:
+                return best_score
+            if best_score > alpha:
+                alpha = best_score
+
+        piece_code_at = game_state.piece_code_at
+        for move in self.move_orderer.order_moves(game_state, moves, ply):
+            if not in_check:
+                # delta pruning: even winning the captured piece for free leaves the score below alpha
+                victim = piece_code_at(move >> 6 & 63)
+                gain = PIECE_VALUES[victim % 6] if victim != NO_PIECE else 0
+                if move >> 12 == PROMOTE_QUEEN:
+                    gain += PIECE_VALUES[QUEEN] - PIECE_VALUES[PAWN]
+                if best_score + gain + DELTA_MARGIN <= alpha:
+                    continue
+                # a capture that loses material once the exchange is played out is not worth searching
+                if victim != NO_PIECE and PIECE_VALUES[victim % 6] < PIECE_VALUES[piece_code_at(move & 63) % 6] and \
+                        static_exchange(game_state, move) < 0:
+                    continue
+            game_state.make_move(move)
+            score = -self.quiescence(game_state, -beta, -alpha, ply + 1)
+            game_state.unmake_move()
+            if self.stopped:
+                return 0
+
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best_score
 
+    # Count a searched position; True when the search has to stop because a time or node limit was hit, or another
+    # process set the stop flag
+    def count_node(self):
+        self.nodes += 1
+        if self.nodes & CHECK_LIMITS_MASK == 0 and \
+                ((self.deadline is not None and time.monotonic() >= self.deadline) or
+                 (self.node_limit is not None and self.nodes >= self.node_limit) or
+                 (self.stop_flag is not None and self.stop_flag.value)):
+            self.stopped = True
+        return self.stopped
 
+    # Score of a position where player has no legal moves: checkmate or stalemate
+    def terminal_score(self, game_state, player, ply):
+        if game_state.in_check(player):
+            return -MATE_SCORE + ply
+        return DRAW_SCORE
+
+    # Tapered material, piece-square and pawn structure score for player, the side to move, from the packed score
+    # game_state keeps up to date move by move; white's score is kept in the evaluation cache
+    def evaluate(self, game_state, player):
+        score = self.evaluation_cache.probe(game_state.zobrist_key)
+        if score is None:
+            score = tapered_score(game_state.score + self.pawn_structure_score(game_state))
+            self.evaluation_cache.store(game_state.zobrist_key, score)
+        return score if player == Player.PLAYER_1 else -score
+
+    # Packed pawn structure score for white, from the pawn hash when the pawns were scored before
+    def pawn_structure_score(self, game_state):
+        entry = self.pawn_hash.probe(game_state.pawn_key)
+        if entry is None:
+            pieces = piece_bitboards(game_state)
+            entry = pawn_structure(pieces[PAWN], pieces[6 + PAWN])
+            self.pawn_hash.store(game_state.pawn_key, *entry)
+        return entry[0]
+
+    # Score for the side opposite to player, as the original full board scan returned it
     def evaluate_board(self, game_state, player):
-        evaluation_score = 0
-        for row in range(0, 8):
-            for col in range(0, 8):
-                if game_state.is_valid_piece(row, col):
-                    evaluated_piece = game_state.get_piece(row, col)
-                    evaluation_score += self.get_piece_value(evaluated_piece, player)
-        return evaluation_score
+        return -self.evaluate(game_state, player)
 
+    # Material value of the piece, positive when it belongs to the side opposite to player
     def get_piece_value(self, piece, player):
-        if player is Player.PLAYER_1:
-            if piece.is_player("black"):
-                if piece.get_name() is "k":
-                    return 1000
-                elif piece.get_name() is "q":
-                    return 100
-                elif piece.get_name() is "r":
-                    return 50
-                elif piece.get_name() is "b":
-                    return 30
-                elif piece.get_name() is "n":
-                    return 30
-                elif piece.get_name() is "p":
-                    return 10
-            else:
-                if piece.get_name() is "k":
-                    return -1000
-                elif piece.get_name() is "q":
-                    return -100
-                elif piece.get_name() is "r":
-                    return -50
-                elif piece.get_name() is "b":
-                    return -30
-                elif piece.get_name() is "n":
-                    return -30
-                elif piece.get_name() is "p":
-                    return -10
-        else:
-            if piece.is_player("white"):
-                if piece.get_name() is "k":
-                    return 1000
-                elif piece.get_name() is "q":
-                    return 100
-                elif piece.get_name() is "r":
-                    return 50
-                elif piece.get_name() is "b":
-                    return 30
-                elif piece.get_name() is "n":
-                    return 30
-                elif piece.get_name() is "p":
-                    return 10
-            else:
-                if piece.get_name() is "k":
-                    return -1000
-                elif piece.get_name() is "q":
-                    return -100
-                elif piece.get_name() is "r":
-                    return -50
-                elif piece.get_name() is "b":
-                    return -30
-                elif piece.get_name() is "n":
-                    return -30
-                elif piece.get_name() is "p":
-                    return -10
+        value = PIECE_VALUES[PIECE_NAMES.index(piece.get_name())]
+        return -value if piece.is_player(player) else value
+
+
+# Per process state of parallel_search's workers: their own chess_ai, the shared alpha and the last position rebuilt
+# from a snapshot, as (snapshot, game_state)
+_worker_ai = None
+_worker_alpha = None
+_worker_position = None
+
+
+def _init_worker(shared_alpha, options):
+    global _worker_ai, _worker_alpha
+    _worker_ai = chess_ai(**options)
+    _worker_alpha = shared_alpha
+
+
+def _init_lazy_smp_worker(shared_memory_name, table_bytes, stop_flag, options):
+    global _worker_ai
+    options['tt_size_mb'] = 0
+    _worker_ai = chess_ai(**options)
+    _worker_ai.transposition_table = transposition_table(table_bytes / (1024 * 1024),
+                                                         shared_memory_name=shared_memory_name)
+    _worker_ai.stop_flag = stop_flag
+
+
+def _worker_game_state(snapshot):
+    global _worker_position
+    if _worker_position is None or _worker_position[0] != snapshot:
+        _worker_position = (snapshot, chess_engine.game_state.from_snapshot(snapshot))
+    return _worker_position[1]
+
+
+def _search_root_move_in_worker(snapshot, move, depth):
+    return _worker_ai.search_root_move(_worker_game_state(snapshot), move, depth, _worker_alpha)
+
+
+def _lazy_smp_worker(snapshot, depth):
+    best_move, score, pv = _worker_ai.iterative_deepening(_worker_game_state(snapshot), max_depth=depth)
+    return best_move, score, pv, _worker_ai.nodes
+
+
+# Mate scores count plies from the root while searching and from the node in the transposition table
+def score_to_table(score, ply):
+    if score >= MATE_BOUND:
+        return score + ply
+    if score <= -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def score_from_table(score, ply):
+    if score >= MATE_BOUND:
+        return score - ply
+    if score <= -MATE_BOUND:
+        return score + ply
+    return score
@@ -0,0 +1,91 @@
+#
+# Precomputed attack tables
+# Built once at import time and indexed by square (row * 8 + col), so move generation never has to redo
+# offset arithmetic or bounds checks.
+#
+# Every table comes in two forms: lists of (row, col) targets for the piece classes, which walk the 2D board,
+# and bit masks for the bitboard backend.
+#
+
+def square_index(row, col):
+    return row * 8 + col
+
+
+def square_coordinates(square):
+    return divmod(square, 8)
+
+
+# Offsets in the order the piece classes have always listed their moves
+KNIGHT_OFFSETS = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+KING_OFFSETS = [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+# Sliding directions as (row change, col change); "down" is towards row 7
+LEFT, RIGHT, DOWN, UP, UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT = range(8)
+DIRECTIONS = [(0, -1), (0, 1), (1, 0), (-1, 0), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+ROOK_DIRECTIONS = [LEFT, RIGHT, DOWN, UP]
+BISHOP_DIRECTIONS = [UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT]
+
+
+def _offset_targets(offsets):
+    targets = []
+    for square in range(64):
+        row, col = square_coordinates(square)
+        targets.append([(row + row_change, col + col_change) for row_change, col_change in offsets
+                        if 0 <= row + row_change < 8 and 0 <= col + col_change < 8])
+    return targets
+
+
+def _ray_targets(row_change, col_change):
+    rays = []
+    for square in range(64):
+        row, col = square_coordinates(square)
+        ray = []
+        row, col = row + row_change, col + col_change
+        while 0 <= row < 8 and 0 <= col < 8:
+            ray.append((row, col))
+            row, col = row + row_change, col + col_change
+        rays.append(ray)
+    return rays
+
+
+def _to_mask(targets):
+    mask = 0
+    for row, col in targets:
+        mask |= 1 << square_index(row, col)
+    return mask
+
+
+# KNIGHT_TARGETS[square] is the list of (row, col) squares a knight on square can reach on an empty board
+KNIGHT_TARGETS = _offset_targets(KNIGHT_OFFSETS)
+KING_TARGETS = _offset_targets(KING_OFFSETS)
+# PAWN_CAPTURE_TARGETS[color][square], color 0 is white (moving towards row 7) and 1 is black
+PAWN_CAPTURE_TARGETS = [_offset_targets([(1, -1), (1, 1)]), _offset_targets([(-1, -1), (-1, 1)])]
+
+# RAYS[direction][square] lists the squares of that ray, nearest first
+RAYS = [_ray_targets(row_change, col_change) for row_change, col_change in DIRECTIONS]
+ROOK_RAYS = [[RAYS[direction][square] for direction in ROOK_DIRECTIONS] for square in range(64)]
+BISHOP_RAYS = [[RAYS[direction][square] for direction in BISHOP_DIRECTIONS] for square in range(64)]
+
+KNIGHT_ATTACKS = [_to_mask(targets) for targets in KNIGHT_TARGETS]
+KING_ATTACKS = [_to_mask(targets) for targets in KING_TARGETS]
+PAWN_ATTACKS = [[_to_mask(targets) for targets in color_targets] for color_targets in PAWN_CAPTURE_TARGETS]
+RAY_MASKS = [[_to_mask(ray) for ray in direction_rays] for direction_rays in RAYS]
+
+
+def _between_and_line_masks():
+    between = [[0] * 64 for _ in range(64)]
+    line = [[0] * 64 for _ in range(64)]
+    for square in range(64):
+        for direction in range(8):
+            squares_between = 0
+            for row, col in RAYS[direction][square]:
+                target = square_index(row, col)
+                between[square][target] = squares_between
+                line[square][target] = RAY_MASKS[direction][square]
+                squares_between |= 1 << target
+    return between, line
+
+
+# BETWEEN[a][b] holds the squares strictly between two aligned squares, LINE[a][b] the whole ray from a through b;
+# both are 0 when the squares do not share a rank, file or diagonal
+BETWEEN, LINE = _between_and_line_masks()
@@ -1,28 +1,30 @@
 from enums import Player
 from piece import Piece
+from attack_tables import square_index, BISHOP_RAYS
+from magics import bishop_attacks
 
 class Bishop(Piece):
     def get_valid_piece_moves(self, game_state):
+        # with the bitboard backend the whole attack set is a single magic lookup
+        bitboards = getattr(game_state, 'bitboards', None)
+        if bitboards is not None:
+            square = square_index(self.get_row_number(), self.get_col_number())
+            return self.moves_from_attacks(bitboards, bishop_attacks(square, bitboards.occupied))
+
         moves = []
-        current_row, current_col = self.get_row_number(), self.get_col_number()
+        board = game_state.board
+        player = self.get_player()
 
-        def check_new_position(row_step, col_step):
-            row, col = current_row + row_step, current_col + col_step
-            while 0 <= row < 8 and 0 <= col < 8:
-                piece = game_state.get_piece(row, col)
+        # up-left, up-right, down-left and down-right of the Bishop, nearest square first
+        for ray in BISHOP_RAYS[square_index(self.get_row_number(), self.get_col_number())]:
+            for row, col in ray:
+                piece = board[row][col]
                 if piece is Player.EMPTY:
                     moves.append((row, col))
-                elif game_state.is_valid_piece(row, col) and not piece.is_player(self.get_player()):
+                elif not piece.is_player(player):
                     moves.append((row, col))
                     break
                 else:
                     break
-                row += row_step
-                col += col_step
-
-        check_new_position(-1, -1)  
-        check_new_position(-1, 1)   
-        check_new_position(1, -1)   
-        check_new_position(1, 1)   
 
         return moves
@@ -0,0 +1,186 @@
+#
+# The Bitboard class
+# Will store the position as one 64-bit integer per piece type and color, plus occupancy masks.
+#
+# Square index is row * 8 + col, so bit 0 is (r=0, c=0) and bit 63 is (r=7, c=7), matching the (row, col)
+# coordinates used everywhere else in the engine.
+#
+from enums import Player
+from attack_tables import square_index, square_coordinates, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, BETWEEN
+from magics import rook_attacks, bishop_attacks, queen_attacks
+
+WHITE = 0
+BLACK = 1
+
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+PIECE_NAMES = ['p', 'n', 'b', 'r', 'q', 'k']
+NO_PIECE = -1
+
+COLOR_OF_PLAYER = {Player.PLAYER_1: WHITE, Player.PLAYER_2: BLACK}
+PLAYER_OF_COLOR = [Player.PLAYER_1, Player.PLAYER_2]
+
+# piece code is color * 6 + piece type, e.g. 0 is the white pawn and 11 is the black king
+PIECE_CODES = {(name, player): COLOR_OF_PLAYER[player] * 6 + kind
+               for kind, name in enumerate(PIECE_NAMES) for player in PLAYER_OF_COLOR}
+
+
+def iterate_squares(mask):
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+def attackers_to(pieces, square, color, occupied):
+    '''
+    pieces of the given color in the 12 piece bitboards that attack the square when the board has the given
+    occupancy; sliders are seen through any piece left out of occupied, so removing a piece uncovers the ones
+    behind it
+    '''
+    base = color * 6
+    attackers = (PAWN_ATTACKS[1 - color][square] & pieces[base + PAWN]) | \
+                (KNIGHT_ATTACKS[square] & pieces[base + KNIGHT]) | \
+                (KING_ATTACKS[square] & pieces[base + KING])
+    diagonal = pieces[base + BISHOP] | pieces[base + QUEEN]
+    if diagonal:
+        attackers |= bishop_attacks(square, occupied) & diagonal
+    straight = pieces[base + ROOK] | pieces[base + QUEEN]
+    if straight:
+        attackers |= rook_attacks(square, occupied) & straight
+    return attackers
+
+
+class bitboard_position:
+    def __init__(self, board=None):
+        # one bitboard per piece code, plus one occupancy mask per color and one for the whole board
+        self.pieces = [0] * 12
+        self.occupancy = [0, 0]
+        self.occupied = 0
+        # piece code on every square, so that "what is on this square" does not have to test 12 bitboards
+        self.mailbox = [NO_PIECE] * 64
+        if board is not None:
+            self.load_board(board)
+
+    def load_board(self, board):
+        self.pieces = [0] * 12
+        self.occupancy = [0, 0]
+        self.occupied = 0
+        self.mailbox = [NO_PIECE] * 64
+        for row in range(0, 8):
+            for col in range(0, 8):
+                piece = board[row][col]
+                if piece != Player.EMPTY:
+                    self.add_piece(PIECE_CODES[(piece.get_name(), piece.get_player())], square_index(row, col))
+
+    def update_squares(self, board, squares):
+        # Re-read the given (row, col) squares from a 2D board of Piece objects
+        for row, col in squares:
+            square = square_index(row, col)
+            if self.mailbox[square] != NO_PIECE:
+                self.remove_piece(square)
+            piece = board[row][col]
+            if piece != Player.EMPTY:
+                self.add_piece(PIECE_CODES[(piece.get_name(), piece.get_player())], square)
+
+    def add_piece(self, code, square):
+        bit = 1 << square
+        self.pieces[code] |= bit
+        self.occupancy[code // 6] |= bit
+        self.occupied |= bit
+        self.mailbox[square] = code
+
+    def remove_piece(self, square):
+        code = self.mailbox[square]
+        bit = 1 << square
+        self.pieces[code] ^= bit
+        self.occupancy[code // 6] ^= bit
+        self.occupied ^= bit
+        self.mailbox[square] = NO_PIECE
+        return code
+
+    def piece_at(self, square):
+        return self.mailbox[square]
+
+    def king_square(self, color):
+        king = self.pieces[color * 6 + KING]
+        return king.bit_length() - 1 if king else None
+
+    def attacks(self, code, square, occupied):
+        kind = code % 6
+        if kind == PAWN:
+            return PAWN_ATTACKS[code // 6][square]
+        elif kind == KNIGHT:
+            return KNIGHT_ATTACKS[square]
+        elif kind == BISHOP:
+            return bishop_attacks(square, occupied)
+        elif kind == ROOK:
+            return rook_attacks(square, occupied)
+        elif kind == QUEEN:
+            return queen_attacks(square, occupied)
+        else:
+            return KING_ATTACKS[square]
+
+    def attackers_to(self, square, color, occupied):
+        # All pieces of the given color that attack the square when the board has the given occupancy
+        return attackers_to(self.pieces, square, color, occupied)
+
+    def checks_and_pins(self, king_square, color):
+        '''
+        checkers: enemy pieces attacking king_square
+        pinned: own pieces that are the only piece between an enemy slider and king_square
+        pin_rays: for every pin, the squares between the king and the pinning slider plus the slider itself
+        the own king is treated as transparent, so the answer holds for a king standing on king_square
+        '''
+        pieces = self.pieces
+        enemy = 1 - color
+        base = enemy * 6
+        own_pieces = self.occupancy[color] & ~pieces[color * 6 + KING]
+        occupied = own_pieces | self.occupancy[enemy]
+
+        checkers = (PAWN_ATTACKS[color][king_square] & pieces[base + PAWN]) | \
+                   (KNIGHT_ATTACKS[king_square] & pieces[base + KNIGHT]) | \
+                   (KING_ATTACKS[king_square] & pieces[base + KING])
+        pinned = 0
+        pin_rays = 0
+
+        # sliders that would see the king if none of our own pieces were in the way
+        straight = pieces[base + ROOK] | pieces[base + QUEEN]
+        diagonal = pieces[base + BISHOP] | pieces[base + QUEEN]
+        candidates = (rook_attacks(king_square, self.occupancy[enemy]) & straight) | \
+                     (bishop_attacks(king_square, self.occupancy[enemy]) & diagonal)
+        for slider in iterate_squares(candidates):
+            blockers = BETWEEN[king_square][slider] & occupied
+            if not blockers:
+                checkers |= 1 << slider
+            elif blockers & (blockers - 1) == 0 and blockers & own_pieces:
+                pinned |= blockers
+                pin_rays |= BETWEEN[king_square][slider] | (1 << slider)
+        return checkers, pinned, pin_rays
+
+    def attacked_squares(self, color, occupied):
+        # Every square attacked by the given color when the board has the given occupancy
+        pieces = self.pieces
+        base = color * 6
+        attacked = 0
+        for kind in range(PAWN, KING + 1):
+            for square in iterate_squares(pieces[base + kind]):
+                attacked |= self.attacks(base + kind, square, occupied)
+        return attacked
+
+    def is_attacked(self, square, color):
+        return self.attackers_to(square, color, self.occupied) != 0
+
+    def pseudo_legal_targets(self, square):
+        # Target squares of the piece on the square, ignoring checks, castling and en passant
+        code = self.mailbox[square]
+        color = code // 6
+        if code % 6 == PAWN:
+            # mirrors Pawn.get_valid_piece_moves: the double step only looks at its own landing square
+            step, original_row = (8, 1) if color == WHITE else (-8, 6)
+            targets = 0
+            if 0 <= square + step < 64 and not self.occupied >> (square + step) & 1:
+                targets |= 1 << (square + step)
+            if square // 8 == original_row and not self.occupied >> (square + 2 * step) & 1:
+                targets |= 1 << (square + 2 * step)
+            return targets | (PAWN_ATTACKS[color][square] & self.occupancy[1 - color])
+        return self.attacks(code, square, self.occupied) & ~self.occupancy[color]
@@ -5,13 +5,31 @@
 # Note: move log class inspired by Eddie Sharick
 #
 
+from array import array
+
 from rook import Rook
 from knight import Knight
 from bishop import Bishop
 from pawn import Pawn
 from queen import Queen
 from king import King
-from enums import Player
+from enums import Player, Backend
+from bitboard import bitboard_position, square_index, square_coordinates, iterate_squares, WHITE, BLACK, PAWN, \
+    ROOK, KING, NO_PIECE, PIECE_NAMES, PIECE_CODES, COLOR_OF_PLAYER, PLAYER_OF_COLOR
+from move_encoding import encode_move, decode_move, NO_FLAGS, CASTLE, EN_PASSANT, PROMOTE_KNIGHT, PROMOTE_QUEEN, \
+    PROMOTION_FLAGS, PROMOTION_PIECES
+from evaluation import compute_score, piece_score, PIECE_SCORES
+from zobrist import compute_key, compute_pawn_key, PIECE_KEYS, piece_key, castling_key, en_passant_key, \
+    BLACK_TO_MOVE_KEY
+from attack_tables import RAYS, KNIGHT_TARGETS, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, BETWEEN, LINE, \
+    ROOK_DIRECTIONS, BISHOP_DIRECTIONS, UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT
+
+# Piece classes by piece type, in the order of bitboard.PIECE_NAMES
+PIECE_CLASSES = [Pawn, Knight, Bishop, Rook, Queen, King]
+# Castling flag lost by a move from or to a rook's starting square, as (color, index in *_king_can_castle)
+ROOK_CASTLING_FLAGS = {0: (WHITE, 1), 7: (WHITE, 2), 56: (BLACK, 1), 63: (BLACK, 2)}
+# Initial size of the undo stack arrays, which double whenever a game runs longer
+UNDO_STACK_SIZE = 256
 
 '''
 r \ c     0           1           2           3           4           5           6           7 
@@ -31,7 +49,11 @@ r \ c     0           1           2           3           4           5
 # TODO: change move method argument about is_ai into something more elegant
 class game_state:
     # Initialize 2D array to represent the chess board
-    def __init__(self):
+    # backend selects how move generation reads the position: Backend.LIST walks the 2D array of pieces,
+    # Backend.BITBOARD keeps a bitboard_position in sync with it and generates moves set-wise
+    # verify_zobrist_key is a debug switch that checks the incremental key against a full recomputation after
+    # every move and undo
+    def __init__(self, backend=Backend.LIST, verify_zobrist_key=False):
         # The board is a 2D array
         self.move_log = []
         self.white_turn = True
@@ -39,6 +61,9 @@ class game_state:
 
         self.can_en_passant_bool = False
         self._en_passant_previous = (-1, -1)
+        # en_passant_file before the first move on the undo stack, set by from_snapshot when the position it copies
+        # was reached by a double pawn step
+        self._initial_en_passant_file = None
 
         self.checkmate = False
         self.stalemate = False
@@ -107,6 +132,81 @@ class game_state:
              black_rook_2]
         ]
 
+        self.backend = backend
+        if backend == Backend.BITBOARD:
+            self.bitboards = bitboard_position(self.board)
+        else:
+            self.bitboards = None
+
+        # undo stack, one entry per move in preallocated arrays: the packed move, the captured piece code (the piece
+        # the rook landed on for castling), the castling and en passant rights, the en passant square, both king
+        # squares, the zobrist key, the score and the pawn key, all from before the move
+        self._ply = 0
+        self._undo_moves = array('H')
+        self._undo_captured = array('b')
+        self._undo_rights = array('B')
+        self._undo_en_passant = array('b')
+        self._undo_king_squares = array('B')
+        self._undo_keys = array('Q')
+        self._undo_scores = array('q')
+        self._undo_pawn_keys = array('Q')
+        self._grow_undo_stack()
+
+        # 64-bit position key over the pieces, side to move, castling rights and en passant file
+        self.verify_zobrist_key = verify_zobrist_key
+        self.zobrist_key = compute_key(self)
+        # packed midgame and endgame piece-square score of the position for white and its game phase (see
+        # evaluation.py), kept up to date like the key
+        self.score = compute_score(self)
+        # zobrist key over the pawns alone, which keys the pawn hash
+        self.pawn_key = compute_pawn_key(self)
+
+    # Rebuild the bitboards, the zobrist key, the score and the pawn key after self.board (or the turn or castling
+    # flags) was edited directly
+    def reload_board(self):
+        if self.bitboards is not None:
+            self.bitboards.load_board(self.board)
+        self.zobrist_key = compute_key(self)
+        self.score = compute_score(self)
+        self.pawn_key = compute_pawn_key(self)
+
+    def snapshot(self):
+        '''
+        compact, picklable copy of the position for another process: one byte per square (the piece code plus one,
+        0 for empty), the side to move, the castling and en passant rights as packed on the undo stack, the square
+        of the last double pawn step and the file en_passant_file reports for it, the _is_check latch and the
+        backend; the move history is left out, so the copy has the same zobrist key but no moves to undo
+        '''
+        en_passant_previous = square_index(*self._en_passant_previous) if self._en_passant_previous[0] >= 0 else -1
+        return (bytes(self.piece_code_at(square) + 1 for square in range(64)), self.white_turn,
+                self._irreversible_rights(), en_passant_previous, self.en_passant_file(), self._is_check,
+                self.backend)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        squares, white_turn, rights, en_passant_previous, en_passant_file, is_check, backend = snapshot
+        state = cls(backend=backend)
+        for square, code in enumerate(squares):
+            row, col = square_coordinates(square)
+            if code == 0:
+                state.board[row][col] = Player.EMPTY
+                continue
+            code -= 1
+            state.board[row][col] = PIECE_CLASSES[code % 6](PIECE_NAMES[code % 6], row, col, PLAYER_OF_COLOR[code // 6])
+            if code == WHITE * 6 + KING:
+                state._white_king_location = (row, col)
+            elif code == BLACK * 6 + KING:
+                state._black_king_location = (row, col)
+        state.white_turn = white_turn
+        state.white_king_can_castle = [rights & 1 != 0, rights & 2 != 0, rights & 4 != 0]
+        state.black_king_can_castle = [rights & 8 != 0, rights & 16 != 0, rights & 32 != 0]
+        state.can_en_passant_bool = rights & 64 != 0
+        state._en_passant_previous = square_coordinates(en_passant_previous) if en_passant_previous >= 0 else (-1, -1)
+        state._initial_en_passant_file = en_passant_file
+        state._is_check = is_check
+        state.reload_board()
+        return state
+
     def get_piece(self, row, col):
         if 0 <= row < 8 and 0 <= col < 8:
             return self.board[row][col]
@@ -114,117 +214,152 @@ class game_state:
             return None
 
     def is_valid_piece(self, row, col):
+        if self.bitboards is not None:
+            return 0 <= row < 8 and 0 <= col < 8 and self.bitboards.occupied >> square_index(row, col) & 1 == 1
         evaluated_piece = self.get_piece(row, col)
         return evaluated_piece is not None and evaluated_piece != Player.EMPTY
 
+    # Piece code (see bitboard.py) on a square index, NO_PIECE if it is empty
+    def piece_code_at(self, square):
+        if self.bitboards is not None:
+            return self.bitboards.mailbox[square]
+        piece = self.board[square >> 3][square & 7]
+        if piece == Player.EMPTY:
+            return NO_PIECE
+        return PIECE_CODES[(piece.get_name(), piece.get_player())]
+
     def get_valid_moves(self, starting_square):
         '''
-        remove pins from valid moves (unless the pinned piece move can get rid of a check and checks is empty
-        remove move from valid moves if the move falls within a check piece's valid move
-        if the moving piece is a king, the ending square cannot be in a check
+        pseudo-legal moves of the piece, filtered with masks from a single checks_and_pins call instead of trying
+        every move on the board:
+        - in check, a piece other than the king may only capture the checker or block its ray, and only if it is
+          not pinned and there is a single checker
+        - a pinned piece may only move along its pin ray
+        - the king may only move to squares the opponent does not attack
         '''
-
         current_row = starting_square[0]
         current_col = starting_square[1]
 
         if self.is_valid_piece(current_row, current_col):
-            valid_moves = []
-            moving_piece = self.get_piece(current_row, current_col)
-            if self.get_piece(current_row, current_col).is_player(Player.PLAYER_1):
-                king_location = self._white_king_location
-            else:
-                king_location = self._black_king_location
-            group = self.check_for_check(king_location, moving_piece.get_player())
-            checking_pieces = group[0]
-            pinned_pieces = group[1]
-            pinned_checks = group[2]
+            player = self.get_piece(current_row, current_col).get_player()
+            return self._get_legal_piece_moves(current_row, current_col, self._legal_move_masks(player))
+        else:
+            return None
+
+    def _legal_move_masks(self, player):
+        # (king square, checkers, pinned, pin rays) of player, or None when the player has no king to protect
+        if self.bitboards is not None:
+            king_square = self.bitboards.king_square(COLOR_OF_PLAYER[player])
+            if king_square is None:
+                return None
+            king_location = square_coordinates(king_square)
+        elif player == Player.PLAYER_1:
+            king_location = self._white_king_location
+        else:
+            king_location = self._black_king_location
+        checkers, pinned, pin_rays = self.checks_and_pins(king_location, player)
+        return square_index(king_location[0], king_location[1]), checkers, pinned, pin_rays
+
+    def _get_legal_piece_moves(self, current_row, current_col, masks):
+        moving_piece = self.board[current_row][current_col]
+        player = moving_piece.get_player()
+        square = square_index(current_row, current_col)
+        is_king = moving_piece.get_name() == 'k'
+
+        if self.bitboards is not None:
+            targets = self.bitboards.pseudo_legal_targets(square)
+            if is_king:
+                castle_row = 0 if player == Player.PLAYER_1 else 7
+                if self.king_can_castle_left(player):
+                    targets |= 1 << square_index(castle_row, 1)
+                elif self.king_can_castle_right(player):
+                    targets |= 1 << square_index(castle_row, 5)
+        else:
             initial_valid_piece_moves = moving_piece.get_valid_piece_moves(self)
 
-            # immediate check
-            if checking_pieces:
-                for move in initial_valid_piece_moves:
-                    can_move = True
-                    for piece in checking_pieces:
-                        if moving_piece.get_name() is "k":
-                            temp = self.board[current_row][current_col]
-                            self.board[current_row][current_col] = Player.EMPTY
-                            temp2 = self.board[move[0]][move[1]]
-                            self.board[move[0]][move[1]] = temp
-                            if not self.check_for_check(move, moving_piece.get_player())[0]:
-                                pass
-                            else:
-                                can_move = False
-                            self.board[current_row][current_col] = temp
-                            self.board[move[0]][move[1]] = temp2
-                        elif move == piece and len(checking_pieces) == 1 and moving_piece.get_name() is not "k" and \
-                                (current_row, current_col) not in pinned_pieces:
-                            pass
-                        elif move != piece and len(checking_pieces) == 1 and moving_piece.get_name() is not "k" and \
-                                (current_row, current_col) not in pinned_pieces:
-                            temp = self.board[move[0]][move[1]]
-                            self.board[move[0]][move[1]] = moving_piece
-                            self.board[current_row][current_col] = Player.EMPTY
-                            if self.check_for_check(king_location, moving_piece.get_player())[0]:
-                                can_move = False
-                            self.board[current_row][current_col] = moving_piece
-                            self.board[move[0]][move[1]] = temp
-                        else:
-                            can_move = False
-                    if can_move:
-                        valid_moves.append(move)
-                self._is_check = True
-            # pinned checks
-            elif pinned_pieces and moving_piece.get_name() is not "k":
-                if starting_square not in pinned_pieces:
-                    for move in initial_valid_piece_moves:
-                        valid_moves.append(move)
-                elif starting_square in pinned_pieces:
-                    for move in initial_valid_piece_moves:
-
-                        temp = self.board[move[0]][move[1]]
-                        self.board[move[0]][move[1]] = moving_piece
-                        self.board[current_row][current_col] = Player.EMPTY
-                        if not self.check_for_check(king_location, moving_piece.get_player())[0]:
-                            valid_moves.append(move)
-                        self.board[current_row][current_col] = moving_piece
-                        self.board[move[0]][move[1]] = temp
-            else:
-                if moving_piece.get_name() is "k":
-                    for move in initial_valid_piece_moves:
-                        temp = self.board[current_row][current_col]
-                        temp2 = self.board[move[0]][move[1]]
-                        self.board[current_row][current_col] = Player.EMPTY
-                        self.board[move[0]][move[1]] = temp
-                        if not self.check_for_check(move, moving_piece.get_player())[0]:
-                            valid_moves.append(move)
-                        self.board[current_row][current_col] = temp
-                        self.board[move[0]][move[1]] = temp2
-                else:
-                    for move in initial_valid_piece_moves:
-                        valid_moves.append(move)
-            # if not valid_moves:
-            #     if self._is_check:
-            #         self.checkmate = True
-            #     else:
-            #         self.stalemate = True
-            # else:
-            #     self.checkmate = False
-            #     self.stalemate = False
-            return valid_moves
+        # after generating the moves, as castling reads the _is_check latch this sets
+        allowed = self._allowed_targets(square, is_king, player, masks)
+
+        if self.bitboards is not None:
+            return [square_coordinates(target) for target in iterate_squares(targets & allowed)]
+        if allowed == -1:
+            return initial_valid_piece_moves
+        return [move for move in initial_valid_piece_moves if allowed >> square_index(move[0], move[1]) & 1]
+
+    def _allowed_targets(self, square, is_king, player, masks):
+        # mask of the squares the piece on square may end on given _legal_move_masks' masks, -1 meaning anywhere
+        if masks is None:
+            return -1
+        king_square, checkers, pinned, pin_rays = masks
+        if checkers:
+            self._is_check = True
+        if is_king:
+            opponent = Player.PLAYER_2 if player == Player.PLAYER_1 else Player.PLAYER_1
+            return ~self.attacked_squares(opponent)
+        elif checkers:
+            if pinned >> square & 1 or checkers & (checkers - 1):
+                return 0
+            return checkers | BETWEEN[king_square][checkers.bit_length() - 1]
+        elif pinned >> square & 1:
+            return pin_rays & LINE[king_square][square]
+        return -1
+
+    def attacked_squares(self, player):
+        '''
+        mask of the squares attacked by player's pieces
+        the opposing king does not block the sliders, so it cannot escape a check by stepping along the checking ray
+        '''
+        if self.bitboards is not None:
+            color = COLOR_OF_PLAYER[player]
+            bitboards = self.bitboards
+            return bitboards.attacked_squares(color, bitboards.occupied & ~bitboards.pieces[(1 - color) * 6 + KING])
+
+        board = self.board
+        attacked = 0
+        for row in range(0, 8):
+            for col in range(0, 8):
+                evaluated_piece = board[row][col]
+                if evaluated_piece != Player.EMPTY and evaluated_piece.is_player(player):
+                    attacked |= self._board_attacks(square_index(row, col), evaluated_piece.get_name(), player, True)
+        return attacked
+
+    def _board_attacks(self, square, name, player, see_through_king=False):
+        # Squares a piece attacks, read off self.board; with see_through_king the opposing king does not block sliders
+        if name == 'p':
+            return PAWN_ATTACKS[0][square] if player == Player.PLAYER_1 else PAWN_ATTACKS[1][square]
+        elif name == 'n':
+            return KNIGHT_ATTACKS[square]
+        elif name == 'k':
+            return KING_ATTACKS[square]
+        if name == 'r':
+            directions = ROOK_DIRECTIONS
+        elif name == 'b':
+            directions = BISHOP_DIRECTIONS
         else:
-            return None
+            directions = range(0, 8)
+        board = self.board
+        attacked = 0
+        for direction in directions:
+            for ray_row, ray_col in RAYS[direction][square]:
+                attacked |= 1 << square_index(ray_row, ray_col)
+                blocker = board[ray_row][ray_col]
+                if blocker != Player.EMPTY and \
+                        (not see_through_king or blocker.get_name() != 'k' or blocker.is_player(player)):
+                    break
+        return attacked
 
     # 0 if white lost, 1 if black lost, 2 if stalemate, 3 if not game over
     def checkmate_stalemate_checker(self):
-        all_white_moves = self.get_all_legal_moves(Player.PLAYER_1)
-        all_black_moves = self.get_all_legal_moves(Player.PLAYER_2)
-        if self._is_check and self.whose_turn() and not all_white_moves:
+        # both sides are probed before reading self._is_check, which the probes may set
+        white_can_move = self.has_legal_move(Player.PLAYER_1)
+        black_can_move = self.has_legal_move(Player.PLAYER_2)
+        if self._is_check and self.whose_turn() and not white_can_move:
             print("white lost")
             return 0
-        elif self._is_check and not self.whose_turn() and not all_black_moves:
+        elif self._is_check and not self.whose_turn() and not black_can_move:
             print("black lost")
             return 1
-        elif not all_white_moves and not all_black_moves:
+        elif not white_can_move and not black_can_move:
             return 2
         else:
             return 3
@@ -238,14 +373,126 @@ class game_state:
         #             if valid_moves:
         #                 _all_valid_moves[0].append((row, col))
         #                 _all_valid_moves[1].append(valid_moves)
-        _all_valid_moves = []
+        return list(self.generate_legal_moves(player))
+
+    def generate_legal_moves(self, player):
+        '''
+        yields the legal moves of player as (starting square, ending square), generating them one piece at a time
+        the board must not be changed until the generator is exhausted or dropped
+        '''
+        if player not in COLOR_OF_PLAYER:
+            return
+        # the check and pin masks are the same for every piece of the player
+        masks = self._legal_move_masks(player)
+        if self.bitboards is not None:
+            for square in iterate_squares(self.bitboards.occupancy[COLOR_OF_PLAYER[player]]):
+                starting_square = square_coordinates(square)
+                for move in self._get_legal_piece_moves(starting_square[0], starting_square[1], masks):
+                    yield starting_square, move
+            return
         for row in range(0, 8):
             for col in range(0, 8):
                 if self.is_valid_piece(row, col) and self.get_piece(row, col).is_player(player):
-                    valid_moves = self.get_valid_moves((row, col))
-                    for move in valid_moves:
-                        _all_valid_moves.append(((row, col), move))
-        return _all_valid_moves
+                    for move in self._get_legal_piece_moves(row, col, masks):
+                        yield (row, col), move
+
+    def get_legal_move_list(self, player):
+        '''
+        legal moves of player as packed moves in an array('H')
+        castling is flagged, and a promotion is listed once, as a queen promotion, like the ai plays it
+        '''
+        move_list = array('H')
+        board = self.board
+        last_row = 7 if player == Player.PLAYER_1 else 0
+        for starting_square, ending_square in self.generate_legal_moves(player):
+            name = board[starting_square[0]][starting_square[1]].get_name()
+            if name == 'p' and ending_square[0] == last_row:
+                flags = PROMOTE_QUEEN
+            elif name == 'k' and abs(ending_square[1] - starting_square[1]) == 2:
+                flags = CASTLE
+            else:
+                flags = NO_FLAGS
+            move_list.append(encode_move(starting_square, ending_square, flags))
+        return move_list
+
+    def generate_legal_captures(self, player):
+        '''
+        generator over player's legal captures and promotions as (starting square, ending square), found from attack
+        sets without generating any quiet move; castling is never included
+        '''
+        masks = self._legal_move_masks(player)
+        color = COLOR_OF_PLAYER[player]
+        promotion_row = 0xFF << 56 if color == WHITE else 0xFF
+        bitboards = self.bitboards
+        if bitboards is not None:
+            enemy = bitboards.occupancy[1 - color]
+            own_squares = [(square, bitboards.mailbox[square] % 6)
+                           for square in iterate_squares(bitboards.occupancy[color])]
+        else:
+            enemy = 0
+            own_squares = []
+            for row, pieces in enumerate(self.board):
+                for col, piece in enumerate(pieces):
+                    if piece == Player.EMPTY:
+                        continue
+                    if piece.is_player(player):
+                        own_squares.append((square_index(row, col), PIECE_NAMES.index(piece.get_name())))
+                    else:
+                        enemy |= 1 << square_index(row, col)
+        for square, kind in own_squares:
+            if bitboards is not None:
+                targets = bitboards.pseudo_legal_targets(square) & (enemy | promotion_row if kind == PAWN else enemy)
+            elif kind == PAWN:
+                targets = PAWN_ATTACKS[color][square] & enemy
+                push = square + 8 if color == WHITE else square - 8
+                if promotion_row >> push & 1 and self.board[push >> 3][push & 7] == Player.EMPTY:
+                    targets |= 1 << push
+            else:
+                targets = self._board_attacks(square, PIECE_NAMES[kind], player) & enemy
+            if targets:
+                targets &= self._allowed_targets(square, kind == KING, player, masks)
+            for target in iterate_squares(targets):
+                yield square_coordinates(square), square_coordinates(target)
+
+    def get_capture_move_list(self, player):
+        # legal captures and promotions of player as packed moves, listed like get_legal_move_list lists them
+        move_list = array('H')
+        last_row = 7 if player == Player.PLAYER_1 else 0
+        for starting_square, ending_square in self.generate_legal_captures(player):
+            is_promotion = ending_square[0] == last_row and \
+                self.board[starting_square[0]][starting_square[1]].get_name() == 'p'
+            move_list.append(encode_move(starting_square, ending_square, PROMOTE_QUEEN if is_promotion else NO_FLAGS))
+        return move_list
+
+    # Stops at the first legal move instead of generating all of them
+    def has_legal_move(self, player):
+        for _ in self.generate_legal_moves(player):
+            return True
+        return False
+
+    # Is player's king attacked right now; unlike self._is_check this does not latch once a check was seen
+    def in_check(self, player):
+        if self.bitboards is not None:
+            color = COLOR_OF_PLAYER[player]
+            king_square = self.bitboards.king_square(color)
+            return king_square is not None and self.bitboards.is_attacked(king_square, 1 - color)
+        if player == Player.PLAYER_1:
+            king_location = self._white_king_location
+        else:
+            king_location = self._black_king_location
+        return self.checks_and_pins(king_location, player)[0] != 0
+
+    # Does player have a piece besides pawns and the king; without one, passing the turn may be the best move
+    def has_non_pawn_material(self, player):
+        if self.bitboards is not None:
+            base = COLOR_OF_PLAYER[player] * 6
+            pieces = self.bitboards.pieces
+            return self.bitboards.occupancy[base // 6] & ~(pieces[base + PAWN] | pieces[base + KING]) != 0
+        for pieces in self.board:
+            for piece in pieces:
+                if piece != Player.EMPTY and piece.is_player(player) and piece.get_name() not in ('p', 'k'):
+                    return True
+        return False
 
     def king_can_castle_left(self, player):
         if player is Player.PLAYER_1:
@@ -282,10 +529,12 @@ class game_state:
             else:
                 print("Please choose from these four: r, n, b, q.\n")
 
-    def promote_pawn_ai(self, starting_square, moved_piece, ending_square):
+    def promote_pawn_ai(self, starting_square, moved_piece, ending_square, new_piece_name="q"):
         move = chess_move(starting_square, ending_square, self, self._is_check)
-        # The ai can only promote the pawn to queen
-        new_piece = Queen("q", ending_square[0], ending_square[1], moved_piece.get_player())
+        # The ai promotes the pawn to queen, unless a packed move names another piece
+        piece_classes = {"r": Rook, "n": Knight, "b": Bishop, "q": Queen}
+        new_piece = piece_classes[new_piece_name](new_piece_name, ending_square[0], ending_square[1],
+                                                  moved_piece.get_player())
         self.board[ending_square[0]][ending_square[1]] = new_piece
         self.board[moved_piece.get_row_number()][moved_piece.get_col_number()] = Player.EMPTY
         moved_piece.change_row_number(ending_square[0])
@@ -306,7 +555,14 @@ class game_state:
         return self._en_passant_previous
 
     # Move a piece
-    def move_piece(self, starting_square, ending_square, is_ai):
+    # starting_square can also be a packed move (see move_encoding.py), which is always played as an ai move
+    def move_piece(self, starting_square, ending_square=None, is_ai=False):
+        new_piece_name = "q"
+        if isinstance(starting_square, int):
+            starting_square, ending_square, flags = decode_move(starting_square)
+            new_piece_name = PROMOTION_PIECES.get(flags, "q")
+            is_ai = True
+
         current_square_row = starting_square[0]  # The integer row value of the starting square
         current_square_col = starting_square[1]  # The integer col value of the starting square
         next_square_row = ending_square[0]  # The integer row value of the ending square
@@ -326,6 +582,12 @@ class game_state:
             temp = True
 
             if ending_square in valid_moves:
+                previous_state_key = self._castling_and_en_passant_key()
+                rights = self._irreversible_rights()
+                en_passant_previous = square_index(*self._en_passant_previous) if self._en_passant_previous[0] >= 0 \
+                    else -1
+                king_squares = (square_index(*self._white_king_location), square_index(*self._black_king_location))
+                key = self.zobrist_key
                 moved_to_piece = self.get_piece(next_square_row, next_square_col)
                 if moving_piece.get_name() is "k":
                     if moving_piece.is_player(Player.PLAYER_1):
@@ -382,7 +644,7 @@ class game_state:
                             move.castling_move((7, 7), (7, 4), self)
                             self.move_log.append(move)
 
-                            self.get_piece(0, 7).change_col_number(4)
+                            self.get_piece(7, 7).change_col_number(4)
 
                             # move rook
                             self.board[7][4] = self.board[7][7]
@@ -397,14 +659,14 @@ class game_state:
                         self._black_king_location = (next_square_row, next_square_col)
                         # self.can_en_passant_bool = False  WHAT IS THIS
                 elif moving_piece.get_name() is "r":
-                    if moving_piece.is_player(Player.PLAYER_1) and current_square_col == 0:
+                    if moving_piece.is_player(Player.PLAYER_1) and (current_square_row, current_square_col) == (0, 0):
                         self.white_king_can_castle[1] = False
-                    elif moving_piece.is_player(Player.PLAYER_1) and current_square_col == 7:
-                        self.white_king_can_castle[2] = False
-                    elif moving_piece.is_player(Player.PLAYER_2) and current_square_col == 0:
-                        self.white_king_can_castle[1] = False
-                    elif moving_piece.is_player(Player.PLAYER_2) and current_square_col == 7:
+                    elif moving_piece.is_player(Player.PLAYER_1) and (current_square_row, current_square_col) == (0, 7):
                         self.white_king_can_castle[2] = False
+                    elif moving_piece.is_player(Player.PLAYER_2) and (current_square_row, current_square_col) == (7, 0):
+                        self.black_king_can_castle[1] = False
+                    elif moving_piece.is_player(Player.PLAYER_2) and (current_square_row, current_square_col) == (7, 7):
+                        self.black_king_can_castle[2] = False
                     self.move_log.append(chess_move(starting_square, ending_square, self, self._is_check))
                     self.can_en_passant_bool = False
                 # Add move class here
@@ -413,7 +675,7 @@ class game_state:
                     if moving_piece.is_player(Player.PLAYER_1) and next_square_row == 7:
                         # print("promoting white pawn")
                         if is_ai:
-                            self.promote_pawn_ai(starting_square, moving_piece, ending_square)
+                            self.promote_pawn_ai(starting_square, moving_piece, ending_square, new_piece_name)
                         else:
                             self.promote_pawn(starting_square, moving_piece, ending_square)
                         temp = False
@@ -421,7 +683,7 @@ class game_state:
                     elif moving_piece.is_player(Player.PLAYER_2) and next_square_row == 0:
                         # print("promoting black pawn")
                         if is_ai:
-                            self.promote_pawn_ai(starting_square, moving_piece, ending_square)
+                            self.promote_pawn_ai(starting_square, moving_piece, ending_square, new_piece_name)
                         else:
                             self.promote_pawn(starting_square, moving_piece, ending_square)
                         temp = False
@@ -457,6 +719,13 @@ class game_state:
                     self.move_log.append(chess_move(starting_square, ending_square, self, self._is_check))
                     self.can_en_passant_bool = False
 
+                # a rook taken on its starting square can no longer castle
+                if moved_to_piece != Player.EMPTY and moved_to_piece.get_name() == "r" and next_square_col in (0, 7):
+                    if moved_to_piece.is_player(Player.PLAYER_1) and next_square_row == 0:
+                        self.white_king_can_castle[1 if next_square_col == 0 else 2] = False
+                    elif moved_to_piece.is_player(Player.PLAYER_2) and next_square_row == 7:
+                        self.black_king_can_castle[1 if next_square_col == 0 else 2] = False
+
                 if temp:
                     moving_piece.change_row_number(next_square_row)
                     moving_piece.change_col_number(next_square_col)
@@ -464,396 +733,447 @@ class game_state:
                     self.board[current_square_row][current_square_col] = Player.EMPTY
 
                 self.white_turn = not self.white_turn
+                move, captured_code = self._undo_entry_of(self.move_log[-1])
+                self._push_undo_entry(move, captured_code, rights, en_passant_previous, king_squares, key)
+                if self.bitboards is not None:
+                    self._update_bitboards(self.move_log[-1])
+                self._update_zobrist_key(self.move_log[-1], previous_state_key)
+                self._update_score(self.move_log[-1])
+                self._update_pawn_key(self.move_log[-1])
 
             else:
                 pass
 
     def undo_move(self):
-        if self.move_log:
-            undoing_move = self.move_log.pop()
-            if undoing_move.castled is True:
-                self.board[undoing_move.starting_square_row][
-                    undoing_move.starting_square_col] = undoing_move.moving_piece
-                self.board[undoing_move.ending_square_row][undoing_move.ending_square_col] = undoing_move.removed_piece
-                self.get_piece(undoing_move.starting_square_row, undoing_move.starting_square_col).change_row_number(
-                    undoing_move.starting_square_row)
-                self.get_piece(undoing_move.starting_square_row, undoing_move.starting_square_col).change_col_number(
-                    undoing_move.starting_square_col)
-
-                self.board[undoing_move.rook_starting_square[0]][
-                    undoing_move.rook_starting_square[1]] = undoing_move.moving_rook
-                self.board[undoing_move.rook_ending_square[0]][undoing_move.rook_ending_square[1]] = Player.EMPTY
-                undoing_move.moving_rook.change_row_number(undoing_move.rook_starting_square[0])
-                undoing_move.moving_rook.change_col_number(undoing_move.rook_starting_square[1])
-                if undoing_move.moving_piece is Player.PLAYER_1:
-                    if undoing_move.rook_starting_square[1] == 0:
-                        self.white_king_can_castle[0] = True
-                        self.white_king_can_castle[1] = True
-                    elif undoing_move.rook_starting_square[1] == 7:
-                        self.white_king_can_castle[0] = True
-                        self.white_king_can_castle[2] = True
-                else:
-                    if undoing_move.rook_starting_square[1] == 0:
-                        self.black_king_can_castle[0] = True
-                        self.black_king_can_castle[1] = True
-                    elif undoing_move.rook_starting_square[1] == 7:
-                        self.black_king_can_castle[0] = True
-                        self.black_king_can_castle[2] = True
-            elif undoing_move.pawn_promoted is True:
-                self.board[undoing_move.starting_square_row][
-                    undoing_move.starting_square_col] = undoing_move.moving_piece
-                self.get_piece(undoing_move.starting_square_row, undoing_move.starting_square_col).change_row_number(
-                    undoing_move.starting_square_row)
-                self.get_piece(undoing_move.starting_square_row, undoing_move.starting_square_col).change_col_number(
-                    undoing_move.starting_square_col)
-
-                self.board[undoing_move.ending_square_row][undoing_move.ending_square_col] = undoing_move.removed_piece
-                if undoing_move.removed_piece != Player.EMPTY:
-                    self.get_piece(undoing_move.ending_square_row, undoing_move.ending_square_col).change_row_number(
-                        undoing_move.ending_square_row)
-                    self.get_piece(undoing_move.ending_square_row, undoing_move.ending_square_col).change_col_number(
-                        undoing_move.ending_square_col)
-            elif undoing_move.en_passaned is True:
-                self.board[undoing_move.starting_square_row][
-                    undoing_move.starting_square_col] = undoing_move.moving_piece
-                self.board[undoing_move.ending_square_row][undoing_move.ending_square_col] = undoing_move.removed_piece
-                self.get_piece(undoing_move.starting_square_row, undoing_move.starting_square_col).change_row_number(
-                    undoing_move.starting_square_row)
-                self.get_piece(undoing_move.starting_square_row, undoing_move.starting_square_col).change_col_number(
-                    undoing_move.starting_square_col)
-
-                self.board[undoing_move.en_passant_eaten_square[0]][
-                    undoing_move.en_passant_eaten_square[1]] = undoing_move.en_passant_eaten_piece
-                self.can_en_passant_bool = True
-            else:
-                self.board[undoing_move.starting_square_row][
-                    undoing_move.starting_square_col] = undoing_move.moving_piece
-                self.get_piece(undoing_move.starting_square_row, undoing_move.starting_square_col).change_row_number(
-                    undoing_move.starting_square_row)
-                self.get_piece(undoing_move.starting_square_row, undoing_move.starting_square_col).change_col_number(
-                    undoing_move.starting_square_col)
-
-                self.board[undoing_move.ending_square_row][undoing_move.ending_square_col] = undoing_move.removed_piece
-                if undoing_move.removed_piece != Player.EMPTY:
-                    self.get_piece(undoing_move.ending_square_row, undoing_move.ending_square_col).change_row_number(
-                        undoing_move.ending_square_row)
-                    self.get_piece(undoing_move.ending_square_row, undoing_move.ending_square_col).change_col_number(
-                        undoing_move.ending_square_col)
-
-            self.white_turn = not self.white_turn
-            # if undoing_move.in_check:
-            #     self._is_check = True
-            if undoing_move.moving_piece.get_name() is 'k' and undoing_move.moving_piece.get_player() is Player.PLAYER_1:
-                self._white_king_location = (undoing_move.starting_square_row, undoing_move.starting_square_col)
-            elif undoing_move.moving_piece.get_name() is 'k' and undoing_move.moving_piece.get_player() is Player.PLAYER_2:
-                self._black_king_location = (undoing_move.starting_square_row, undoing_move.starting_square_col)
-
-            return undoing_move
+        if self._ply:
+            return self.unmake_move()
         else:
             print("Back to the beginning!")
 
+    def make_move(self, move):
+        '''
+        trusted fast path for the search: play a packed move taken from get_legal_move_list, without checking whose
+        turn it is or whether the move is legal and without building a chess_move; take it back with unmake_move
+        move_piece stays the checked entry point for moves coming from the GUI
+        '''
+        board = self.board
+        starting_square = move & 63
+        ending_square = move >> 6 & 63
+        flags = move >> 12
+        current_square_row, current_square_col = square_coordinates(starting_square)
+        next_square_row, next_square_col = square_coordinates(ending_square)
+        moving_piece = board[current_square_row][current_square_col]
+        player = moving_piece.get_player()
+        color = COLOR_OF_PLAYER[player]
+        code = PIECE_CODES[(moving_piece.get_name(), player)]
+        kind = code - color * 6
+
+        if flags == CASTLE:
+            rook_starting_col, rook_ending_col = (0, 2) if next_square_col == 1 else (7, 4)
+            captured_row, captured_col = next_square_row, rook_ending_col
+        elif flags == EN_PASSANT:
+            captured_row, captured_col = current_square_row, next_square_col
+        else:
+            captured_row, captured_col = next_square_row, next_square_col
+        captured_square = square_index(captured_row, captured_col)
+        captured_piece = board[captured_row][captured_col]
+        if captured_piece == Player.EMPTY:
+            captured_code = NO_PIECE
+        else:
+            captured_code = PIECE_CODES[(captured_piece.get_name(), captured_piece.get_player())]
+
+        previous_en_passant_file = self.en_passant_file()
+        en_passant_previous = self._en_passant_previous
+        self._push_undo_entry(move, captured_code, self._irreversible_rights(),
+                              square_index(*en_passant_previous) if en_passant_previous[0] >= 0 else -1,
+                              (square_index(*self._white_king_location), square_index(*self._black_king_location)),
+                              self.zobrist_key)
+        key = self.zobrist_key ^ BLACK_TO_MOVE_KEY ^ PIECE_KEYS[code][starting_square]
+        score = self.score - PIECE_SCORES[code][starting_square]
+        pawn_key = self.pawn_key
+        if kind == PAWN:
+            pawn_key ^= PIECE_KEYS[code][starting_square]
+            if flags < PROMOTE_KNIGHT:
+                pawn_key ^= PIECE_KEYS[code][ending_square]
+        bitboards = self.bitboards
+
+        if captured_code != NO_PIECE:
+            key ^= PIECE_KEYS[captured_code][captured_square]
+            score -= PIECE_SCORES[captured_code][captured_square]
+            if captured_code % 6 == PAWN:
+                pawn_key ^= PIECE_KEYS[captured_code][captured_square]
+            board[captured_row][captured_col] = Player.EMPTY
+            if bitboards is not None:
+                bitboards.remove_piece(captured_square)
+        if bitboards is not None:
+            bitboards.remove_piece(starting_square)
+        if flags >= PROMOTE_KNIGHT:
+            new_piece_name = PROMOTION_PIECES[flags]
+            code = color * 6 + PIECE_NAMES.index(new_piece_name)
+            moving_piece = PIECE_CLASSES[code - color * 6](new_piece_name, next_square_row, next_square_col, player)
+        else:
+            moving_piece.change_position((next_square_row, next_square_col))
+        board[current_square_row][current_square_col] = Player.EMPTY
+        board[next_square_row][next_square_col] = moving_piece
+        key ^= PIECE_KEYS[code][ending_square]
+        score += PIECE_SCORES[code][ending_square]
+        if bitboards is not None:
+            bitboards.add_piece(code, ending_square)
+
+        if flags == CASTLE:
+            rook = board[next_square_row][rook_starting_col]
+            rook.change_position((next_square_row, rook_ending_col))
+            board[next_square_row][rook_ending_col] = rook
+            board[next_square_row][rook_starting_col] = Player.EMPTY
+            rook_code = color * 6 + ROOK
+            rook_starting_square = square_index(next_square_row, rook_starting_col)
+            rook_ending_square = square_index(next_square_row, rook_ending_col)
+            key ^= PIECE_KEYS[rook_code][rook_starting_square] ^ PIECE_KEYS[rook_code][rook_ending_square]
+            score += PIECE_SCORES[rook_code][rook_ending_square] - PIECE_SCORES[rook_code][rook_starting_square]
+            if bitboards is not None:
+                bitboards.remove_piece(rook_starting_square)
+                bitboards.add_piece(rook_code, rook_ending_square)
+
+        # the same castling rights move_piece clears: the king's when it moves, a rook's when it leaves or is taken
+        # on its starting square
+        if kind == KING or starting_square in ROOK_CASTLING_FLAGS or ending_square in ROOK_CASTLING_FLAGS:
+            key ^= castling_key(self.white_king_can_castle, self.black_king_can_castle)
+            if kind == KING:
+                king_can_castle = self.white_king_can_castle if color == WHITE else self.black_king_can_castle
+                king_can_castle[0] = False
+                if flags == CASTLE:
+                    king_can_castle[1 if next_square_col == 1 else 2] = False
+            for square in (starting_square, ending_square):
+                if square in ROOK_CASTLING_FLAGS:
+                    rook_color, index = ROOK_CASTLING_FLAGS[square]
+                    if rook_color == WHITE:
+                        self.white_king_can_castle[index] = False
+                    else:
+                        self.black_king_can_castle[index] = False
+            key ^= castling_key(self.white_king_can_castle, self.black_king_can_castle)
+
+        if kind == KING:
+            if color == WHITE:
+                self._white_king_location = (next_square_row, next_square_col)
+            else:
+                self._black_king_location = (next_square_row, next_square_col)
+        elif kind == PAWN and abs(next_square_row - current_square_row) == 2:
+            self._en_passant_previous = (next_square_row, next_square_col)
+            key ^= en_passant_key(next_square_col)
+        key ^= en_passant_key(previous_en_passant_file)
+
+        self.white_turn = not self.white_turn
+        # keeps move_log the same length as the undo stack, so undo_move works after either kind of move
+        self.move_log.append(None)
+        self.zobrist_key = key
+        self.score = score
+        self.pawn_key = pawn_key
+        if self.verify_zobrist_key and key != compute_key(self):
+            raise AssertionError("zobrist key out of sync: %x incremental, %x recomputed" % (key, compute_key(self)))
+        if self.verify_zobrist_key and pawn_key != compute_pawn_key(self):
+            raise AssertionError("pawn key out of sync: %x incremental, %x recomputed" %
+                                 (pawn_key, compute_pawn_key(self)))
+
+    def make_null_move(self):
+        '''
+        pass the turn without moving, for null move pruning in the search; take it back with unmake_null_move
+        the null move goes on the undo stack as move 0, so en_passant_file sees no double step before it
+        '''
+        previous_en_passant_file = self.en_passant_file()
+        en_passant_previous = self._en_passant_previous
+        self._push_undo_entry(0, NO_PIECE, self._irreversible_rights(),
+                              square_index(*en_passant_previous) if en_passant_previous[0] >= 0 else -1,
+                              (square_index(*self._white_king_location), square_index(*self._black_king_location)),
+                              self.zobrist_key)
+        self.zobrist_key ^= BLACK_TO_MOVE_KEY ^ en_passant_key(previous_en_passant_file)
+        self.white_turn = not self.white_turn
+        self.move_log.append(None)
+        if self.verify_zobrist_key and self.zobrist_key != compute_key(self):
+            raise AssertionError("zobrist key out of sync after null move: %x incremental, %x recomputed" %
+                                 (self.zobrist_key, compute_key(self)))
+
+    def unmake_null_move(self):
+        self._ply -= 1
+        self.zobrist_key = self._undo_keys[self._ply]
+        self.white_turn = not self.white_turn
+        self.move_log.pop()
+
+    def unmake_move(self):
+        '''
+        restore the position before the last move from the undo stack: the moving piece goes back, the captured
+        piece is rebuilt from its code and the castling rights, en passant state, king squares and zobrist key are
+        copied back from the snapshot taken before the move
+        returns the chess_move that move_piece logged for it, None after make_move
+        '''
+        self._ply -= 1
+        ply = self._ply
+        move = self._undo_moves[ply]
+        starting_square = move & 63
+        ending_square = move >> 6 & 63
+        flags = move >> 12
+        captured_code = self._undo_captured[ply]
+        board = self.board
+        bitboards = self.bitboards
+        current_square_row, current_square_col = square_coordinates(starting_square)
+        next_square_row, next_square_col = square_coordinates(ending_square)
+
+        moved_piece = board[next_square_row][next_square_col]
+        if flags >= PROMOTE_KNIGHT:
+            moved_piece = Pawn('p', next_square_row, next_square_col, moved_piece.get_player())
+        moved_piece.change_position((current_square_row, current_square_col))
+        board[current_square_row][current_square_col] = moved_piece
+        board[next_square_row][next_square_col] = Player.EMPTY
+        if bitboards is not None:
+            code = bitboards.remove_piece(ending_square)
+            if flags >= PROMOTE_KNIGHT:
+                code -= code % 6
+            bitboards.add_piece(code, starting_square)
+
+        captured_row, captured_col = next_square_row, next_square_col
+        if flags == CASTLE:
+            rook_starting_col, rook_ending_col = (0, 2) if next_square_col == 1 else (7, 4)
+            rook = board[next_square_row][rook_ending_col]
+            rook.change_position((next_square_row, rook_starting_col))
+            board[next_square_row][rook_starting_col] = rook
+            board[next_square_row][rook_ending_col] = Player.EMPTY
+            captured_col = rook_ending_col
+            if bitboards is not None:
+                bitboards.add_piece(bitboards.remove_piece(square_index(next_square_row, rook_ending_col)),
+                                    square_index(next_square_row, rook_starting_col))
+        elif flags == EN_PASSANT:
+            captured_row = current_square_row
+        if captured_code != NO_PIECE:
+            board[captured_row][captured_col] = PIECE_CLASSES[captured_code % 6](
+                PIECE_NAMES[captured_code % 6], captured_row, captured_col, PLAYER_OF_COLOR[captured_code // 6])
+            if bitboards is not None:
+                bitboards.add_piece(captured_code, square_index(captured_row, captured_col))
+
+        rights = self._undo_rights[ply]
+        self.white_king_can_castle = [rights & 1 != 0, rights & 2 != 0, rights & 4 != 0]
+        self.black_king_can_castle = [rights & 8 != 0, rights & 16 != 0, rights & 32 != 0]
+        self.can_en_passant_bool = rights & 64 != 0
+        en_passant_square = self._undo_en_passant[ply]
+        self._en_passant_previous = square_coordinates(en_passant_square) if en_passant_square >= 0 else (-1, -1)
+        self._white_king_location = square_coordinates(self._undo_king_squares[2 * ply])
+        self._black_king_location = square_coordinates(self._undo_king_squares[2 * ply + 1])
+        self.zobrist_key = self._undo_keys[ply]
+        self.score = self._undo_scores[ply]
+        self.pawn_key = self._undo_pawn_keys[ply]
+        self.white_turn = not self.white_turn
+        # if undoing_move.in_check:
+        #     self._is_check = True
+
+        if self.verify_zobrist_key and self.zobrist_key != compute_key(self):
+            raise AssertionError("zobrist key out of sync after undo: %x stored, %x recomputed" %
+                                 (self.zobrist_key, compute_key(self)))
+        return self.move_log.pop()
+
+    def _push_undo_entry(self, move, captured_code, rights, en_passant_previous, king_squares, key):
+        # Store a packed move and the state from before it on the undo stack; self.score and self.pawn_key must not
+        # have been updated for the move yet
+        if self._ply == len(self._undo_moves):
+            self._grow_undo_stack()
+        ply = self._ply
+        self._undo_moves[ply] = move
+        self._undo_captured[ply] = captured_code
+        self._undo_rights[ply] = rights
+        self._undo_en_passant[ply] = en_passant_previous
+        self._undo_king_squares[2 * ply] = king_squares[0]
+        self._undo_king_squares[2 * ply + 1] = king_squares[1]
+        self._undo_keys[ply] = key
+        self._undo_scores[ply] = self.score
+        self._undo_pawn_keys[ply] = self.pawn_key
+        self._ply = ply + 1
+
+    # The packed move and captured piece code of a chess_move logged by move_piece, as kept on the undo stack
+    def _undo_entry_of(self, move):
+        if move.castled:
+            flags = CASTLE
+            captured_piece = move.removed_by_rook
+        elif move.en_passaned:
+            flags = EN_PASSANT
+            captured_piece = move.en_passant_eaten_piece
+        else:
+            flags = PROMOTION_FLAGS[move.replacement_piece.get_name()] if move.pawn_promoted else NO_FLAGS
+            captured_piece = move.removed_piece
+        if captured_piece == Player.EMPTY:
+            captured_code = NO_PIECE
+        else:
+            captured_code = PIECE_CODES[(captured_piece.get_name(), captured_piece.get_player())]
+        return encode_move((move.starting_square_row, move.starting_square_col),
+                           (move.ending_square_row, move.ending_square_col), flags), captured_code
+
+    def _grow_undo_stack(self):
+        size = len(self._undo_moves) or UNDO_STACK_SIZE
+        self._undo_moves.extend(array('H', [0]) * size)
+        self._undo_captured.extend(array('b', [NO_PIECE]) * size)
+        self._undo_rights.extend(array('B', [0]) * size)
+        self._undo_en_passant.extend(array('b', [-1]) * size)
+        self._undo_king_squares.extend(array('B', [0]) * (2 * size))
+        self._undo_keys.extend(array('Q', [0]) * size)
+        self._undo_scores.extend(array('q', [0]) * size)
+        self._undo_pawn_keys.extend(array('Q', [0]) * size)
+
+    # Castling flags in bits 0-5 (white then black) and can_en_passant_bool in bit 6, as kept on the undo stack
+    def _irreversible_rights(self):
+        rights = 0
+        for index, can_castle in enumerate(self.white_king_can_castle + self.black_king_can_castle):
+            if can_castle:
+                rights |= 1 << index
+        return rights | 64 if self.can_en_passant_bool else rights
+
+    # Re-read the squares touched by a move into the bitboards
+    def _update_bitboards(self, move):
+        squares = [(move.starting_square_row, move.starting_square_col),
+                   (move.ending_square_row, move.ending_square_col)]
+        if move.castled:
+            squares.append(move.rook_starting_square)
+            squares.append(move.rook_ending_square)
+        if move.en_passaned:
+            squares.append(move.en_passant_eaten_square)
+        self.bitboards.update_squares(self.board, squares)
+
+    def _castling_and_en_passant_key(self):
+        return castling_key(self.white_king_can_castle, self.black_king_can_castle) ^ \
+            en_passant_key(self.en_passant_file())
+
+    def _update_zobrist_key(self, move, previous_state_key):
+        '''
+        toggle the keys of everything the move changed; the castling rights and en passant file are compared with
+        their previous_state_key from before the move (undo_move restores the key from the undo stack instead)
+        '''
+        key = self.zobrist_key ^ BLACK_TO_MOVE_KEY ^ previous_state_key ^ self._castling_and_en_passant_key()
+        if move.pawn_promoted:
+            ending_piece = move.replacement_piece
+        else:
+            ending_piece = move.moving_piece
+        key ^= piece_key(move.moving_piece, move.starting_square_row, move.starting_square_col) ^ \
+            piece_key(ending_piece, move.ending_square_row, move.ending_square_col)
+        if move.removed_piece != Player.EMPTY:
+            key ^= piece_key(move.removed_piece, move.ending_square_row, move.ending_square_col)
+        if move.castled:
+            key ^= piece_key(move.moving_rook, move.rook_starting_square[0], move.rook_starting_square[1]) ^ \
+                piece_key(move.moving_rook, move.rook_ending_square[0], move.rook_ending_square[1])
+            if move.removed_by_rook != Player.EMPTY:
+                key ^= piece_key(move.removed_by_rook, move.rook_ending_square[0], move.rook_ending_square[1])
+        if move.en_passaned:
+            key ^= piece_key(move.en_passant_eaten_piece, move.en_passant_eaten_square[0],
+                             move.en_passant_eaten_square[1])
+        self.zobrist_key = key
+        if self.verify_zobrist_key and key != compute_key(self):
+            raise AssertionError("zobrist key out of sync: %x incremental, %x recomputed" % (key, compute_key(self)))
+
+    # Add the score changes of everything the move changed (undo_move restores the score from the undo stack)
+    def _update_score(self, move):
+        if move.pawn_promoted:
+            ending_piece = move.replacement_piece
+        else:
+            ending_piece = move.moving_piece
+        score = self.score - piece_score(move.moving_piece, move.starting_square_row, move.starting_square_col) + \
+            piece_score(ending_piece, move.ending_square_row, move.ending_square_col)
+        if move.removed_piece != Player.EMPTY:
+            score -= piece_score(move.removed_piece, move.ending_square_row, move.ending_square_col)
+        if move.castled:
+            score += piece_score(move.moving_rook, move.rook_ending_square[0], move.rook_ending_square[1]) - \
+                piece_score(move.moving_rook, move.rook_starting_square[0], move.rook_starting_square[1])
+            if move.removed_by_rook != Player.EMPTY:
+                score -= piece_score(move.removed_by_rook, move.rook_ending_square[0], move.rook_ending_square[1])
+        if move.en_passaned:
+            score -= piece_score(move.en_passant_eaten_piece, move.en_passant_eaten_square[0],
+                                 move.en_passant_eaten_square[1])
+        self.score = score
+
+    # Toggle the pawn keys of the pawns the move moved, took or promoted (undo_move restores the key from the undo
+    # stack)
+    def _update_pawn_key(self, move):
+        pawn_key = self.pawn_key
+        if move.moving_piece.get_name() == 'p':
+            pawn_key ^= piece_key(move.moving_piece, move.starting_square_row, move.starting_square_col)
+            if not move.pawn_promoted:
+                pawn_key ^= piece_key(move.moving_piece, move.ending_square_row, move.ending_square_col)
+        if move.removed_piece != Player.EMPTY and move.removed_piece.get_name() == 'p':
+            pawn_key ^= piece_key(move.removed_piece, move.ending_square_row, move.ending_square_col)
+        if move.castled and move.removed_by_rook != Player.EMPTY and move.removed_by_rook.get_name() == 'p':
+            pawn_key ^= piece_key(move.removed_by_rook, move.rook_ending_square[0], move.rook_ending_square[1])
+        if move.en_passaned:
+            pawn_key ^= piece_key(move.en_passant_eaten_piece, move.en_passant_eaten_square[0],
+                                  move.en_passant_eaten_square[1])
+        self.pawn_key = pawn_key
+        if self.verify_zobrist_key and pawn_key != compute_pawn_key(self):
+            raise AssertionError("pawn key out of sync: %x incremental, %x recomputed" %
+                                 (pawn_key, compute_pawn_key(self)))
+
+    # Column of the pawn that just moved forward by two, None if the last move was anything else
+    # (from_snapshot's copy has no moves on its undo stack and remembers it in _initial_en_passant_file)
+    def en_passant_file(self):
+        if self._ply:
+            move = self._undo_moves[self._ply - 1]
+            next_square_row, next_square_col = square_coordinates(move >> 6 & 63)
+            if abs(next_square_row - (move & 63) // 8) == 2 and \
+                    self.board[next_square_row][next_square_col].get_name() == 'p':
+                return next_square_col
+            return None
+        return self._initial_en_passant_file
+
     # true if white, false if black
     def whose_turn(self):
         return self.white_turn
 
-    '''
-    check for immediate check
-    - check 8 directions and 8 knight squares
-    check for pins
-    - whatever blocked from above is a pin
-    
-     - if immediate check, change check value to true
-     - list valid moves to prevent check but not remove pin
-     - if there are no valid moves to prevent check, checkmate
-    '''
-
-    def check_for_check(self, king_location, player):
-        # self._is_check = False
-        _checks = []
-        _pins = []
-        _pins_check = []
-
-        king_location_row = king_location[0]
-        king_location_col = king_location[1]
-
-        _up = 1
-        _down = 1
-        _left = 1
-        _right = 1
-
-        # Left of the king
-        _possible_pin = ()
-        while king_location_col - _left >= 0 and self.get_piece(king_location_row,
-                                                                king_location_col - _left) is not None:
-            if self.is_valid_piece(king_location_row, king_location_col - _left) and \
-                    self.get_piece(king_location_row, king_location_col - _left).is_player(player) and \
-                    self.get_piece(king_location_row, king_location_col - _left).get_name() is not "k":
-                if not _possible_pin:
-                    _possible_pin = (king_location_row, king_location_col - _left)
-                else:
-                    break
-            elif self.is_valid_piece(king_location_row, king_location_col - _left) and \
-                    not self.get_piece(king_location_row, king_location_col - _left).is_player(player):
-                if _possible_pin:
-                    temp = self.board[_possible_pin[0]][_possible_pin[1]]
-                    self.board[_possible_pin[0]][_possible_pin[1]] = Player.EMPTY
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row,
-                                                                                king_location_col - _left).get_valid_piece_moves(
-                            self):
-                        _pins.append(_possible_pin)
-                        _pins_check.append((king_location_row, king_location_col - _left))
-                    self.board[_possible_pin[0]][_possible_pin[1]] = temp
-                else:
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row,
-                                                                                king_location_col - _left).get_valid_piece_moves(
-                            self):
-                        # self._is_check = True
-                        _checks.append((king_location_row, king_location_col - _left))
-                break
-            _left += 1
-
-        # right of the king
-        _possible_pin = ()
-        while king_location_col + _right < 8 and self.get_piece(king_location_row,
-                                                                king_location_col + _right) is not None:
-            if self.is_valid_piece(king_location_row, king_location_col + _right) and \
-                    self.get_piece(king_location_row, king_location_col + _right).is_player(player) and \
-                    self.get_piece(king_location_row, king_location_col + _right).get_name() is not "k":
-                if not _possible_pin:
-                    _possible_pin = (king_location_row, king_location_col + _right)
-                else:
-                    break
-            elif self.is_valid_piece(king_location_row, king_location_col + _right) and \
-                    not self.get_piece(king_location_row, king_location_col + _right).is_player(player):
-                if _possible_pin:
-                    temp = self.board[_possible_pin[0]][_possible_pin[1]]
-                    self.board[_possible_pin[0]][_possible_pin[1]] = Player.EMPTY
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row,
-                                                                                king_location_col + _right).get_valid_piece_moves(
-                            self):
-                        _pins.append(_possible_pin)
-                        _pins_check.append((king_location_row, king_location_col + _right))
-                    self.board[_possible_pin[0]][_possible_pin[1]] = temp
-                else:
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row,
-                                                                                king_location_col + _right).get_valid_piece_moves(
-                            self):
-                        # self._is_check = True
-                        _checks.append((king_location_row, king_location_col + _right))
-                break
-            _right += 1
-
-        # below the king
-        _possible_pin = ()
-        while king_location_row + _down < 8 and self.get_piece(king_location_row + _down,
-                                                               king_location_col) is not None:
-            if self.is_valid_piece(king_location_row + _down, king_location_col) and \
-                    self.get_piece(king_location_row + _down, king_location_col).is_player(player) and \
-                    self.get_piece(king_location_row + _down, king_location_col).get_name() is not "k":
-                if not _possible_pin:
-                    _possible_pin = (king_location_row + _down, king_location_col)
-                else:
-                    break
-            elif self.is_valid_piece(king_location_row + _down, king_location_col) and \
-                    not self.get_piece(king_location_row + _down, king_location_col).is_player(player):
-                if _possible_pin:
-                    temp = self.board[_possible_pin[0]][_possible_pin[1]]
-                    self.board[_possible_pin[0]][_possible_pin[1]] = Player.EMPTY
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row + _down,
-                                                                                king_location_col).get_valid_piece_moves(
-                            self):
-                        _pins.append(_possible_pin)
-                        _pins_check.append((king_location_row + _down, king_location_col))
-                    self.board[_possible_pin[0]][_possible_pin[1]] = temp
-                else:
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row + _down,
-                                                                                king_location_col).get_valid_piece_moves(
-                        self):
-                        # self._is_check = True
-                        _checks.append((king_location_row + _down, king_location_col))
-                break
-            _down += 1
-
-        # above the king
-        _possible_pin = ()
-        while king_location_row - _up >= 0 and self.get_piece(king_location_row - _up, king_location_col) is not None:
-            if self.is_valid_piece(king_location_row - _up, king_location_col) and \
-                    self.get_piece(king_location_row - _up, king_location_col).is_player(player) and \
-                    self.get_piece(king_location_row - _up, king_location_col).get_name() is not "k":
-                if not _possible_pin:
-                    _possible_pin = (king_location_row - _up, king_location_col)
-                else:
-                    break
-            elif self.is_valid_piece(king_location_row - _up, king_location_col) and \
-                    not self.get_piece(king_location_row - _up, king_location_col).is_player(player):
-                if _possible_pin:
-                    temp = self.board[_possible_pin[0]][_possible_pin[1]]
-                    self.board[_possible_pin[0]][_possible_pin[1]] = Player.EMPTY
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row - _up,
-                                                                                king_location_col).get_valid_piece_moves(
-                            self):
-                        _pins.append(_possible_pin)
-                        _pins_check.append((king_location_row - _up, king_location_col))
-                    self.board[_possible_pin[0]][_possible_pin[1]] = temp
-                else:
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row - _up,
-                                                                                king_location_col).get_valid_piece_moves(
-                            self):
-                        # self._is_check = True
-                        _checks.append((king_location_row - _up, king_location_col))
-                break
-            _up += 1
-
-        # left up
-        _up = 1
-        _left = 1
-        _possible_pin = ()
-        while king_location_col - _left >= 0 and king_location_row - _up >= 0 and \
-                self.get_piece(king_location_row - _up, king_location_col - _left) is not None:
-            if self.is_valid_piece(king_location_row - _up, king_location_col - _left) and \
-                    self.get_piece(king_location_row - _up, king_location_col - _left).is_player(player) and \
-                    self.get_piece(king_location_row - _up, king_location_col - _left).get_name() is not "k":
-                if not _possible_pin:
-                    _possible_pin = (king_location_row - _up, king_location_col - _left)
-                else:
-                    break
-            elif self.is_valid_piece(king_location_row - _up, king_location_col - _left) and \
-                    not self.get_piece(king_location_row - _up, king_location_col - _left).is_player(player):
-                if _possible_pin:
-                    temp = self.board[_possible_pin[0]][_possible_pin[1]]
-                    self.board[_possible_pin[0]][_possible_pin[1]] = Player.EMPTY
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row - _up,
-                                                                                king_location_col - _left).get_valid_piece_moves(
-                            self):
-                        _pins.append(_possible_pin)
-                        _pins_check.append((king_location_row - _up, king_location_col - _left))
-                    self.board[_possible_pin[0]][_possible_pin[1]] = temp
-                else:
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row - _up,
-                                                                                king_location_col - _left).get_valid_piece_moves(
-                        self):
-                        # self._is_check = True
-                        _checks.append((king_location_row - _up, king_location_col - _left))
-                break
-            _left += 1
-            _up += 1
-
-        # right up
-        _up = 1
-        _right = 1
-        _possible_pin = ()
-        while king_location_col + _right < 8 and king_location_row - _up >= 0 and \
-                self.get_piece(king_location_row - _up, king_location_col + _right) is not None:
-            if self.is_valid_piece(king_location_row - _up, king_location_col + _right) and \
-                    self.get_piece(king_location_row - _up, king_location_col + _right).is_player(player) and \
-                    self.get_piece(king_location_row - _up, king_location_col + _right).get_name() is not "k":
-                if not _possible_pin:
-                    _possible_pin = (king_location_row - _up, king_location_col + _right)
-                else:
-                    break
-            elif self.is_valid_piece(king_location_row - _up, king_location_col + _right) and \
-                    not self.get_piece(king_location_row - _up, king_location_col + _right).is_player(player):
-                if _possible_pin:
-                    temp = self.board[_possible_pin[0]][_possible_pin[1]]
-                    self.board[_possible_pin[0]][_possible_pin[1]] = Player.EMPTY
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row - _up,
-                                                                                king_location_col + _right).get_valid_piece_moves(
-                            self):
-                        _pins.append(_possible_pin)
-                        _pins_check.append((king_location_row - _up, king_location_col + _right))
-                    self.board[_possible_pin[0]][_possible_pin[1]] = temp
-                else:
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row - _up,
-                                                                                king_location_col + _right).get_valid_piece_moves(
-                        self):
-                        # self._is_check = True
-                        _checks.append((king_location_row - _up, king_location_col + _right))
-                break
-            _right += 1
-            _up += 1
-
-        # left down
-        _down = 1
-        _left = 1
-        _possible_pin = ()
-        while king_location_col - _left >= 0 and king_location_row + _down < 8 and \
-                self.get_piece(king_location_row + _down, king_location_col - _left) is not None:
-            if self.is_valid_piece(king_location_row + _down, king_location_col - _left) and \
-                    self.get_piece(king_location_row + _down, king_location_col - _left).is_player(player) and \
-                    self.get_piece(king_location_row + _down, king_location_col - _left).get_name() is not "k":
-                if not _possible_pin:
-                    _possible_pin = (king_location_row + _down, king_location_col - _left)
-                else:
-                    break
-            elif self.is_valid_piece(king_location_row + _down, king_location_col - _left) and \
-                    not self.get_piece(king_location_row + _down, king_location_col - _left).is_player(player):
-                if _possible_pin:
-                    temp = self.board[_possible_pin[0]][_possible_pin[1]]
-                    self.board[_possible_pin[0]][_possible_pin[1]] = Player.EMPTY
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row + _down,
-                                                                                king_location_col - _left).get_valid_piece_moves(
-                            self):
-                        _pins.append(_possible_pin)
-                        _pins_check.append((king_location_row + _down, king_location_col - _left))
-                    self.board[_possible_pin[0]][_possible_pin[1]] = temp
-                else:
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row + _down,
-                                                                                king_location_col - _left).get_valid_piece_moves(
-                        self):
-                        # self._is_check = True
-                        _checks.append((king_location_row + _down, king_location_col - _left))
-                break
-            _left += 1
-            _down += 1
-
-        # right down
-        _down = 1
-        _right = 1
-        _possible_pin = ()
-        while king_location_col + _right < 8 and king_location_row + _down < 8 and \
-                self.get_piece(king_location_row + _down, king_location_col + _right) is not None:
-            if self.is_valid_piece(king_location_row + _down, king_location_col + _right) and \
-                    self.get_piece(king_location_row + _down, king_location_col + _right).is_player(player) and \
-                    self.get_piece(king_location_row + _down, king_location_col + _right).get_name() is not "k":
-                if not _possible_pin:
-                    _possible_pin = (king_location_row + _down, king_location_col + _right)
-                else:
-                    break
-            elif self.is_valid_piece(king_location_row + _down, king_location_col + _right) and \
-                    not self.get_piece(king_location_row + _down, king_location_col + _right).is_player(player):
-                if _possible_pin:
-                    temp = self.board[_possible_pin[0]][_possible_pin[1]]
-                    self.board[_possible_pin[0]][_possible_pin[1]] = Player.EMPTY
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row + _down,
-                                                                                king_location_col + _right).get_valid_piece_moves(
-                            self):
-                        _pins.append(_possible_pin)
-                        _pins_check.append((king_location_row + _down, king_location_col + _right))
-                    self.board[_possible_pin[0]][_possible_pin[1]] = temp
-                else:
-                    if (king_location_row, king_location_col) in self.get_piece(king_location_row + _down,
-                                                                                king_location_col + _right).get_valid_piece_moves(
-                        self):
-                        # self._is_check = True
-                        _checks.append((king_location_row + _down, king_location_col + _right))
+    def checks_and_pins(self, king_location, player):
+        '''
+        single pass from the king square along the 8 rays and the knight squares, without touching the board
+        returns square masks (bit row * 8 + col):
+        - checkers: enemy pieces giving check to a king of player standing on king_location
+        - pinned: player's pieces that are the only piece between the king and an enemy slider
+        - pin_rays: for every pin, the squares from the king (exclusive) up to and including the pinning slider
+        the player's own king is transparent, so king_location may be a square the king is only considering
+        '''
+        king_square = square_index(king_location[0], king_location[1])
+        if self.bitboards is not None:
+            return self.bitboards.checks_and_pins(king_square, COLOR_OF_PLAYER[player])
+
+        board = self.board
+        checkers = 0
+        pinned = 0
+        pin_rays = 0
+        # squares from which an enemy pawn attacks the king, seen from the king
+        pawn_directions = (DOWN_LEFT, DOWN_RIGHT) if player == Player.PLAYER_1 else (UP_LEFT, UP_RIGHT)
+
+        for direction in range(0, 8):
+            slider = 'r' if direction in ROOK_DIRECTIONS else 'b'
+            ray_squares = 0
+            possible_pin = 0
+            for row, col in RAYS[direction][king_square]:
+                square_bit = 1 << square_index(row, col)
+                ray_squares |= square_bit
+                evaluated_piece = board[row][col]
+                if evaluated_piece == Player.EMPTY:
+                    continue
+                name = evaluated_piece.get_name()
+                if evaluated_piece.is_player(player):
+                    if name == 'k':
+                        continue
+                    if possible_pin:
+                        break
+                    possible_pin = square_bit
+                    continue
+                if name == 'q' or name == slider:
+                    if possible_pin:
+                        pinned |= possible_pin
+                        pin_rays |= ray_squares
+                    else:
+                        checkers |= square_bit
+                elif not possible_pin and ray_squares == square_bit and \
+                        (name == 'k' or (name == 'p' and direction in pawn_directions)):
+                    checkers |= square_bit
                 break
-            _right += 1
-            _down += 1
-
-        # knights
-        row_change = [-2, -2, -1, -1, +1, +1, +2, +2]
-        col_change = [-1, +1, -2, +2, -2, +2, +1, -1]
-        for i in range(0, 8):
-            if self.is_valid_piece(king_location_row + row_change[i], king_location_col + col_change[i]) and \
-                    not self.get_piece(king_location_row + row_change[i], king_location_col + col_change[i]).is_player(
-                        player):
-                if (king_location_row, king_location_col) in self.get_piece(king_location_row + row_change[i],
-                                                                            king_location_col + col_change[
-                                                                                i]).get_valid_piece_moves(self):
-                    # self._is_check = True
-                    _checks.append((king_location_row + row_change[i], king_location_col + col_change[i]))
-        # print([_checks, _pins, _pins_check])
-        return [_checks, _pins, _pins_check]
+
+        for row, col in KNIGHT_TARGETS[king_square]:
+            evaluated_piece = board[row][col]
+            if evaluated_piece != Player.EMPTY and evaluated_piece.get_name() == 'n' and \
+                    not evaluated_piece.is_player(player):
+                checkers |= 1 << square_index(row, col)
+        return checkers, pinned, pin_rays
 
 
 class chess_move():
@@ -874,6 +1194,8 @@ class chess_move():
         self.rook_starting_square = None
         self.rook_ending_square = None
         self.moving_rook = None
+        # castling right only checks cols 5 and 6, so the rook can land on a piece in col 4
+        self.removed_by_rook = Player.EMPTY
 
         self.pawn_promoted = False
         self.replacement_piece = None
@@ -887,6 +1209,7 @@ class chess_move():
         self.rook_starting_square = rook_starting_square
         self.rook_ending_square = rook_ending_square
         self.moving_rook = game_state.get_piece(rook_starting_square[0], rook_starting_square[1])
+        self.removed_by_rook = game_state.get_piece(rook_ending_square[0], rook_ending_square[1])
 
     def pawn_promotion_move(self, new_piece):
         self.pawn_promoted = True
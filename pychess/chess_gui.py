@@ -18,6 +18,7 @@ CENTER = 256
 DIMENSION = 8  # the dimensions of the chess board
 SQ_SIZE = HEIGHT // DIMENSION  # the size of each of the squares in the board
 MAX_FPS = 15  # FPS for animations
+AI_MOVETIME = 2000  # milliseconds the ai may think about a move
 IMAGES = {}  # images for the chess pieces
 colors = [py.Color("white"), py.Color("gray")]
 image_path = r"C:\Users\sirma\Downloads\ENGG\ECE 322 - Software Testing and Maintenance\Group Project\python-chess\pychess" + '\\'
@@ -114,8 +115,8 @@ def single_player():
 
     ai = ai_engine.chess_ai()
     game_state = chess_engine.game_state()
-    ai_move = ai.minimax_black(game_state, 3, -100000, 100000, True, Player.PLAYER_1)
-    game_state.move_piece(ai_move[0], ai_move[1], True)
+    ai_move = ai.iterative_deepening(game_state, movetime=AI_MOVETIME)[0]
+    game_state.move_piece(ai_move)
 
     while running:
         for e in py.event.get():
@@ -143,14 +144,10 @@ def single_player():
                             square_selected = ()
                             player_clicks = []
                             valid_moves = []
-                            ai_move = ai.minimax_black(game_state, 3, -100000, 100000, True, Player.PLAYER_1)
-                            game_state.move_piece(ai_move[0], ai_move[1], True)
-                            # if human_player is 'w':
-                            #     ai_move = ai.minimax_white(game_state, 3, -100000, 100000, True, Player.PLAYER_2)
-                            #     game_state.move_piece(ai_move[0], ai_move[1], True)
-                            # elif human_player is 'b':
-                            #     ai_move = ai.minimax_black(game_state, 3, -100000, 100000, True, Player.PLAYER_1)
-                            #     game_state.move_piece(ai_move[0], ai_move[1], True)
+                            # the search plays whichever side is to move
+                            ai_move = ai.iterative_deepening(game_state, movetime=AI_MOVETIME)[0]
+                            if ai_move is not None:
+                                game_state.move_piece(ai_move)
                     else:
                         valid_moves = game_state.get_valid_moves((row, col))
                         if valid_moves is None:
@@ -0,0 +1,37 @@
+#
+# The Direct Mapped Table class
+# Base of the caches that keep one entry per index of a power-of-two sized table, with the latest store always
+# replacing it (see evaluation_cache.py and pawn_hash.py). It sizes the table and counts probe hits and misses;
+# subclasses keep their entries in arrays of len(self) and count every probe with hit or miss.
+#
+
+
+class direct_mapped_table:
+    '''
+    probes are counted, so hit_rate tells how much work the table saves
+    '''
+    def __init__(self, size_mb, entry_bytes):
+        # the number of entries is the largest power of two that fits in size_mb, so a key is mapped to its entry
+        # with a mask
+        entries = 1
+        while entries * 2 * entry_bytes <= size_mb * 1024 * 1024:
+            entries *= 2
+        self.mask = entries - 1
+        self.entry_bytes = entry_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return self.mask + 1
+
+    def size_in_bytes(self):
+        return len(self) * self.entry_bytes
+
+    def reset_statistics(self):
+        self.hits = 0
+        self.misses = 0
+
+    # Fraction of probes that found their key, 0 before the first probe
+    def hit_rate(self):
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
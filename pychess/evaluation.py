@@ -0,0 +1,287 @@
+#
+# Tapered material and piece-square evaluation
+# Every (piece, square) has a midgame and an endgame score: the piece's material value plus a bonus or penalty for
+# the square it stands on, positive for white's pieces and negative for black's. The evaluation blends the two
+# totals by the game phase, which counts the knights, bishops, rooks and queens left (24 at the start, 0 with only
+# kings and pawns).
+# The midgame score, the endgame score and the phase weight of a (piece, square) are packed into one integer, 16 bits
+# apart, so a position's packed sum is still a sum over its pieces: a move only changes the numbers of the squares
+# it touches, and game_state keeps the packed score up to date move by move (see zobrist.py for the same idea applied
+# to the position key).
+# Pawn structure terms (doubled, isolated and passed pawns) depend on the pawns alone; they are scored from the pawn
+# bitboards by pawn_structure and cached by pawn key (see pawn_hash.py).
+# With NumPy the same evaluation can also be computed from 12 x 64 piece planes in a single matrix product, and for
+# a whole batch of positions at once from their 12 piece bitboards (see evaluate_batch), which is what offline
+# analysis over many positions should use.
+#
+from enums import Player
+from bitboard import PIECE_CODES, WHITE, BLACK, iterate_squares
+from attack_tables import square_index
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Material values by piece type, in the order of bitboard.PIECE_NAMES; a pawn is worth 10
+PIECE_VALUES = [10, 30, 30, 50, 100, 1000]
+ENDGAME_PIECE_VALUES = [12, 28, 32, 52, 100, 1000]
+# Game phase weight by piece type; the phase is at most MAX_PHASE
+PHASE_WEIGHTS = [0, 1, 1, 2, 4, 0]
+MAX_PHASE = 24
+
+
+def pack_score(midgame, endgame, phase=0):
+    return midgame + (endgame << 16) + (phase << 32)
+
+
+# Pawn structure terms, packed midgame and endgame scores: a penalty per extra pawn on a file and per pawn with no
+# pawn of its colour on the adjacent files, and a bonus for a passed pawn by its row counted from its own side
+DOUBLED_PAWN_PENALTY = pack_score(2, 4)
+ISOLATED_PAWN_PENALTY = pack_score(2, 3)
+PASSED_PAWN_BONUSES = [pack_score(midgame, endgame) for midgame, endgame in
+                       ((0, 0), (1, 2), (1, 3), (2, 5), (4, 8), (6, 12), (9, 18), (0, 0))]
+
+# Square bonuses by piece type from white's side, one row per board row: row 0 is white's back rank and the king
+# starts on column 3. Black's pieces read the tables upside down.
+MIDGAME_TABLES = [
+    # pawn: advance, and keep the pawns in front of the king
+    [0, 0, 0, 0, 0, 0, 0, 0,
+     1, 1, 1, -2, -2, 1, 1, 1,
+     1, 0, -1, 0, 0, -1, 0, 1,
+     0, 0, 0, 2, 2, 0, 0, 0,
+     1, 1, 1, 3, 3, 1, 1, 1,
+     1, 1, 2, 3, 3, 2, 1, 1,
+     5, 5, 5, 5, 5, 5, 5, 5,
+     0, 0, 0, 0, 0, 0, 0, 0],
+    # knight: centralise
+    [-5, -4, -3, -3, -3, -3, -4, -5,
+     -4, -2, 0, 1, 1, 0, -2, -4,
+     -3, 1, 1, 2, 2, 1, 1, -3,
+     -3, 0, 2, 2, 2, 2, 0, -3,
+     -3, 1, 2, 2, 2, 2, 1, -3,
+     -3, 0, 1, 2, 2, 1, 0, -3,
+     -4, -2, 0, 0, 0, 0, -2, -4,
+     -5, -4, -3, -3, -3, -3, -4, -5],
+    # bishop: long diagonals, away from the corners
+    [-2, -1, -1, -1, -1, -1, -1, -2,
+     -1, 1, 0, 0, 0, 0, 1, -1,
+     -1, 1, 1, 1, 1, 1, 1, -1,
+     -1, 0, 1, 1, 1, 1, 0, -1,
+     -1, 1, 1, 1, 1, 1, 1, -1,
+     -1, 0, 1, 1, 1, 1, 0, -1,
+     -1, 0, 0, 0, 0, 0, 0, -1,
+     -2, -1, -1, -1, -1, -1, -1, -2],
+    # rook: central files of the back rank, and the seventh rank
+    [0, 0, 0, 1, 1, 0, 0, 0,
+     -1, 0, 0, 0, 0, 0, 0, -1,
+     -1, 0, 0, 0, 0, 0, 0, -1,
+     -1, 0, 0, 0, 0, 0, 0, -1,
+     -1, 0, 0, 0, 0, 0, 0, -1,
+     -1, 0, 0, 0, 0, 0, 0, -1,
+     1, 1, 1, 1, 1, 1, 1, 1,
+     0, 0, 0, 0, 0, 0, 0, 0],
+    # queen
+    [-2, -1, -1, 0, 0, -1, -1, -2,
+     -1, 0, 0, 0, 0, 0, 0, -1,
+     -1, 0, 1, 1, 1, 1, 0, -1,
+     0, 0, 1, 1, 1, 1, 0, 0,
+     0, 0, 1, 1, 1, 1, 0, 0,
+     -1, 0, 1, 1, 1, 1, 0, -1,
+     -1, 0, 0, 0, 0, 0, 0, -1,
+     -2, -1, -1, 0, 0, -1, -1, -2],
+    # king: stay home, behind the pawns, castled
+    [2, 3, 1, 0, 0, 1, 3, 2,
+     2, 2, 0, 0, 0, 0, 2, 2,
+     -1, -2, -2, -2, -2, -2, -2, -1,
+     -2, -3, -3, -4, -4, -3, -3, -2,
+     -3, -4, -4, -5, -5, -4, -4, -3,
+     -3, -4, -4, -5, -5, -4, -4, -3,
+     -3, -4, -4, -5, -5, -4, -4, -3,
+     -3, -4, -4, -5, -5, -4, -4, -3],
+]
+
+ENDGAME_TABLES = [
+    # pawn: the closer to promotion the better
+    [0, 0, 0, 0, 0, 0, 0, 0,
+     0, 0, 0, 0, 0, 0, 0, 0,
+     1, 1, 1, 1, 1, 1, 1, 1,
+     2, 2, 2, 2, 2, 2, 2, 2,
+     4, 4, 4, 4, 4, 4, 4, 4,
+     7, 7, 7, 7, 7, 7, 7, 7,
+     10, 10, 10, 10, 10, 10, 10, 10,
+     0, 0, 0, 0, 0, 0, 0, 0],
+    MIDGAME_TABLES[1],
+    MIDGAME_TABLES[2],
+    # rook: the seventh rank
+    [0, 0, 0, 0, 0, 0, 0, 0,
+     0, 0, 0, 0, 0, 0, 0, 0,
+     0, 0, 0, 0, 0, 0, 0, 0,
+     0, 0, 0, 0, 0, 0, 0, 0,
+     0, 0, 0, 0, 0, 0, 0, 0,
+     0, 0, 0, 0, 0, 0, 0, 0,
+     1, 1, 1, 1, 1, 1, 1, 1,
+     0, 0, 0, 0, 0, 0, 0, 0],
+    MIDGAME_TABLES[4],
+    # king: come out to the centre
+    [-5, -4, -3, -2, -2, -3, -4, -5,
+     -3, -2, -1, 0, 0, -1, -2, -3,
+     -3, -1, 2, 3, 3, 2, -1, -3,
+     -3, -1, 3, 4, 4, 3, -1, -3,
+     -3, -1, 3, 4, 4, 3, -1, -3,
+     -3, -1, 2, 3, 3, 2, -1, -3,
+     -3, -3, 0, 0, 0, 0, -3, -3,
+     -5, -3, -3, -3, -3, -3, -3, -5],
+]
+
+# MIDGAME_SCORES[piece code][square] and ENDGAME_SCORES[piece code][square], signed for white
+MIDGAME_SCORES = [[PIECE_VALUES[code % 6] + MIDGAME_TABLES[code % 6][square] if code // 6 == WHITE else
+                   -PIECE_VALUES[code % 6] - MIDGAME_TABLES[code % 6][square ^ 56] for square in range(64)]
+                  for code in range(12)]
+ENDGAME_SCORES = [[ENDGAME_PIECE_VALUES[code % 6] + ENDGAME_TABLES[code % 6][square] if code // 6 == WHITE else
+                   -ENDGAME_PIECE_VALUES[code % 6] - ENDGAME_TABLES[code % 6][square ^ 56] for square in range(64)]
+                  for code in range(12)]
+# PIECE_SCORES[piece code][square]: midgame score + endgame score << 16 + phase weight << 32
+PIECE_SCORES = [[MIDGAME_SCORES[code][square] + (ENDGAME_SCORES[code][square] << 16) +
+                 (PHASE_WEIGHTS[code % 6] << 32) for square in range(64)] for code in range(12)]
+
+FILE_MASKS = [0x0101010101010101 << col for col in range(8)]
+ADJACENT_FILE_MASKS = [(FILE_MASKS[col - 1] if col > 0 else 0) | (FILE_MASKS[col + 1] if col < 7 else 0)
+                       for col in range(8)]
+# PASSED_PAWN_MASKS[colour][square]: the squares ahead of a pawn of that colour on its own and the adjacent files
+PASSED_PAWN_MASKS = [[(FILE_MASKS[square & 7] | ADJACENT_FILE_MASKS[square & 7]) &
+                      sum(0xFF << (8 * row) for row in (range((square >> 3) + 1, 8) if color == WHITE else
+                                                       range(square >> 3)))
+                      for square in range(64)] for color in (WHITE, BLACK)]
+
+if numpy is not None:
+    # rows: the midgame score, endgame score and phase weight of every (piece code, square), as code * 64 + square
+    EVALUATION_MATRIX = numpy.array([[score for scores in MIDGAME_SCORES for score in scores],
+                                     [score for scores in ENDGAME_SCORES for score in scores],
+                                     [PHASE_WEIGHTS[code % 6] for code in range(12) for _ in range(64)]],
+                                    dtype=numpy.int64)
+
+
+def piece_score(piece, row, col):
+    return PIECE_SCORES[PIECE_CODES[(piece.get_name(), piece.get_player())]][square_index(row, col)]
+
+
+def compute_score(game_state):
+    # Full recomputation of the packed score, used to initialise it and to check the incremental updates
+    score = 0
+    for row, pieces in enumerate(game_state.board):
+        for col, piece in enumerate(pieces):
+            if piece != Player.EMPTY:
+                score += piece_score(piece, row, col)
+    return score
+
+
+def pawn_structure(white_pawns, black_pawns):
+    '''
+    packed pawn structure score for white of the pawn bitboards, and the white and black passed pawns as bitboards
+    a pawn is passed when no enemy pawn is ahead of it on its own or the adjacent files and no pawn of its colour is
+    ahead of it on its own file
+    '''
+    score = 0
+    passed = [0, 0]
+    for color, sign, own, enemy in ((WHITE, 1, white_pawns, black_pawns), (BLACK, -1, black_pawns, white_pawns)):
+        for square in iterate_squares(own):
+            col = square & 7
+            if own & ADJACENT_FILE_MASKS[col] == 0:
+                score -= sign * ISOLATED_PAWN_PENALTY
+            ahead = PASSED_PAWN_MASKS[color][square]
+            if enemy & ahead == 0 and own & ahead & FILE_MASKS[col] == 0:
+                passed[color] |= 1 << square
+                score += sign * PASSED_PAWN_BONUSES[square >> 3 if color == WHITE else 7 - (square >> 3)]
+        for file_mask in FILE_MASKS:
+            pawns = bin(own & file_mask).count('1')
+            if pawns > 1:
+                score -= sign * (pawns - 1) * DOUBLED_PAWN_PENALTY
+    return score, passed[WHITE], passed[BLACK]
+
+
+def unpack_score(score):
+    # (midgame score, endgame score, phase) of a packed score
+    midgame = ((score + 0x8000) & 0xFFFF) - 0x8000
+    score = (score - midgame) >> 16
+    endgame = ((score + 0x8000) & 0xFFFF) - 0x8000
+    return midgame, endgame, (score - endgame) >> 16
+
+
+def taper(midgame, endgame, phase):
+    # blend of the midgame and endgame scores by the phase, rounded towards zero so both colours are scored alike
+    phase = min(phase, MAX_PHASE)
+    blend = midgame * phase + endgame * (MAX_PHASE - phase)
+    return blend // MAX_PHASE if blend >= 0 else -(-blend // MAX_PHASE)
+
+
+# White's evaluation of a packed score
+def tapered_score(score):
+    return taper(*unpack_score(score))
+
+
+def piece_planes(game_state):
+    '''
+    the position as 12 x 64 planes, 1 where the piece code has a piece on the square: a numpy int8 array, or lists
+    without NumPy
+    '''
+    planes = numpy.zeros((12, 64), dtype=numpy.int8) if numpy is not None else [[0] * 64 for _ in range(12)]
+    for row, pieces in enumerate(game_state.board):
+        for col, piece in enumerate(pieces):
+            if piece != Player.EMPTY:
+                planes[PIECE_CODES[(piece.get_name(), piece.get_player())]][square_index(row, col)] = 1
+    return planes
+
+
+def evaluate_planes(planes):
+    # White's evaluation of the position in piece_planes form, one dot product with NumPy
+    if numpy is not None:
+        midgame, endgame, phase = EVALUATION_MATRIX.dot(numpy.asarray(planes, dtype=numpy.int64).reshape(768))
+        return taper(int(midgame), int(endgame), int(phase))
+    midgame = endgame = phase = 0
+    for code, plane in enumerate(planes):
+        for square, occupied in enumerate(plane):
+            if occupied:
+                midgame += MIDGAME_SCORES[code][square]
+                endgame += ENDGAME_SCORES[code][square]
+                phase += PHASE_WEIGHTS[code % 6]
+    return taper(midgame, endgame, phase)
+
+
+def piece_bitboards(game_state):
+    # The position as 12 bitboards, one per piece code: the compact form evaluate_batch takes, and the source of the
+    # pawn bitboards for pawn_structure
+    if game_state.bitboards is not None:
+        return list(game_state.bitboards.pieces)
+    pieces = [0] * 12
+    for row, row_pieces in enumerate(game_state.board):
+        for col, piece in enumerate(row_pieces):
+            if piece != Player.EMPTY:
+                pieces[PIECE_CODES[(piece.get_name(), piece.get_player())]] |= 1 << square_index(row, col)
+    return pieces
+
+
+def evaluate_batch(positions):
+    '''
+    White's evaluations of N positions given as N rows of 12 piece bitboards (see piece_bitboards), as a numpy int64
+    array with NumPy and a list without it. With NumPy the bitboards are unpacked to N x 768 piece planes and scored
+    with one matrix product, so the cost per position is a few array elements rather than a Python loop
+    '''
+    if numpy is not None:
+        bitboards = numpy.asarray(positions, dtype='<u8').reshape(-1, 12)
+        # bit i of each little-endian word is square i: the planes come out in code * 64 + square order
+        planes = numpy.unpackbits(bitboards.view(numpy.uint8), axis=1, bitorder='little')
+        midgame, endgame, phase = EVALUATION_MATRIX.dot(planes.T.astype(numpy.int64))
+        phase = numpy.minimum(phase, MAX_PHASE)
+        blend = midgame * phase + endgame * (MAX_PHASE - phase)
+        return numpy.sign(blend) * (numpy.abs(blend) // MAX_PHASE)
+    scores = []
+    for pieces in positions:
+        score = 0
+        for code, mask in enumerate(pieces):
+            while mask:
+                low_bit = mask & -mask
+                score += PIECE_SCORES[code][low_bit.bit_length() - 1]
+                mask ^= low_bit
+        scores.append(tapered_score(score))
+    return scores
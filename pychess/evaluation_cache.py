@@ -0,0 +1,38 @@
+#
+# The Evaluation Cache class
+# A fixed-size, direct-mapped table of static evaluations keyed by zobrist key, so a leaf position reached again in
+# another iteration or sibling subtree is not evaluated from scratch. Every key maps to exactly one entry, which the
+# latest store always replaces. It keeps no search results, so it works with or without a transposition table.
+#
+from array import array
+
+from direct_mapped_table import direct_mapped_table
+
+ENTRY_BYTES = 16
+DEFAULT_SIZE_MB = 1
+
+
+class evaluation_cache(direct_mapped_table):
+    def __init__(self, size_mb=DEFAULT_SIZE_MB):
+        super().__init__(size_mb, ENTRY_BYTES)
+        self.keys = array('Q', [0]) * len(self)
+        self.scores = array('q', [0]) * len(self)
+
+    def clear(self):
+        self.keys[:] = array('Q', [0]) * len(self)
+        self.scores[:] = array('q', [0]) * len(self)
+        self.reset_statistics()
+
+    def probe(self, key):
+        # score stored for the key, None if its entry holds another key
+        index = key & self.mask
+        if self.keys[index] == key:
+            self.hits += 1
+            return self.scores[index]
+        self.misses += 1
+        return None
+
+    def store(self, key, score):
+        index = key & self.mask
+        self.keys[index] = key
+        self.scores[index] = score
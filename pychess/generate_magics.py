@@ -0,0 +1,137 @@
+#
+# Offline generator for the magic bitboard tables
+# Finds a magic multiplier for every square and writes the magics, masks, shifts and the complete rook and bishop
+# attack tables to magic_data.py, so that magics.py only has to decompress them at startup.
+#
+# Run from the pychess directory: python3 generate_magics.py
+#
+import base64
+import random
+import sys
+import zlib
+from array import array
+
+from attack_tables import square_index, square_coordinates, DIRECTIONS, ROOK_DIRECTIONS, BISHOP_DIRECTIONS
+
+FULL_MASK = 0xFFFFFFFFFFFFFFFF
+OUTPUT_FILE = "magic_data.py"
+
+
+def relevant_occupancy_mask(square, directions):
+    # Squares whose occupancy can change the attacks, i.e. every ray square except the last one before the edge
+    row, col = square_coordinates(square)
+    mask = 0
+    for direction in directions:
+        row_change, col_change = DIRECTIONS[direction]
+        new_row, new_col = row + row_change, col + col_change
+        while 0 <= new_row + row_change < 8 and 0 <= new_col + col_change < 8:
+            mask |= 1 << square_index(new_row, new_col)
+            new_row, new_col = new_row + row_change, new_col + col_change
+    return mask
+
+
+def walked_attacks(square, occupied, directions):
+    row, col = square_coordinates(square)
+    attacks = 0
+    for direction in directions:
+        row_change, col_change = DIRECTIONS[direction]
+        new_row, new_col = row + row_change, col + col_change
+        while 0 <= new_row < 8 and 0 <= new_col < 8:
+            attacks |= 1 << square_index(new_row, new_col)
+            if occupied >> square_index(new_row, new_col) & 1:
+                break
+            new_row, new_col = new_row + row_change, new_col + col_change
+    return attacks
+
+
+def occupancy_subsets(mask):
+    # Carry-Rippler enumeration of every subset of mask
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if subset == 0:
+            break
+
+
+def find_magic(square, directions, rng):
+    mask = relevant_occupancy_mask(square, directions)
+    bits = bin(mask).count("1")
+    shift = 64 - bits
+    occupancies = list(occupancy_subsets(mask))
+    attacks = [walked_attacks(square, occupied, directions) for occupied in occupancies]
+
+    while True:
+        # sparse candidates collide far less often
+        magic = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+        if bin((mask * magic) & 0xFF00000000000000).count("1") < 6:
+            continue
+        table = [None] * (1 << bits)
+        for occupied, attack in zip(occupancies, attacks):
+            index = ((occupied * magic) & FULL_MASK) >> shift
+            if table[index] is None:
+                table[index] = attack
+            elif table[index] != attack:
+                break
+        else:
+            return mask, magic, shift, [attack if attack is not None else 0 for attack in table]
+
+
+def generate(directions, rng):
+    masks, magics, shifts, offsets = [], [], [], []
+    attacks = array('Q')
+    for square in range(64):
+        mask, magic, shift, table = find_magic(square, directions, rng)
+        masks.append(mask)
+        magics.append(magic)
+        shifts.append(shift)
+        offsets.append(len(attacks))
+        attacks.extend(table)
+    return masks, magics, shifts, offsets, attacks
+
+
+def encode_table(attacks):
+    if sys.byteorder == "big":
+        attacks.byteswap()
+    return base64.b64encode(zlib.compress(attacks.tobytes(), 9)).decode("ascii")
+
+
+def write_list(output, name, values):
+    output.write("%s = [\n" % name)
+    for start in range(0, 64, 4):
+        output.write("    " + ", ".join("0x%016X" % value for value in values[start:start + 4]) + ",\n")
+    output.write("]\n")
+
+
+def write_int_list(output, name, values):
+    output.write("%s = [\n" % name)
+    for start in range(0, 64, 16):
+        output.write("    " + ", ".join(str(value) for value in values[start:start + 16]) + ",\n")
+    output.write("]\n")
+
+
+def write_string(output, name, text):
+    output.write("%s = (\n" % name)
+    for start in range(0, len(text), 100):
+        output.write("    '%s'\n" % text[start:start + 100])
+    output.write(")\n")
+
+
+def main():
+    rng = random.Random(322)
+    with open(OUTPUT_FILE, "w") as output:
+        output.write("#\n# Magic bitboard data, generated by generate_magics.py. Do not edit by hand.\n#\n"
+                     "# *_ATTACKS is a base64 encoded, zlib compressed array of little-endian unsigned 64-bit\n"
+                     "# attack sets; the table of square s starts at *_OFFSETS[s].\n#\n\n")
+        for prefix, directions in (("ROOK", ROOK_DIRECTIONS), ("BISHOP", BISHOP_DIRECTIONS)):
+            masks, magics, shifts, offsets, attacks = generate(directions, rng)
+            write_list(output, prefix + "_MASKS", masks)
+            write_list(output, prefix + "_MAGICS", magics)
+            write_int_list(output, prefix + "_SHIFTS", shifts)
+            write_int_list(output, prefix + "_OFFSETS", offsets)
+            write_string(output, prefix + "_ATTACKS", encode_table(attacks))
+            output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 
 from enums import Player
 from piece import Piece
+from attack_tables import square_index, KING_TARGETS
 
 
 class King(Piece):
@@ -14,25 +15,18 @@ class King(Piece):
         _peaceful_moves = []
         _piece_takes = []
 
-        row_change = [-1, +0, +1, -1, +1, -1, +0, +1]
-        col_change = [-1, -1, -1, +0, +0, +1, +1, +1]
+        board = game_state.board
+        player = self.get_player()
 
-        for i in range(0, 8):
-            new_row = self.get_row_number() + row_change[i]
-            new_col = self.get_col_number() + col_change[i]
-
-            if not 0 <= new_row < 8 or not 0 <= new_col < 8:
-                continue
-            
-            evaluating_piece = game_state.get_piece(new_row, new_col)
+        for new_row, new_col in KING_TARGETS[square_index(self.get_row_number(), self.get_col_number())]:
+            evaluating_piece = board[new_row][new_col]
 
             # when square is empty
             if evaluating_piece == Player.EMPTY:
                 _peaceful_moves.append((new_row, new_col))
 
             # when the square with new_row and new_col contains a valid piece
-            # TODO: FIX BUG to remove isinstance
-            if not isinstance(evaluating_piece, int) and not evaluating_piece.is_player(self.get_player()):
+            elif not evaluating_piece.is_player(player):
                 _piece_takes.append((new_row, new_col))
 
         # Check for castle
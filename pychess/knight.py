@@ -1,23 +1,21 @@
 from enums import Player
 from piece import Piece
+from attack_tables import square_index, KNIGHT_TARGETS
 
 class Knight(Piece):
     def get_valid_piece_moves(self, game_state):
         _peaceful_moves = []
         _piece_takes = []
+        board = game_state.board
+        player = self.get_player()
 
-        moves = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+        for new_row, new_col in KNIGHT_TARGETS[square_index(self.get_row_number(), self.get_col_number())]:
+            evaluating_square = board[new_row][new_col]
 
-        for move in moves:
-            new_row = self.get_row_number() + move[0]
-            new_col = self.get_col_number() + move[1]
-
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                evaluating_square = game_state.get_piece(new_row, new_col)
-                
-                if evaluating_square == Player.EMPTY:
-                    _peaceful_moves.append((new_row, new_col))
-                elif not evaluating_square.is_player(self.get_player()):
-                    _piece_takes.append((new_row, new_col))
+            if evaluating_square == Player.EMPTY:
+                _peaceful_moves.append((new_row, new_col))
+            elif not evaluating_square.is_player(player):
+                _piece_takes.append((new_row, new_col))
 
         return _peaceful_moves + _piece_takes
+
@@ -0,0 +1,661 @@
+#
+# Magic bitboard data, generated by generate_magics.py. Do not edit by hand.
+#
+# *_ATTACKS is a base64 encoded, zlib compressed array of little-endian unsigned 64-bit
+# attack sets; the table of square s starts at *_OFFSETS[s].
+#
+
+ROOK_MASKS = [
+    0x000101010101017E, 0x000202020202027C, 0x000404040404047A, 0x0008080808080876,
+    0x001010101010106E, 0x002020202020205E, 0x004040404040403E, 0x008080808080807E,
+    0x0001010101017E00, 0x0002020202027C00, 0x0004040404047A00, 0x0008080808087600,
+    0x0010101010106E00, 0x0020202020205E00, 0x0040404040403E00, 0x0080808080807E00,
+    0x00010101017E0100, 0x00020202027C0200, 0x00040404047A0400, 0x0008080808760800,
+    0x00101010106E1000, 0x00202020205E2000, 0x00404040403E4000, 0x00808080807E8000,
+    0x000101017E010100, 0x000202027C020200, 0x000404047A040400, 0x0008080876080800,
+    0x001010106E101000, 0x002020205E202000, 0x004040403E404000, 0x008080807E808000,
+    0x0001017E01010100, 0x0002027C02020200, 0x0004047A04040400, 0x0008087608080800,
+    0x0010106E10101000, 0x0020205E20202000, 0x0040403E40404000, 0x0080807E80808000,
+    0x00017E0101010100, 0x00027C0202020200, 0x00047A0404040400, 0x0008760808080800,
+    0x00106E1010101000, 0x00205E2020202000, 0x00403E4040404000, 0x00807E8080808000,
+    0x007E010101010100, 0x007C020202020200, 0x007A040404040400, 0x0076080808080800,
+    0x006E101010101000, 0x005E202020202000, 0x003E404040404000, 0x007E808080808000,
+    0x7E01010101010100, 0x7C02020202020200, 0x7A04040404040400, 0x7608080808080800,
+    0x6E10101010101000, 0x5E20202020202000, 0x3E40404040404000, 0x7E80808080808000,
+]
+ROOK_MAGICS = [
+    0x0080041820804000, 0x0140012000401000, 0x8880100080200008, 0x1100080510012100,
+    0x9200200200100804, 0x0600041018020019, 0x0880220001000080, 0x0100020040802100,
+    0x0010800040002098, 0x0082401002402000, 0x0100802000801000, 0x0202001042000820,
+    0x9001001105080100, 0x1412000810040200, 0x5085002200040100, 0x0005001200804100,
+    0x0010208000400090, 0x0010014040002000, 0x0200808010002000, 0x0000808010000802,
+    0x2085010010040800, 0x2241818004000600, 0x8040A10100020004, 0x8030020004104091,
+    0x4010308080004006, 0x21005001C0026000, 0x0400802200401201, 0x0000200900100100,
+    0x0040080080800400, 0x808A000200100805, 0x0200080400820110, 0x1180801980014300,
+    0x0080002002400155, 0x0800400090802002, 0x8050068014802000, 0x2A00100080800800,
+    0x3404100501000800, 0x0014000480800200, 0x5002100184000208, 0x4100040042001081,
+    0x0000308040008000, 0x0000820021020042, 0x0008102001010042, 0x0008001000808008,
+    0x010C008008008004, 0x302A011004020008, 0x0082A84102040030, 0x8414040080420021,
+    0x0700408005012500, 0x0221002040008300, 0x0202200211004500, 0x900C801000480180,
+    0x8008000400288180, 0x8000020080040080, 0x0414289002014400, 0x00810049009C0200,
+    0x2088108000284101, 0x0008110022004882, 0x2002081020024101, 0x2232002040040812,
+    0x0002002008041002, 0x0202000810010402, 0x0080088208300904, 0x10000021004C0082,
+]
+ROOK_SHIFTS = [
+    52, 53, 53, 53, 53, 53, 53, 52, 53, 54, 54, 54, 54, 54, 54, 53,
+    53, 54, 54, 54, 54, 54, 54, 53, 53, 54, 54, 54, 54, 54, 54, 53,
+    53, 54, 54, 54, 54, 54, 54, 53, 53, 54, 54, 54, 54, 54, 54, 53,
+    53, 54, 54, 54, 54, 54, 54, 53, 52, 53, 53, 53, 53, 53, 53, 52,
+]
+ROOK_OFFSETS = [
+    0, 4096, 6144, 8192, 10240, 12288, 14336, 16384, 20480, 22528, 23552, 24576, 25600, 26624, 27648, 28672,
+    30720, 32768, 33792, 34816, 35840, 36864, 37888, 38912, 40960, 43008, 44032, 45056, 46080, 47104, 48128, 49152,
+    51200, 53248, 54272, 55296, 56320, 57344, 58368, 59392, 61440, 63488, 64512, 65536, 66560, 67584, 68608, 69632,
+    71680, 73728, 74752, 75776, 76800, 77824, 78848, 79872, 81920, 86016, 88064, 90112, 92160, 94208, 96256, 98304,
+]
+ROOK_ATTACKS = (
+    'eNrsXD9PG00TH1t+IpRHiSgiIuURiJIiShoEUiKQPwIlRZRQUkSJC0RQAMNHyUegpEDwFSgpoqSliPI2iEiJgl777ue73bn9d7d3'
+    'Ph9eS3mGubnZ2d/Ozs7Orv3cteLP4xZFnwXQEX+X8C3I4z9GfJ+9z/X7rVhBp9+G/Tbe19P0fZm36kVv6vQfwP4DvK+n6fsyb9WL'
+    '3tTp143/MezfJbx1HrTgR+Zn3TyIFfqCPVE/xe+Opxr/u/uzGv/Xg38hif+YX7fE8zqL36yc68vxv66N/+D/OvCP4p/H87ohnuFH'
+    'yzyR43+Bxf968P9E4F9n8e8SzyTFs329cMv/wf91xn+eeFbl/3VL/l8P+b8R+f8uiU/XeoAs+0A5/vvW+B/1z3U/XLb/R/5xrQfK'
+    '9v948Wfzf/yHez1Alnmgzv99K35XfFX539W/Vfl/PPj7mfyfr76/S+K72PmBP/4RvmL1s7//R/4tdn5QN/5R/Ovqc9f6vuj5QXn4'
+    'i+XP8vxfbP9QN/5s/e9b3+c7Pwj+rxe/Lv8Xr+/znR8E/9eLf92S//PX9/nOD4L/JyP+1y35372+z3d+EPw/Wfm/b8n/tvo+7/lB'
+    '+fjz1c/l+z/f+UHd+HX5v2+JZ1t971oPVIffTb86/7vp143/Ljavrc/vPO/3becHwE81+59q9n9t+BH/Qryq8/9dwft92/lB8H+9'
+    '+BdY/Jd9v2/TD/6fjPgvr/7Ppx/8Xy/+dUv+973fXw/5vxHxX179n08/+H+y8v+dJX/f5bzft50fBP9PZv7Pc59nut+3nR8E/9eL'
+    'v2/J/+73/8XOD4L/JyP+y7v/z3d+EPwf6v/g/1D/B/+H+j/4P9T/wf/15v/y7v/dzg+C/ycz/4/5/j/4v7b7f/n7ONn6PTZQ3f2/'
+    '/H2UbP9jA9X5X/4+TtZ/sYHq/F8vfvvv+2MD+nj2vf83fz8txd+q2P9k8X+rYv/Xg9/++/5R/Lcqqv+D/+vEb/99f2xAv5/3rf+D'
+    '/+vEb/99vxz/5df/wf+TEP/rlvy/bsn/xev/4P9Jyv+qekCM/+z3+33v/7XjoMHPv99etv+z9YDsf/79/rL9P178Tvf7LVN973v/'
+    '71Dftiz1USX+J4v/WxX7fzz4nf7/fS2X+33D+UGu/J8Xv0P9XKn/Hc4PKvW/H36n+/2Wvb43nh8YzgPLw0+O8VGV/8lxfajK/8Xw'
+    'O93vt/LU94rzA0M9EPxfL36n+/1WnvpecX5gqAeC/+vF73S/38pT3yvODwzrRfD/ZMT/uiX/u9f36vy/HvJ/I/J/35L/+873+y3L'
+    '9wOqwq+on0lfP5fvf8X5AenPD+rG73S/38pf39t+H3CX5367RVTd//+9Kv+7nQ/Vjf/Oeg5kzv/+////4P868Tv9vr9l/35/8f//'
+    'f/B/nfjLr//zfT8g+H8y4r+8+j/f9wOC/+vFX379n+/7AcH/kxH/5dX/+b4fEPw/Wfn/zpL/7zx/H9AP8d+I/O9+/+9wfkCm//9/'
+    '8H+d+Mu7/zecH4T8P/HxX979vzr/34X8H+r/UP+H+j/U/6H+D/Ef6v/g/4nM/+Xd/5Pl/j/4f5Lzf7j/nw7//23Hn7/t+P1HCW2n'
+    '8oiq5f+A/yd+TeSd5EJ70Rt/E7uUlVNW7mt/Hvw87HN8klyJP/78k+1PKpee6/Eze05yEd/wURY3sX7I8rWExgKOzybP2tePf1uJ'
+    'P/48yvZH8rtOXr7/5XHP+l+Wlz3/Tf5vK/3vN/8OwR9q/GuT+84/Pr8Fe05y3/k3j/Gb16xv82zcq17/5tm8zPpflvvaF+Nbtf5J'
+    '8jGsf9n4N8t9558Y32r/m+Vlr3/Z+JfH3bT+F/E/8r+Qb+Vxz+b/ate//Pnfb/75+z/ueF6/69a/8ef/+LOmWd9Gcb9W2foXd/wR'
+    'i+s15nedvP78X/f+z2/+1Z//5fUvm/9l/5vyfzH/xx2f16xv2fxf9f4vb/73m3/++/9y17/x5/+693/y+pf1P8//5e7//uK5Kf+T'
+    'Mf+Xu/6Z8j/p83/h+VdG/i8y7rr1z3//p5//pM//Yr6Vxj2b/8te/+RxVeV/Mub/svd/+vxvmP817v/85t8hxu9Qs74dov+Hzutf'
+    'vvnH179Dtu/I5n9ZXkb+J0N+t8nL3//p8z/p83/h+VdG/i9z/fM//8s3/+rf/8njqsr/ZMz/fvOvpPxf2vpXJP/7zD///V8p87/E'
+    '/V/+/E+G/G6T+69/peT/Evd/+fN/vfu/UvK/mG8lfNn8b1v/8ud/MuR3m9x//1dK/i9x/5c///v43//8r9z1z//8L3/+r3f/V0r+'
+    'Lzz//orn/G1V/pfvAape/wR7Sv9zeUn5v5T9X9Hzzzr3fyXl/1LWv6EoG//yOqDK/2H/V3z+HbJ7dVX+J2P+L3f9K5j/S9n/Fb3/'
+    'afL+r8zzvzLWv/Gf/03O/q/o/Y+P/7P5n3//j+f/ate//Pnf//7Hz//+3/8od/9X/P5Ptf5lv/9T9vrH87/+/q+tPP8re/9X/P6v'
+    'nv2f3/wrKf9TGeffw0fZ/C/7X5X//fzP87/+/q89lv1f8fu/ot//8dv/l7v++Z//Fb//q2f/x/O//v6vXcH+7y875zfl/3Gsf6r8'
+    'T7nyf775V2b+r+v7P2SY3zZ5Gd//LWv+1/X9HzLkd5u8/v2f3/w7lO4BVPlfvgewr3/55l82//Pv//H8z7//V17+L/b9n7L3f9n8'
+    'T7nyf775V2b+L2P98z//yzf/6t//+X7/x2/+lZ///dY/n/xf7Ps/vvu/svO/7/6veP4v9v0f3/Wv7Pzvu/8rnv/r2f+Vnf/59/94'
+    '/retf8XzP1EZv/9r3u+/ysr/Rfzvf/5Xdv73Pf8rnv/r2f+Vnf/zzb8/nfgDOuAJzymVS1SWv+p0GCVGzfI/cbMCzdo3yX3t/4vn'
+    'KSVGzfKH8bAJdPRckEtUlpdhX6ZZ+yb5f+h3SkfPBblEZfkz9CulxKhZ/h/6ldKsfZPc1345/u90QBvn/9foP+iAHz0X5BKV5b+h'
+    'DzrgR88FuURl+Wv0K6VZ+yb5bzxPada+SV7C+DOaGX+jvG77JcR/JEhpJv4ivZSWHv8dmWbtm+TT7v99xC/ogB89F+QSleWvoA+q'
+    'yr+RXkpl+T78ktKsfZP8FZ6nNGvfJA/xH+J/mv3vm/8/Qx90wI+eC3KJynLf/P8Zz1OatW+Sh/gP8T/N/v+D5ynN1N9GuW/+L8O+'
+    'Z/6PPqCq8Y8UU1q6/zsyzdo3yUuIf0Yz8WeUlxD/3vY94z+SpHS6/P8az1Oayb9G+W88T2mm/jbK67ZfQvz7nv/4+t/3/M83/nzP'
+    '/2q1X0L8+57/1ur/fYxLSjP1t1Hue/5et/0Q/yH+pzn+ffPvZzxPaab+Nsrrth/iP8T/NMf/H/Q7peH+f5ruf/9D/0HD/f+Uff/j'
+    'Nfqd0iL3/yIN9//NO//3iv/oAxrO/xt5/y/SIvf/Ig33/yH+Q/w36/6/eP7/DL2Uhvv/EP8h/qfr/r94/p+M+//pvf8t5/7fK/4n'
+    '4P5/er//Ee7/p/v8N5z/T/f9T7j/D/Ef4n964z/c/4f4D/E/vfH/ayb+fJqZAR8//wT6dCYWPIX8afI8lc9Y5Cb9FeivQL6SPI/p'
+    'HPTnIJ9LnqfyGYvcpL8D/RvId/D8BvQJ9J9A/iR5nspnLHKT/jL0lyFfTp6Pxz78Tzr/r0J/FfLV5LmoT1R0/tj8vwv9W8h38fy2'
+    'pPlj8/8y9HX+8Z0/Nv/fQH8H8pvEbjnz5yniX+cfX//b9G3x6+t/m74tfnz9b9O32ff1v00f/i+8fj+F/4vOH9/123f++K6fvvOn'
+    'avs2/68i/nX+8fW/Tf8W9nchv038Np78X3f+rXv/Af8b1/d4Pdev70NR0fkD/5PO/yvQ163vt7BfdP7Y/L8DfdP67jN/6t5/2PK/'
+    'r/9t+nOwr/OPr/9t+rb48fW/Tb/u/UfV+d/R/375f0Yv9/W/7/rr6/+q9x+fEH+/IP+U+G08+X8F9r3q/5ni+f8G9nX7o/te/8P/'
+    'pPO/bf/+CeNfdP7A/8b1Hft47fo+FBWdP/C/sb4iS301FBWdP3XvP3zrf5v/neo/Q/739b9N/wnsF10/bf73rf+q3n9MRP1fYf53'
+    '9L9f/p2Z3Prf5v+66/9d2Nedz1Sd/5dh3yv/zhT3X937D1v9/wn6pvXdp/6H/43nu2Q53x2Kis4f+N/v/H2meP6te/9hy/++/rfp'
+    '+9b/Nv871X+G/O/rf5t+3fuPqvO/o//rrf8rzP+O/q9t//EL+cPr/r/B9f8O7Hudv8941v817j9s/ne6/yXP+39D/e90/zvjef8/'
+    'kHmdv8943v/XuP+wfX/H1/++9b+v/53ufz3yr83/TvVfjfsP3+9v+c6fqvO/o//rrf9r3H+swn9e9T953v9T8fvbptf/de8/bP53'
+    'uv8lz/t/Ir/7f/K8/zfkX6fz1xnP+/8a9x+2+PX1v9P9LxWv33znjy3/+vrf6f63xv1H1fnf1/++3/+qu/539H9t+49PGD+v+39q'
+    '7vf/b6Dvdf7e4Prf5n+n+1/yvP8n8rv/J8/7fyK/83fyvP+vcf/hW7/5zh9b/Pr63+n+1+P7U77zp+79x0TU/xXmf1//j+X7/zXu'
+    'P+qu/3eh73X/T839/n/d+w+b/53uf8nz/p/I7/6fPO//qb7f39W9/7DFr6//ne5/Peo33/lT9+/v6t5/VJ3/ff0/lvqf6vv9Xd37'
+    'j//Nxp8BjfiPMTukgjyigpxkOTE55ZGTRD8yWrX8RdydIa2Jp1rpc/j/OfoDnmSezDz58FQrfQ9/vEd/foD/Ab56OUn0B6NVy7fh'
+    '/2305xr+vwa/DX/LcpLlxOSUR04SvWa0avkS/LGE/oyfp5pp/BH7N+yizJOZJx++XvzX8Ic4X4nN12rl453vXP4/9EfMz8Tyd7Xy'
+    'evP/T8z/n+jPB8z/D+B/Yr7LcpLlxOSUR04S/cBo1fLn8IeYn8fLU810uvc/41/vuLze/B/2P2H/M837n5fA/xL9AU8yT2aefHiq'
+    'lf7EfBTzM7H8Xa283vz/A/4X69VhF8V6dfinLJfr2VlW785SHvl4610un/b9z7Svf2H/E/Y/07z/eYn+iPl5vHy9+f8F5r94Pj/s'
+    'osyTmScfvt7z//Gfd3N5vfl/2vc/of4L+5+w/5ne/Q/u+2fl+/5Z833/rM99P5eP97yfy8P9/3Sff0/7/gfr3ay83s2a17tZn/WO'
+    'y+u9/wz7n7D/meb9z/jv+7m83vyP+/5Z+b5/1nzfP+tz38/l4z3v5/Jw/z/d+59p//5T2P+E/U+4/5/e+//x3/dzeb35H+fds/J5'
+    '96z5vHvW57yby8d93i/TcP8fvv8d9j9h/xPu/8P9/zTe/0/779+mff8T6r+w/wn7n+nd/3xfjD+Xi4spP6ApH793uUhK/grv6SkZ'
+    '6Tu8txmbVfAEfvS+zH/He8Ah80J/dXQD+Ef93YBeysv93dD0X0/JSMVxV/Nk9MMG3gMOmRf6q6ObsZo07ouSH9Tjzvuvp2Sk4rir'
+    'eTL6YTRPRjgkXuivjn5j8/8bm//fWH+/lTz/37L5nuXl/r5V9F/AIfNCf3XUd/6P+qunZKTiuKt5MvqhrPn/ls3/t2z+6/zQ9Pn/'
+    'lc3/r2z+f2X9/Vry/H/D5nuWl/v7RtF/AYfMC/3VUd/5P+qvnpKRiuOu5snoB9/5v4F584bhf8Pwv2F6b0qa/5dsvmd52e6lov8i'
+    'jrz4fee/L/43DG+WJ6Mfypr/l8z/l8z/Oj+E+d/s+X/F/H/F/H+VWe/Lnf+bDG+W5/ku238Bh8w75B/f+b+Z5isNNedfcdzVPBn9'
+    'UNb832T4Nxl+nR/C/G/2/P+OcSta//vO/3dsvmd5Xm9n+y/iKFb/F5//k1X/F5//79j8f8fmv84PTZ//39j8z1v/+87/t2y+Z3le'
+    'b2f7L+IoVv8Xn/+TVf8Xn/9v2fx/y+a/zg9Nn/9f2fzPW//4zv83bL5neV5vZ/sv4ihW/xSf/5NV/+Sf/5eY/2/SeSvVP5eZ/pZb'
+    '/2yw+Z7l7f0XcMi8g33f+S/0V0PN/RfHXc2T0Q9lzf8NNv/z9j/M/2bO/ys2//PWP77zf5PN9yzP8022/yKOYvV/8fk/WfV/8fm/'
+    'yeb/Jpu/ej+E+d/k+f8O/t9I61Zp/r9j/X1X8vz/zuZ7luf1frb/Ag6Zd6u/veb/97Re11Dr+YOEI8uT0Q9lzf/vbP5/Z/Nf54em'
+    'z/+3bP6/ZfP/Levv25Ln/zc237M8r/ez/RdwyLxb/e01/7+l9bqGWs8fJBxZnox+KGv+f2Pz/xub/zo/NH3+v2Hz/w2b/7b7R9/5'
+    '/5XN9yzP6/1s/wUcMu9Wf3jN/69pvaKh1vpLwpHlrfePXvP/Mq0bJfxfGX5D/eU1/zfYfM/y5vs3GT/lxu87/33xf2V4s7z5/KGs'
+    '+b/B/L/B/K/zQ5j/zZ7/m8z/m8z/tvNnX/xXDG+WN9df8vffFnN//813/vt+/22Dfd8ty1vv30uZ/1cM/xXDbzh/CPO/wfP/HTv/'
+    'ylv/+87/72y+Z3leb2f7L+IoVv8Xn/+TVf8Xn//f2fz/zua/zg9Nn/9v2fzPW//7zv9vbL5neV5vZ/sv4ihW/xef/5NV/xef/9/Y'
+    '/P/G5r/OD02f/2/Y/M9b//jO/69svmd5Xm9n+y/iKFb/FJ//k1X/5J//o++/fmX3X1/Z/P2aqfvKmf+XbL5neXv/BRy5779857/v'
+    '/ddXdt+V5cnoh7Lm/yWb/3n7H+Z/M+f/Jpv/eeufpv/+zXf+T1b9X3z+F/39W5j/zZ7/F934E9OYHz0f0i/d+D097RrpCd7T0TO8'
+    'p6NV2z/Fezp63+2fJO+p6UWXjPRLPG0kShI19/8EeiIlgZ4l80RNq7Z/mvhJTb/E4QNa0P7g1RPoF7TfLWrfpm+bP+fQP4f+OfTO'
+    'w/pxL+w7zF8jPU/miZqG9aPe9QP5nzzyv9f6cQb9M+ifJX4bz/oR8r93/q90/WhE/DZ4/bDpO+Z/8sj/Yf2Y7vwf1o8a7V9AT6QF'
+    '8j95xi95xK/X+nEK/VPonybjNh3rxz3I/5Xab0T+97Bv03fK/4wWyP9h/Qj5P6wfTc3/HuvHGfREWiB+yTN+ySN+G71+hPzvHb+N'
+    'Xj8mIv+H9WNi14+Q/+/3+nGRrPNq2oj49bB/Cj2RFojfxq4fuD/q6u6PQv6f+PzvZd93/3ierPNqGtaPZq8fjvfP2vUj5P97n/+9'
+    '1o8Svr9Tf/w2eP2wfX/E6ft/Fa4fIX7vff4P68cErx++3z9z+v5fWD9C/m/u93cbvX7Y7o8c839l64fT93cqXD9C/r/3+T+sHxXe'
+    'Pzvm/7B+hPzf1Pht9PpRSv6nmn+/0+Df39W9foT8H9aP2vN/WD9qWz+OjuNPd/ifmI+ed1Ma/bEFOnq+JciHf25BXyUf0h7T74Ee'
+    'xWTwnJT8iG558j0N32f4+2PG32f96o8Z/wHDfzBm/AesXwcB/1jx7zH8e2PGv8f6tRfwB/wB/9jw9xj+Xk78R8BfdP/Qs/TThs93'
+    '/+CLv8/w98eM33f/4Iv/gOE/GDN+3/wZ8Pvh32P498aM33f9DPgD/mnGv8Xwb7H+H6X9PiZFfu8x/HnHz7ZvseV33/Gz4e8z/P0x'
+    '47fl96rxHzD8B2PGb8tvAX+1+PcY/r0x47etbwF/wB/wV4e/x/BzfFsMf979Q9FzC9dzD9v+oWr8tv1D1fht+4eq8dvyZ9X4bfkz'
+    '4K8Wv239rBq/bf0M+AP+acbfBf4jdn9xJOBj+5hc+G3jZ8vTVd17cPx9hr8/Zvy6PD0u/AcM/8GY8evyVMA/Hvx7DP/emPHr1qmA'
+    'P+AP+KvH32P4e474R99/KLp/sPXThs93/1AW/qL7h7LwF90/lIW/aP4sC3/R/Bnwl4O/6PpZFv6i62fAH/AH/MfHtu8vHrH7iyOG'
+    'v/j4lXOOX3z83PD3Gf7+mPEX/R5AWfgPGP6DMeMveg8e8JeDf4/h3xsz/qL3oAF/wB/w++PX/X7B9fcP+v1DOecYxfcP48Gv3z+M'
+    'B79+/zAe/Pr8OR78+vwZ8I8Dv379HA9+/foZ8Af804sfv/8v/Pu9e/L7/8K/37snv/8v/Pu1e/L7/6nFv8fwT+nvvwP+gH+af/9f'
+    '+PcL9+T3/4Xx35Pf/xfGf09+/x7wT/fvvwP+gH+af/9f+Pd79+T3/4V/v3dPfv9f+Pdr9+T37wH/dP/+OeAP+AN+mtrf/1eGvyG/'
+    '/68Mf0N+/x7wT/fvvwP+gH+af/9PU/77f5ry3//TlP/+ferxT/nvnwP+gH+q8U/57/9pyn//T1P++/eAf7p//xzwB/xTjX/Kf//v'
+    '8fu9e/H7f4/fr92L378H/NP9++eAP+AP+Glqf/9fOf4J//1/5fgn/PfvAf90//474A/4pxJ/664VfyIa86PnEe23yEjbnvSBJ/W1'
+    '/9hKo4EQKYm0jecCJUaN8gd4LlBidCiJqULehv/akKvsD/V18gXoL0C+kD4HJSMN/m+2/9ehvw75evoclIw0+D/Ef/B/c/3fh34f'
+    '8n76XNgfkHZ/YLffdP+bqd2Ov/9Ncpf55xf/sb5OHvzfbP/b83+sr5MH/4f4D/5vrv/voCdQVv/H+rr9ge/+4wH0dfub5vvfd/77'
+    '+98kX8BzgZYc/8H/k+z/dTwXaMn5P/g/xH/w/6T6v4/nAs3U/6b9ge/+w+5/3/OPpvvfd/77x79JHvzfbP+75H+TPPg/xH/wf3P9'
+    'f9ciI7XtD5p+//EY+o8h5/c7zfe/mS5YqX/8B/9Prv/XrdQ//wf/h/gP/p9M/9u+32fbHzT9/sPu/1hfJ2/6/deCJw3+b7b/1z1p'
+    '8H+I/+D/5vrfXv/X/f3/au8/bN/v9Pf/ZN9/VR//wf+T7P/q83/wf4j/4P9J9X/19f9k33+4+N/39x+TfP81+fEf/F+l/yc//wf/'
+    'h/gP/q/I/+2/7fjztx3z84O/Yxrz/0TskCZ8W+QfQf4o4ZPnbaanbGc+tZv0J6bpe8OPrp1HkVSyK/VDtNdW9GcN/BrkvD8K+xb8'
+    'sfyRFrcZv9gf9fhl7EcfPf54fHTjd5hQHX7z+CnsW/DL/R/ZmVf0x2X+ZHFn7BvnzxrGZ03THzt+wQ+K/tjmD7c38vua4/x5ZJmH'
+    'tvnzN4k7HX7z/LHjN4/fPMZnXtOfqtcfId5c179S1x8h3iI574/D+ue1/gjxlumP4/pDpnlomz8cP+9PgfWH8qw/a2zdtePPvf4Y'
+    '5888xmde058K1h9i8R/Zd8//5a4/fL1R5//q1p81jM+a+/pX6f7Hvv6r8n/x9cee/3Pvv7z2P/b8n3v/ZZw/9v2f9/pjnD/Z/G/b'
+    '/3mvPznzf7XrD1//7Pm/3PUnu/7nzf/l7n+y679t/fNbf7L537f+89v/ZPO/b/1nnj/Z/Z/3/idn/rft/0pff1j+F/YB49n/WPK/'
+    'vA+oev3xqP8q2f941H+F1p9DjM9h+fVfof3PIVuXSqz/yjr/Kav+K+v8x6v++8vy7hj2P8b1j/en6vXHo/6rZP/jUf8VWn8O2b67'
+    'xPqv0P6H96fE+q+s85+y6r+yzn+86r/8+b/a8+/8+d9v/fGo/yrZ/3jUf4XWn0OMz2H59V+h/Y89/xfef5V1/lNW/VfW+Y9X/WfP'
+    '/9WuP/nzf7nrT/76r9r9T/76z2/9yeZ/3/rPb/+Tzf++9V/Z5z++9V/Z5z9e9V/nTyf+RDTiCc9j+hvy35D/Tp5Toi/TrL5MZf1/'
+    '0f6/aP/f5HlMH0L+EPKHyfNUX6ZZfZnK+v+h/f/Q/n/J85g+g/wZ5M+S56m+TLP6MpX168b/Gu2/Rvuvk+cxfQX5K8hfJc9TfZlm'
+    '9WUq6wf/14t/H+3vo/395HlMP0P+GfLPyfNUX6ZZfZnK+sH/If6D/+vDH+d/suR/qjj/kwU/Vex/svifKvZ/ffhfo31z/FPF8R/8'
+    'Xxf+fbRvzv9Ucf4P/g/xH/xfB/4/0WORZvI3o5n876X/L56nNNN/RjP4vfT/w/OUZvzHaMb/Xvp143+N5ynNxC+jmfj30g/+rxf/'
+    'Pp6nNJO/Gc3kfy/94P8Q/8H/9eEP+T/Ef4j/kP9D/g/xH+J/6vw/82sm/kQ04kfPY7oaSUEjfvQ8pp9mZhglia7ieUpl/VvYv0X7'
+    't8nzmK7A/grkK8nzmO6i3ZSSRFfwPKWy/g3s36D9m+R5TJdhfxny5eR5THfQbkpJost4nlJZv277v6JmRZr1v0zL979Ms/6Xafn+'
+    'l2l2/GVavv/rtP8U8+8p5tfT5LkoJ5Oc0XzyOdifQ/tzyXNRTiY5o/nkT2D/Cdp/kjwX5WSSM5pbXqv9p5hXKc363yL39r9Ms/63'
+    'yL39L9Ps+Fvk3v6v0/4q5p8uv//C/DPsD4zruy0/rMC+Lr/fwr5hf2Bc3235YRn2dfn1BvYN+dm4vjqsz7Xat+V3h/2Bt/9N+d1h'
+    'f+Dtf1N+dcjP3v6v037I/yH/h/w/vfn/E+bfJ8wvRf1mrP9/od2U5ssPu7C/i/YV9Zux/r9FuynNlx92YH8H7avzM5nyM6O51+da'
+    '7X/CvEpp1v+W/YG3/2Wa9b9lf+Dtf5nmzs/e/q/Tfsj/If+H/B/qf8P5fjT/DPsD4/puyw+2+n8X9g37A+P6bssPtvp7B/YN+dl2'
+    'vmtbn2u173C+b9sfePvfcr5v2x94+99yvm7Lz97+r9N+yP8h/4f8P7X5f/Z/s/Hn5exsxA/oLCjkhOdq+hP6L/D+C+iP+J9474WG'
+    '/oD+c7z/HPoj/gfee66hvvrX0F/C+0vQH/HXeG9JQ5uuH/s/ohH/UeP/Ef2o9H9EI/6Dxv8j+kHp/4hG/HuN/0b0vdL/xfWvoX+N'
+    '97c14zei28rxb67+S8wf7v+PyXqg9v/HxI/xh/v/Q7IeqP3/IfFD/OH+e5/Es9p/70vSX4I+H7/tJJ7U47d9T/RfYv7w9Z/7n1PZ'
+    '/5RZ/7n/OZX9T5n1m/uP0/cl6S9Bn6+ffPw43b4n+h8t+f+jJf9/sOT/D5b8/96Sv99b8rev/rYlf25b8mfT9T9i/nxM8r3a/x9Z'
+    'HpD9n8b7T43/P7A8IPs/jdcfGv+9Z+v485L0t6G/neRL9fhts3V06Z7oj/I/9///2PrP/f8/lv+5/3+y9Z/7/yfL39x/P9j6zf33'
+    'oyT9Uf7k43fN1k8+ftf3RF+X//9nyf//s+T/n5b8/9OSv39Y8vePkvR1+fPakj+v74l+VP8R+dX/RH71P5Ff/e+hfw19r/q7wfoj'
+    '/3vV/+RZ/5Nn/U+e9T951t8N1n+p8X+u+l/h/1z1v8J/uep/D/0lzfjlqr8brP9Ss/7nqv/Js/4nz/qfPOt/8qy/G6z/0ZL/nep/'
+    'Q/53qv8N+dup/vfQ37bkT6f6u8H6I/971f/kWf+TZ/1PnvU/edbfDdZ/qfF/rvpf4f9c9b/Cf7nqfw/9Jc345aq/G6yvy/+56n/y'
+    'rP/Js/4nz/qfPOvv5uovfl+MP++G/wE/fP4O9Pti/N67xdH7nF8Ev6jhzfobkXVavIT9Ddi9BN3Ae5fJ+5xfBL+o4c36b2D/K+y/'
+    'gd2voG/w3tfkfc4vgl/U8Gb9DYx/Xfg3Yf8K9jdh9wp0E+9dJe9zfhH8ooY3619i/DdgP8U9Ggey4Fi0jINZ/wr2N2E/xT0aB7Lg'
+    'WLSMg1n/EuNfF/667X+D/bew/w1234J+w3tvk/c5vwh+UcOb9cP6E9afaV5/vsN+Xfm/7vXnK+y/gf007kZxSJY4WrTEoVm/7vVn'
+    'E/brir+w/tS7/tRt/xvs15X/w/oT1p9pXn/ewf532E/z/mgfQJY8vmjZB5j1615/vsJ+XfFX9/pzBft17T/D+lPv+lO3/bew/w32'
+    '07w/2geQJY8vWvYBZv2w/oT1Z5rXn3ewX1f+r3v9eQP7dZ2/hfPvsP7Uuf7Ubf8t7NeV/8P6E9afKV5/uhfd+BPRAX/SjZ+P6EX0'
+    'OKVcfhI9TukXPP/iKP8C+19g/xTPTwW5SLn8FO2eatq3yWP7lNi/SHCr7XP5Ofp/rhm/c+idT+j4lWM/Hb/zBLfaPpefof9nmvE7'
+    'g97ZmMaPt8/7X439dPzOEtxq+1zuO35fkn5p+2eTN3r8TtH/U+gr1o+uSAuMT6PGr8D6G8avweN3gf7Xm/8nZ/wU+d8oP0f/683/'
+    '5JP/o8+JZvxOkn67jZ8i/xvlZ+h/vfmffNaPUsdPkb+Mct/xK2f9be74naL/9eavyRk/xfphlIfxa/b4XSR5rUukzv9G+X0bvwL5'
+    'X6KK/G+U1z1+Jxi/GvO/RBX5yygve/xs+VFtn+rM/17jx+sn1foq0/s1fuWcH96f8Suw/obxa/D4lZP/78/4FTj/LyH/U535v9Tz'
+    '8wLn/yXkf6oz/5c6fgXO/0vI/1Tn+lvr+JV9f9j08av7/jWM31jH7/joOP50B//AR8+7KR3+dbwF+ej5FmjvmPAeKfkR3dLwvcg6'
+    'JfZ7Oe1vWezY+rfF8G8x+z3Y1/cvbmePtbtnwZ2OT4x/j+HbS3FK9rc09m12DrR8/NGN72j8df07Yu0e5fR/n41/P8y/WuZfj+Hr'
+    'lTz/9rS83/zrs3b7Of1/wMb/IMy/QvNPZ+e+z78Dyzo76fNvi80/Pr5HbPz5/iDMv2bPvz02/nslrz+2/YFt/vXZ+PfD/Ktl/un6'
+    't2exU/f8s+0PbPPvgI3/QZh/heaffhzu9/yzrc91z7/R+B8xfEc5/R/m3/2cf3ts/Pc046/L827+P47yPMv7Yf6NYf712Pwru/60'
+    '9a+s+afL867z74DhOwjzz2n+lXP+0fz5p1tnmzL/bP7X7Q/C/Lsf86/q+wf9OYDb/NPtD8L8q3b+jef+ofr5pz8HcJt/uvU5zL8y'
+    'zj/u//wz37/WN/+O2PjXc/8f5t+kz79q7/+p5vv/MP/qvX+gmu//qeb7/+bPP7/6s7nzr5z7f6r5/v+45vv/MP/qvf+nmu//j2u+'
+    '/w/zr977L6r5/v+45vv/+z//zOcf93f+ud2/Htd8/0813/+H+Tep82889/9U8/3/9M6/qr9/7nb/cFzz/T/VfP/a3Pk36b9/GNf8'
+    '87t/rX/+1Xv/H+Zf3fOv3vv/45rv/8P8u++/fzXf/x/XfP9/f+df+P21y/1rbfOv1bprDT/UWm8lfPSHwA+faOXtVtxQuyD/APyD'
+    '2IzIO8nbrfiPdiv+tNG/tkpOWflj4H+M/jyGXOAjwzp50/EvAP8C+rMAucBHhnXy4P9m418H/jvor0N+J8oJcsrKy8NfjBfxEZnx'
+    'k9H/8Sf1b4v5P8bP5U3Hn8Z//Enju8XiP8bP5cH/zcbfT/J//Okn+V2QE+SUlQf/h/gP/m8u/lH+77P832f5v8/yfz/4P8R/8H/j'
+    '8d9BPsr/dyy/S3LKytsYvxRfi+GNDevk/vhH4znCRwy/Wf4Y+Ez+J6P/m41/AfhM8U/G+A/+bzL+deC7g1xV/5vkKX79+UPLcP5Q'
+    'Hv5ivOhfIrP/yej/ZuIX45vIHP9kjP/g/ybi7wv5nUhd/5vkwf8h/oP/m4t/lN/7LL/3Wf7XyYP/Q/wH/zcX/x34UX4XeCe57/3j'
+    'A4xfiq/F8MaGdXJ//xPJ/iXmf7O86fgXwKfxTSz+zfLg/2bjXwd/V5D3PX9M8cefFF+L4Y/Hj8vL838xvun403guxgf/Nxt/P8nn'
+    'xfjg/xD/wf/NxT/K5/2CfPB/iP/g/+biv2P5PC/ve//4AONjwk9G/H73r/7+bzZ+//gP/m8yfv/63/f7Tyk+IjN+MuIvdv5anv+b'
+    'ib+8+A/+byJ+//o/+D/Ef/B/U/H71//B/yH+g/+bib/d/tuOP0Ma80Qi/Wf4WKIk0Ud4nlISKEFPpCTReTxPKQk0sht9/kH/8tm3'
+    '9Z/aa7CbUpKouf+R3ejzCP3LZ78N3CIlgdrH7xGep5QEah+/Q9hNKUnUNn5m+/bxm0f/5tE/GX/188/s/+rnn3n+Vz3/CPFPiH9C'
+    '3Ke06vnnMP+j/v2D/uWzbx+/NfRvDf1bS547z/+of4/Qv3z2q17/7ON3CLspJYlWPf/m0b959C/f/Peff2voV0pF/1c///zWP9/5'
+    'h/xPxvxf6fxzmv9ktO81/9bQvzX0r1D+J6P9Gtc/+/gdon+HkBfI/17zbx79M8z/SuefU/6vcP75rX++8w/5n4z5v9L5Z17/YJ+M'
+    '9r3m3xr6Z8j/xvF7hP4Z7Ne4/tnH7xD9O4S8UP73mH/z6J9h/lc6/8z7v+rnn9/65zv/orzPqCL/Vzj/zOufU/3nNf/W0D9D/jeO'
+    'n0P9V+P6Zx+/Q/TPkP8rnX/m/U/188+8/6t+/vmtf77zjxD3IlXk/wrnn3n9c6r/vOafuf6zj59D/Vfj+mcfv0P0z5D/K51/Dudf'
+    'lc4/8/6v+vnnt/75zj+n/F/p/DOvf77nv/bxczj/N46f3/lv1eufU/63nf9XOv8c5n+l88+8/6t+/vmtf/73Dw75v9L5V+39l338'
+    'HPJ/hfdfVa9/Tvnfdv5f6fzzu//yn38O5/+Vzj+/9c93/nU6fzrx508n5WMa878h/y3wMY3agT7hfYJ+yv+G/LfAxzRu71+0/6/A'
+    'xzTmH0L+UOBjGrf3L9r/V+BjGvMPIX8o8DGN2/sP7f8n8DGN+WeQPxP4mMbt/Yf2/xP4mMb8M8ifCXxMJwP/a7T/WuBjGvOvIH8l'
+    '8DGN23uN9l8LfExj/hXkrwQ+psH/k4B/H+3vC3xMY/4z5J8FPqZxe/tof1/gYxrznyH/LPAxDf4P8R/8Xzf+PzEr5n9i+Z/SfM95'
+    'wvtS/ieW/ynN95yP8JKIl/MPwT9U8oT3JfzE8FOKl/ORv0n0N+efgX+m5AnvS/4n5n9K/c35+vG/RnuvNfwr8K+UPOF9Kf6JxT+l'
+    '8c754P+68e+jvX0N/xn8ZyVPeF/K/8TyP6X5nvPB/yH+g//rxP8n3h6Y63+y1P9kqf/JUv+TZf9Dlv0PWfY/ZNn/kWX/R5b9H1n2'
+    'f2TZ/9WI/zXaN+7/ybL/J8v+nyz7/+D/2vDvo31j/U+W+p8s9T9Z6v/g/xD/wf+14A/1f9j/h/1/qP9D/R/iP8T/tPl/ZubXTPwZ'
+    '0pgfPY/pLeS3kN8mz2N6A/kN5DfJcxc5wT7BPsFuSm8hv4X8Nnke0xvIbyC/SZ67yGdmnqJ/T9G/p8nzmM5BPgf5XPI8pk8gfwL5'
+    'k+S5i5xgn2CfYDelc5DPQT6XPI/pE8ifQP4kee4in5lZRf9W0b/V5HlMVyBfgXwleR7TZciXIV9OnrvICfYJ9gl2U7oC+QrkK8nz'
+    'mC5Dvgz5cvLcRR78/wn9+4T+fUqex3QX8l3Id5PnMd2BfAfyneS5i5xgn2CfYDelu5DvQr6bPI/pDuQ7kO8kz13kwf8h/qfb/79i'
+    'sTn/kyX/kyX/kyX/kyX/kyX/kyX/kyX/k8X/ZPE/WfxPFv+Txf9k8T9Z/E+W+CdL/JMl/skS/2SJf7LEP1ninyzxT5b4n2L/f0L/'
+    'jPmfLPmfLPmfLPmfLPmfLPmfLPmfLPk/xH+I/yn1/6/4sUAz+Z/RTP5nNJP/DXKCXZFm8j+jmfzPaCb/G+SR3xnN+J/RjP8Zzfjf'
+    'ICfYFWnG/4xm/M9oxv8GeRT3jGbin9FM/DOaiX+DnGBXpJn4ZzQT/4xm4t8gD/7/hH6lNJP/Gc3kf0Yz+d8gJ9gVaSb/M5rJ/4xm'
+    '8r9BHvwf4n+6/R/yf4j/EP8h/4f8H+I/xP+0+X929n+z8WdAI/7j7PCPiEJOEv3I6E/o/8T7H6D/AfzP5D2CXKY/oP8D77+H/nvw'
+    'P5L3CHKZ+upfQ/8a729Dfxv8dfIeQS7TZutT5O/ZmEb8/2Zjxf+B/5i8R5DL9AP0P+D9n9D/Cf5D8h5BLtP30H+P939A/wf498l7'
+    'BLlMffW3ob+N96+hfw1+O3mPIJdps/VnZ19i/rzEfHmJ+ZPyZKQvoP8C77+AfsqTkT6H/nO8/xz6KU8W6qe/BP0lvL8E/ZQnC22y'
+    'PsX+j2nCk8STkb6A/gu8/wL6KU9G+hz6z/H+c+inPFmon/4S9Jfw/hL0U54stMn6cb4fftJ8H8+fdD8g53u+H/gA/TTfx/rpfkDO'
+    '93w/8B76ab6O9dN8zvM9z+d++tvQT/NlrJ/mU55veT5tsj5h/yfm+1gx3Q/I+Z7vB35CP833sX66H5DzPd8P/IB+mq9j/TSf83zP'
+    '87mf/jX003wZ66f5lOdbnk+brB/yf8j/8fzxyv+znvl/1jP/z3rm/1nP/NtYfdT/5Fn/k2f9T571P3nW/+RZfzdWH/X/rGf9P+tZ'
+    '/8961v+znvX/rGf93Vh95H/yzP/kmf/JM/+TZ/4nz/zbWP2Q/6c9/3/E/PGq/8mz/ifP+p8863/yrL8bq4/6nzzrf/Ks/8mz/ifP'
+    '+p886+/G6of8H/J/OP+f3vP/xcXvi8MPLV4tjvj0+ZBuDInwfCOh8R9XsTqej9qJnw/f+8ba/5ZQuf1vBdv/ytr/mlC5/a+a9i9Z'
+    '+5cJldu/rKj9K9b+VULl9q8qaZ8W30ntD/kRFdtPn+dt/y1r/21C5fbfFmz/DWv/TULl9t9o2r9k7adUbv+yovY3WfubCZXb36yk'
+    '/cWhn4X2F+Hn+Hnafvo8b/tvWftvEyq3/7Zg+29Y+28SKrf/RtP+Bmt/I6Fy+xsVtb/J2t9MqNz+ZiXtE9b/xWRcvydUbD99nrf9'
+    'b6z9bwmV2/9WsP2vrP2vCZXb/6ppf4O1L6yvUvsbFbV/xdqX8xsJebCK9qM8LzyX8r/QvjL/O7X/jbUv5H+p/W8F2//K2hfys9T+'
+    'V037l6x9Rf4Xnpff/hVrX8hvUvtXlbRPWP+V+V9o35j/je2/Ze0L+V9q/23B9t+w9oX8LLVvyM9S+8L6KrV/WVH7m6x9Ib9J7W9W'
+    '0j7y/6Ix/0vP87b/lrWvyP/S87ztv2HtK/Kz9Jy3v8HaF9ZXqf2NitrfZO0r8r/0vNz2KVnnFflfaF+Z/53a/8baF/K/1P63gu1/'
+    'Ze0L+Vlq/6um/Q3WviL/C8/Lb/+KtS/kN6n9q0rad8z/i8b8b2zfKf8vGvO/sX2n/L9ozM9S+8L6Ss7536N9p/y/aMz/Hu0j/y8a'
+    '87/0PG/7b1n7ivwvPc/b/hvWviI/S895+075f9GY/73a32TtK/K/9Lzc9heTcx5F/ifn/L9ozP9S+0L+J+f8v2jM/1L7Qn4m5/y8'
+    'aMz/wvPy299k7Qv5jZzzf+H2HfP/ojH/G9t3yv+LxvxvbN8p/y8a87PUPj9fdcr/Hu075f9FY/73aB/n/+R1/m/L/1L7Bc7/bflf'
+    'ar/A+bwt/0cNXVbU/hVrv8D5v0f7Tuf/tvxvbN/h/N+W/43tO5z/2/Kz1H6B83+v9h3O/23536N9p/wf1Zce5/+2/B+173H+b8v/'
+    'Ufse5/+2/O/VvkP+j9rfrKR9nP+T1/m/Lf9L7Rc4/7flf6n9Aufztvwv3a+W3b75ftvp/N+j/W73ojv8UPekO3wc8dEfAj98opWf'
+    'R3TIR6+JvJP8rBv/MWrvjLVvl6ftDz9nmfYFOWXlp8D/Be2don2BjzqulxP4GJ/AO8rjP0z2ydH+8GOy31XYP2H4T1j7Jwx/Vi7j'
+    'O8m0b5PL+FT2ydH+8GOy39XYn2b8Xxj+L6z9Lwx/Vi7j+5Jp3yaX8ansk6P94cdkv6uxPxRcJPpxwxeinCAnlTxu75z1x52PGzpL'
+    'xicWnLHx0csJPBXkY2CnDP8pw3/K8J8y+6esfXc+buiU4Ttl+PVyf/tx/pPxnzD8Jwz/CbN/wtp350f5TcZ3wvDr5X72L1j+vGD5'
+    '8YLlz4tMfpf3D+eZ/YG8fzg35G8ic/5Wy/32D775s+n7h5A/pxt/Wfmz6fuHi8J8jP+c5Y9zlj/OWf44LzF/l7F/8M2fTd8/+OTv'
+    'Ju8fLlh+VNX/5Fj/Dz+m+r+rqf/F/YMqf3cd6/8i+4e66++69w8hf043/kmpv+veP1yw9fHCWe5f/w/xn7H8ccbyxxnLH2cl7x/q'
+    'rr/r3j/UVX/XvX+4YPnRVP+Tpv4nMtf/5Fj/Fzm/990/NP383nf/EPLndOO/L+f3vvsHn/of9byUH87Z+Ojl5Zzf++4fmn5+77t/'
+    'aOr5vd/+4fj46Dj+dI+PI35Aj0ET/ph0coI+JXwsl/lj0smH9gntFqEEfUr4fPT4uO+Jv++Jv++Jv++J/wD4jwriPwD+o4L4D9CP'
+    'o4L4D7zmQYq/74m/74m/74m/XxD/HvAfFMS/B/wHBfHvJX4ohn+PjUPAXwz/nif+PU/8e5749wL+Qvh7DP9RTvw9hv8oJ/4ew3+U'
+    'E3+P4T/yxN/3xN/3xN/3xN8viL+X5KMY31FO/D0hH2Ie5MLfY+vgUU78vUL7AT3+vif+vif+vif+fkH8e8B3UBD/HvAdFMSfLx9m'
+    '8efLhwG/Dv+eJ/49T/x7nvj3An4n/FsMfy8n/i2Gv5cT/xbD38uJf8syDgG/G/4thr8n7Add8G8x/D3xfMgBv24cjhzx68bhyBN/'
+    '3xN/3xN/3xN/3xP/AfAfFcR/APxHBfGb94N2/Ob9oDv+vif+vif+vif+fkH8e8B/UBD/HvAfFMRv3g/Z8Zv3QwE/x7+lwb/niH9L'
+    'g3/PEf9Wrv1QFv9Wrv1QwK/DL8aDiP/IEb8YDyL+I0f8unE4csS/5XQ+lB9/3xN/3xN/3xN/vyB+9fmQO371+ZA7fvV+wB2/ej9Q'
+    'HH/fE3/fE3/fE3+/IH75fCQ/fvl8JD9+OR/mxy/nw4C/WxC/VN8WwJ/m02L4eT7Li38v4JfwdzX4txj+ngZ/V4N/i+HvafAXG4ds'
+    'XZtvHAJ+V/zq+sgdv7o+csevHgd3/OpxCPgD/oBf9f23ovi7nvi7nvi7AX8p+Lsa/FuO+Lsa/FuO+N3Gwf49B/M4BPxF8W954t/y'
+    'xL/liX8r4A/4A/6AP+B3+v1DUfxdT/xdT/zdgL8U/F1P/F1P/F1P/N2AP+AP+AP+gN8Lf9cTf9cTf9cTfzfgLwV/1xN/1xN/1xN/'
+    'N+AP+Kcef6vVuhv8aw3+WG8lfPRHxA/+GNE7FT94vw39dspHf7TxnpEO3n8A/QcpH/3xAO8ZaQn2H0P/ccpHfzzGe0Z6D/AvQH8h'
+    '5aM/FvCekQb/Nx7/OvSjdSDmI0G8DlCrz+Je4iX78Se138qJP/6k+Fs58Rezn/o//qT+b+X0fzPxp/Eff9L4b+WM/+D/JuLvJ/k/'
+    '/vST/N/Sx/2ID/4P8R/832j8o/zfZ/m/D/24PhD3/a2c+T/WT+22cuKP9VPcrZz4zfbt/o/1U7+3cvp/svHb4z/WT+O+lTP+g/8n'
+    'Gf9dLE7y/10m/8cvpOtAK10HYJ+c7Cc07QfwkxP+hKbjUIL9x9C3+z+h6Ty4B/gXoG+P/4Sm60Dwf+Pxr0P/Ll5GFPV/EvcR7afr'
+    'QsY+eeInT/zk6X/y9H8T8YvxT57xH/zfPPx9If+Tsv5P4l7K//3g/xD/wf+Nxz/K/32W/8X6n9UBufM/eeInT/zk6X/y9P8k43eJ'
+    'f/KM/+D/ycUf3+un+V/gk/zP1gFW/xPJ9klrn5T4iWT8pMVPSvx+9h/j/dT/pPU/Kf3fbPwLeD+Nf9LGPynjP/i/yfjX8f5dch8g'
+    '8Nj3i+tAtv6n9PsGnM+Fn7J8LvzF7Kf+piyfy//NxJ/GO2X5XPEf/N9E/P0k31OWl+Neyv/94P8Q/8H/jcc/yvd9lv/7me/9juoA'
+    'ypn/eT8oJ34+DpQTv9m+3f98HlBO/082fnv883WAcsZ/8P8k479j+f8uk/9t3/93ta/7/pMrft33n/zsu/tf9/2vZuN3j3/d9/+C'
+    '/5uM317/277/H/wf4j/4v6n47fW/7fv/wf8h/oP/m57/7fW/gg/+D/Ef/N9c/O12++/gX3vw1z/D/1LKz7ej94bPI4HED/79A/5R'
+    'O34g8YPPo+T9iMh8pN+O6DzkI/vz7aRflNoBL9gZ6T9C/0b6I/5Roh/jeZToj/DG7awl+gKf9IvwPuMl/CT16xH6/4j1/5HYfxv+'
+    'uB9J/xOeUl7E32b420m/Uv890vjvkPnvEPjmmf/mNf57xPrvhF/o/zzz34g/ZP471PjvEfPfI+B7xPz3SOO/Nea/NfR/nvV/XuM/'
+    'JX42/4jNP46/zfC3k36R4P8K4m/w11+p/+Bt+EuMv3nmvxH/V/If413jT8LfVs7fNea/tbQfkv/my4w/hpePR7vdFvxNUr+4/x4x'
+    '/+WNv0Pmv0MRr+C/+Tzxx/Dy8RD9N8/8N1r/D5n/DjX+842/Nea/NZf8x/Dy8cgTf/PMfyP8a8x/a1XEX5Rn5X7+lfxCgv+riT99'
+    '/ifBf21xnXKPP0M/xXzP9wPO+a9o/LVTOg98wjrb5vm/zfK/6D/dPHONv0M2Lofi+i/hb+fM/7L/Hmn8p8t/h8x/hxr/+cbfGvOf'
+    'e/4nIf4kP+eKP908W2P+W6si/qK8Ouq/wLfTOBz5b76i+FPmv7gf0nt/Nf03xl+yXjNe8N8a899anvxXNP6S8ZLW1ez6L+V/HX7Z'
+    'f9L+1yH+Dpn/DsX13pCnjfGXzHfpea78d8j8d6jxn2/86fZZxvwn+OsR81/e+Jtn/psHvjXmv7Uq4s+Y/9s8TiuJP2X+Y/m/zfK/'
+    'c/wZ8bf5Optd/235r2j8Mfxthr8t9ENXp9rxu8XfIfNfNv+P1v8c8cfwtxl+l/xnz//lxN8a89+aS/5j+NsMf5740+f/Nt+nlh9/'
+    'yPfi+cFfcf8r+G++ovib1/Du+d8Qf7bzn6T+k/O/c/4rGn+58v9o/W/nP/9xiL9D1v9DVofr8RviL1f+V+e/Q+a/Q43/fONPn/8N'
+    '+S/X+mOOv3nmP+n8R/DfWhXxh/N/Yuf/+fK/X/wp85/T+b9D/NnOf5zyvyH/FY0/p/N/W/53OP9xyv+y/w7z3H/o4s/p/NGW/2X/'
+    'HWr85xt/a8x/ay75z+n80S3+dPcf7vnfI/6k83/Kef5fTvzp87983vq3ovtH/fm/Q/4rGn+2+w8pL4nrf0n3j0753+H+w5j/3e4f'
+    'dflP1y/383+3+Ftj/ltzyX8l3j/q7j/s5/8lxF+n0/nTiT8DOtSL+ZhCTimNnosU+qTRp47wnkJ/8Oor2H8F/VfQfwX7r5L3CHKR'
+    'Qp80+tQR3lPoD159HasPafQ84mMKOaU0ei5S6JNGnzrCewr9wbufYf8z9D9D/zPsf07eI8hFCn3S6FNHeE+hP3j3X4z/v9D/F+P3'
+    'L+z/m7xHkIsU+qTRp47wnkJ/8OpD2H8I/YfQfwj7D5P3CHKRQp80+tQR3lPoAz8x/JQTP5FG3xE/MfyUEz+RRt8B/38Y//+g/x/G'
+    '7z/Y/y95jyAXKfRJo08d4T2F/uDVZ7D/DPrPoP8M9p8l7xHkIoU+afSpI7yn0Ad+YvgpJ34ijb4jfmL4KSd+Io2+A/4Q/9Md/68x'
+    '/mL+6uTMfx3S6Dvkv9+w/xv6v6H/G/Z/J+8R5CKFPmn0qSO8p9DH/ofY/ody7n+INPqO+x9i+x/Kuf8h0ug77H9C/If8H/J/yP8h'
+    '/qcz/vcx/vvQ38f47cP+fvIeQS5S6JNGnzrCewr9UP9H+xVi+x/Kuf8h0ug77H9C/If8H/J/yP8h/kP9X0f9/xn2xfPrTs7z7w5p'
+    '9B3Ov/cx/uL+hXLuf4g0+o77n1D/h/gP+T/k/5D/Q/yPNf5nZmZ+Df7NDP6KaMRHclAmJyYfPJqDfA76c5DPQV+SE5MPHi3PxC9G'
+    'NOIJfKwvyYnJB+8/QftPYP8J5E+gL8mJyYGfgI80+BO5Bj8BH2nwJ/KK8BPwkQZ/Ilfgf4r2n8L+U8ifQl+SE5MP3r/F+N5i/G8h'
+    'v4W+JCcmL8F/vuNXBn4CPtLgT+Qa/D7+88W/ivFdxfivQr4KfUlOTB7Pf8znGdLM/1SumP83aP8G9m8gv4G+JCcmL2H+rGJ8VzH+'
+    'KvyJvCL8BHykwZ/INfjrjP8VjO8Kxn8F8hXoS3Ji8rj/6M8MafqfyhX9950/ZeAn4CMN/kReEX6f+fMJ4/MJ4/cJ8k/Ql+TE5CXM'
+    '/2W0vwz7ivUrlavzn9f4fcL4fML4qfAn8orwY32e0azfqbwC/L7zfxf+2YX/diHfhb4kJyYvof++86cM/AR8pMGfyCvC7zN/6s7/'
+    'O2h/B/Z3IN+BviQnJi9h/OrO/ztofwf2VfgTeQX4m57/fedP0/O/7/z5hfZ/wb6i/k3l6vq30fl/EvDXnP8jzacYf8X8T+Xq+hf1'
+    '7Axp6t9Urq5/687/M4jvGU38p/IJxe+Z/5HPZkiT/1K5Ov95nf/doP0b2FfUL6lcXf/65n9v/D7nf3Xj943/FbS/AvuK/JfK1fnP'
+    '6/zGd/x8478M/D7nN774P0H+CfqK+jeVq+vfRp//l4G/4ef/XvG/i/7tov+K+jeVq+vfus//veK/DPw1n//Xmv930P4O7Cvql1Su'
+    'rn99z/9rzf9l4K8z/uvO/77j1/T874V/dnb2f7PxZ0CjBxFP4Ad//oT8J+Q/If8J+Q/If0D+A/IfjvJryK8hv4b8ekzy/81SSonR'
+    'CLdAidEIl0CJUQf5tUiJ0THIX2J8XmJ8XmJ8XmJ8XkD+AvIXkL+A/DnkzyF/DvlzR/kS5EuQL0G+NCb5y2QcCPgFGuEWKDEa4RIo'
+    'MeogXxIpMToG+UeMz0eMz0eMz0eMzwfIP0D+AfIPkL+H/D3k7yF/7yjfhnwb8m3It8ck/5iMAwG/QCPcAiVGI1wCJUYd5NsiJUbH'
+    'IA/xP93x/794OKT8Tyz/E8v/xPI/sfxOLP+b5NeQi/mZWP6uUh7yfzw+YvwTi39i8U8s/onFN7H4N8mXIBfjk1j8VikP+T8eHzH/'
+    'E8v/xPI/sfxPLL8Ty/8m+TbkYn4mlr+rlIf8H+J/auN/8Edc7xPyf5b/Cf6nhv8B/kdB/hr8dU38/5JxUNOfFvrDk17XTF9iPF5i'
+    'PDj/AvwLDf8c/POC/BL4pZr4l8k4qOkLC33uSZdqph8xHh8xHpz/AP6Dhn8P/n1Bfhv8dk38x2Qc1PSDhb73pNs10xD/0x3/cb0v'
+    '539i+Z9Y/ieW/4nl9zz8NfjrmviQ/+PxEOOfWPwTi39i8U8svvPwS+CXauJD/o/HQ8z/xPI/sfxPLP8Ty+95+G3w2zXxIf+H+J/a'
+    '+F9cXPw++Lc4+Cui4Ak85ASe1DyBp0L8N9j/BvvfYP8b7H+DvW+wl+UJPBXiv8L+V9j/CvtfYf8r7H2FvSxP4KkgX6/9K9i/gv0r'
+    '2L+C/SvYu4K9LE/gqSAf7Ndp/xL2L2H/EvYvYf8S9i5hL8sTeCrIB/vBfrBfi31i+Z9Y/ieW75W8kM8L8FL+J5b/ieV7JS/k8wK8'
+    'lH+J5V9i+VbJC/m0EF+vfSn/EMs/xPKNkhfySSE+2K/TvrT+EFt/iK03Sl5eT/LzwX6wH+zXYn9g4x3sv8P+4x3sv8P+4x3svcN+'
+    'I8sTeCrEv4X9t7D/Fvbfwv5b2HsLe1mewFMh/g3sv4H9N7D/BvbfwN4b2MvyBJ4K8vXa34T9TdjfhP1N2N+EvU3Yy/IEngrywX6d'
+    '9jdgfwP2N2B/A/Y3YG8D9rI8gaeCfLAf7Af7tdgnlv+J5X9i+V7JC/m8AC/lf2L5n1i+V/JCPi/AS/mXWP4llm+VvJBPC/H12pfy'
+    'D7H8QyzfKHkhnxTig/067UvrD7H1h9h6o+Tl9SQ/H+wH+8F+Lfa73e5FN/586XYj/ks3fn7Sjd6L5QMaySMaP4/l0CfoE/TJUT+2'
+    '243tyfZP8V4kj96X9U9hJ5ZDX7DvpD+QnVvwn1vwn1vwn084/jML/jML/jML/rOAf6LxnzL8F0m/Ru/J/b9I2h3ZkfFfJP1y0Dfg'
+    'P7H0/8SC30lfgf/cgv/cgv/cgv98wvGfWfCfWfCfWfCfBfwThf+E4T9l+E9Y/08Z/hOG/5ThN+pj/0GW/QdZ9h9k2X+QYf2tG/+5'
+    'Bf+5Bf+5Bf/5hOM/s+A/s+A/s+A/C/hz4T+x4D+x4D+x4D9h+E8ZftX+gyz7D7LsP8iw/5g0/OcW/OcW/OcW/OcTjv/Mgv/Mgv/M'
+    'gv8s4M/sP7pxHlbi/4L+X2jwfwH+Cw1+oz7GnyzrL1nWX7Ksv2RYf0f4zy34zy34zy34zycc/5kF/5kF/5kF/1nAP9H4T9n+44L1'
+    '/5TtHy4Y/lO2/3DSV+A/seA/seA/seA/ccR/bun/uQW/k/4E4z+z9P/Mgt9JP+CfGPym88eu5fyxazl/7BrOH0fnH6b9B1n2H2TZ'
+    'f5Bh/zEp+M8t+M8t+M8t+M8nHP+ZBf+ZBf+ZBf9ZwJ8L/4ml/ycW/E76An7T/oMs+w+y7D/IsP+YVPznlv6fW/A76U8w/jNL/88s'
+    '+J30px3/8fHx0XH86R5Hzwc0+uO4fxzLIz56L5FHT+L3j2Neod8V9UmSG/W3mP6WRn+L6W9NiH6P6fc0+j2m39Po7zH9Laa/Bf09'
+    'yA+gvwX9A+hvMf0Dpn/A/CfgU+p3RX3K+l+n32P6PY1+j+n3StLfY/p7Gv09pj8a3yNRP57fx6TQPxL1jzXz36AvjK+TvnL+GvS3'
+    'JlS/x/R7Gv0e0xf8K+nvMf3R/N1L4/tY9O8Bm7996CvjR9Dvq+a/sH4q42ekf6yJH4V+j+n3NPo9pt8rSX+P6R9o9PeYvrC+HBNb'
+    '/yln/jDpu6zfbH06ppzr/zj1e476vRz5h62Px8y/1vwjro+j+TuKnz6bv0eK/JHsLwT9oxz5h60vyvXTlH/Y+qLUN+Uftr446Qvr'
+    'i6R/oNE/YPrK+MH6d2zIH6r8Y9J3Wb/Z+hTpb02Ivkv+YOtbpN8rqL/F9HX5Z0sVP4K+sL+w5o9kf3Gc7t+6OfIPW59y6feYfk+j'
+    'b8ofbH1R6vP8oYyf4yg/K/UPmH4/1C+11C89x/qFx4+tftmrqX7Zcqw/tia0fukz/SONfp/pHxWsX/LWP9Nev/Qc65eeY/1y4Fi/'
+    'HExp/bLnWL8o639D/XJUsH7pOtYP3YbUL3n1665f+PlZX1N/HDD9fkPrl7z6e471y16oX0rR7znq90qqf1zOz0z1S5/N3yNN/dFn'
+    '+kcNqV96jvVLz7F+OXCsXw5C/TIR9UvXsX7h+cdWvyjrf0P9cVRS/TLu+xvf+uWA6fc1+vz8rB/ql1rql55j/aKs/w31y15N9cuW'
+    'Y/2xNaH1S5/pH2n0Tff/4f6muvql51i/9BzrlwPH+uVgSuuXPcf6Raz/XeqXo4L1S9exfug2pH4Z9/2Nb/3icv9P7PzsOOf9/yTV'
+    'L773NweO9zehfimm33PU75VU/7icn5nqF5f7/2N2/3+c8/5/kr5/tueor6tfDhzrl4NQv0xE/dJ1rF9M9/+m758dOdYfRyXVL+O+'
+    'v/GtXw6Yfl+jb7r/D/XL+OqXnmP9kuf+X3V/M676Zcux/tia0Pqlz/SPNPqm+/9wfzO+75/p6peeY/1y4Fi/HExp/ZL3+2dHivX/'
+    'OOf9f576Z8tRf+ue1D911y8u9/+q38/0G1q/+N7fHDje34T6pZh+z1G/V1L94/v7GZf7/2N2/0857/8n6ftne476uvrlwLF+Cb+f'
+    'mYz6petYv5ju/03fPztyrD+OSqpfxn1/41u/8N/P9B1/P9MP9ctE/H5my/H3M7b6Za+m+mXLsf7YmtD6Rar/W4PP3eDf8K+IDv49'
+    'aFEkedCK5W3IY0oDGjWU0Ad4PqRoj9Ae9OP22ml74GPBY7TzOG0vpcw+b4/bz7TH31fYX8D7Cwr7GfwKPA8gH9nn7aXjNup/an/I'
+    'P0Z7j9P2MP4tUo13O3keK4j2eXvcfqa9wbN1vL8OPo/9DH7Wnsv8eZz4Lf6I9l3mz4PEb0l7KXWYPwuJ30bzSGjPYf5w+wvJvHKb'
+    'P48hf6yy7zB/eLw+hvyx4/zpw34/Gf+0PZf5I70ft0doz2n+SPhLWH9E/C7zxxT/RdYfqT2H+WNa/4qsP7w92/zh8eq7/kjricP8'
+    'kdarEtYfvp7a5o8Y/2WsP2L8u8wfcf0rY/0R1z/b/Bn+cQe7dyWsP2hHorb5I8Z/GetPnvVvaG8B9hcU64/VvmL9WYD9BcX8yeCf'
+    'gP3PKE7XC6w/Kvu8vTz7nwz+Mex/FvD+Qknrj9Sew/zJs/9RzR/f/U8f9vslrT+jvN93nD/G9a/A+iPhd5g/YvyXsf6I8e+7/ymy'
+    '/pj2P6r5Y4r/IuuP1F7F+x/r+ucwf3i8+q4/ueK/4v2PzX5crxPq9ez+L+/6w9trwv7HVP/Z9n+q9ULa/ynGm+Ope/+zDvvrBdYf'
+    'Vf25DvvrBfY/LQWeST7/sdV/LvMnz/5HNX989z99vN8vaf2R2nOYP6bzryLrD19PJ/n8x7b+FVl/TPsf1fwR47+M9UeM/6r3P7bz'
+    'L5f5w+PVd/0Z5/mPbf1zOb+4S+p2//VH1d6k73/E/Vru8y9FvPJ6Ms/5dx37n/Vk355//VHZX0/qivz7H1v9N2nnP6r1J0/9l3f/'
+    'Y6v/iux/+kndXs76I7bnff9XYP0x1X+Tdv7jff+Xc/+jas8U/0XWHzH+q97/WM+/HOaPFP8lrD/jPP8p4/5PvP/3Xn/Y/X8T9j9e'
+    '93857/8z+Cdg/1Pp/V/e/Q+3P+HnP973f3n3P4r547v/Ee//y1h/8tz/W8+/Cqw/Ev4JP//xvv/Lu/9RzJ8qv/9T+f7Hdv6V8/6/'
+    'jPVnnOc/Zdz/5bn/t64/Oe//J2H/43X/p1h/pP2f5/3/OPY/ld7/5d3/5Lx/q/38x/f+L+/+J+f9v8v8Md3/F1l/xPt/7/u/AutP'
+    'nvv/2s9/fO//8u5/ct7/+37/p/bvfzvMH5/7/9rPf0q4/+P39V7rj+L7BJO+//G6/8t5/2/9/ncN+59K7//y7n9s3/+etPMf3/u/'
+    'vPsf2/e/C+x/xPv6MtafPPf/1vOvAuuP8fvfk3b+43v/l3f/o8BT5fd/av/+d877/zLWn7Ge/5Rw/5fn/t/l9yd57v8nYf/jc/+n'
+    'ildeT/rc/49j/1Pl/V/u/U/O+7faz3887/9y739y3v+7zB/T/X+R9Udqz/P+r8j6k+f+v/bzH8/7v9z7n5z3/97f/6n5+98u88fn'
+    '/r/28x/P+7/24PO3HX/+tgdPwdOIHzyJ+Iiq+Hb7n5gdUBVP4EnDt9uPovaGVMUTeFLyw37/E3c3bg88td3sD/XmgX8e+vPAP4/3'
+    '52FPzTcf/xrwr0F/DfjX8P4a7Kn54P+m4z8E/kPoHwL/Id4/hD01H/wf4j/4v8n4/0JfyP/E8j+x/J/wsN9m9tvMfpvZbzP8xPAT'
+    'w08Mv8DDnjz+bTb+WvvwPzH/E/M/Mf8n/H3Avwb8QvwTi39i8Z/wwf/Nx38I/EL+J5b/ieX/hA/+D/Ef/N9c/MP3/uL9v0reXP+X'
+    'sf94hPF7BP1HGD+X/U8Z+6954J1X8ub9333Avwa8a0revP8P/m8+/kPgPVTy5vo/+D/Ef/B/s/H/xft/lby5/i9j//UI4yfgJ4Zf'
+    'u/8pY/81D7zzSt68/7sP+NeAd03Jm/f/wf/Nx38IvIdK3lz/B/+H+A/+by7+zuDzZ/BvwEc05qP3Ijrkn0H+DPJnkMe00/mvE/8R'
+    '0yFP4GP5b8h/Q/4b8t8x2/kX7Uc04mP5v5A/hPwh5A8hf4j2JX1i+sT0iel3WP87rP8D/jPknyH/DPlntP8a7b9G+68hfw35M+g/'
+    'A35x/DoMf6cYfrzfIQ1+vN8hjn9o7zXkr+Pmpf7D/0n/Nf7vYPw6Kv+/gvwV5K8gf5X6P+0/w99h+Dsl44f/0/4r/C/1v8P6T3L8'
+    'xHwaP/B/Ej8a/yf91/g/7X/J839obx/yfYzvPuT7JcW/FD8kx48Nf4fh74w5/of2fkP/N/BL6xfJ8ZM3/kta/2zz3+h/U/wTi38q'
+    'Of5t61/d8d+J4x/97YCX41+Mn5hP48cW/7b1zzH+vfBL6xfL/8Tin4rl/yR+eP6vO/47zP8dhf8/Q/4ZckX+ryz+x7H+Sf2vJv6T'
+    '+Mkb/+PY/4jzt1Mg/n3y/yTsf6T1i+V/x/g3+l+MH57/S1r/bPPf5n9t/BPL/1Ry/p+E/Y8p/svY/5nifxL2P6b4Jxb/VHL+r3v/'
+    'g/of61WHNPW/V/1nyv+TsP+x1X/S+lUs/090/SeeX3QmLP7rrv9c4l+MH03+n+jzn33I9zG+ivrfK/5N+b8J9Z94fqmp/23nf1XX'
+    'f177H1P8l1H/Oez/J/r8Rzy/0NT/Sfxo8n/V5z9e+KX1S13/e9V/pvP/Sdj/2Oo/8fyyU+z8f6LrP6n/1cS/7fyv1v2P7fzHFv8+'
+    '+X8S9j/S+qWu/23xX/j8vwn1n7R+lZz/J2H/Y4r/uu//JuH8x3b/55P/697/zAw+v2biz68Zih4MeQI/fH4L+S3kt5DfQn4D+Q3k'
+    'N5DfOMiHTyJ7EVXzt+BvNfwN+JsC/LBfT9G/p+jfU/TvKeRzkM9BPgf5HORPIH8C+RPInzjIh0+eoj9PNfwc+DkN/wT8kwL8sF+r'
+    '6N8q+reK/q1CvgL5CuQrkK9Avgz5MuTLkC87yIdPVtGfVQ2/An5Fwy+DXy7AB//PzHxC/z6hf5/Qv0+Q70K+C/ku5LuQ70C+A/kO'
+    '5DsO8uGTT+jPJw2/C35Xw++A3ynAB/+H+J92//+KuyPmf2L5n1j+J5b/ieV3YvlfK0e+J5b/ieV/YvmfWP4nlt+defifmP+J+Z+Y'
+    '/4n5n5h/iflfK4e/ifmfmP+J+Z+Y/4n515lH/BOLf2LxTyz+icU/sfgmFv9aOeKdWPwTi39i8U8s/onFtzMf/B/le2L5n1j+J5b/'
+    'ieV/YvmdWP7XypHvieV/YvmfWP4nlv+J5XdnPvg/xP80+3/YkbjeRv5X8LfgbzX8DfibQny99f+wH0/Rn6cafg78nIZ/Av5JIb7e'
+    '/d+wH6voz6qGXwG/ouGXwS8X4uvd/wf/o94n5H8Fvwt+V8PvgN8pxNdb/wf/h/ifdv/H9baU/4nlf2L5n1j+J5bfc/D11v/wNzH/'
+    'E/M/Mf8T8z8x/+bg69//raI/qxp+BfyKhl8Gv1yIr3f/H/yPel/O/8TyP7H8Tyz/E8vvOfh66//g/xD/0+z/2cHnf4N/w7+GNOaH'
+    'YtAB/3E2/uNj/NqAEvhY/yf0f0L/J+Q/of8B+h+g/wHyD9D/Af0f0P8B+Q/ov4f+e+i/h/x9SfrX0L+G/jXk19Dfhv429Lch374H'
+    '+sM/Yv+KlCT6PzxPKUn0A56nlCT6E89TShJ9j+cpJYn+wPOUkkR99bfxPKUk0Ws8TylJtMn6w/nyEvPnJebPS8yPl5g/LzF/XmL+'
+    'iPLh+y+g/wL6LyB/Af0X0H8BfVE+fP859J9D/znkz6H/HPrPoS/Ky9Bfgv4S9JcgX4L+EvSXoC/Km64//OMl5kVKiVGz/AWep5QY'
+    'Ncuf43lKidFq5Ut4nlJi9P7KZ+P8Pov8PjvL8jux/QGx/cFsnN9nkd9nZ1l+J7Y/ILY/mI3z8yzy8+wsy8/E8jux/F6G/jbk29CX'
+    '8iPLr8Tya9P1kddnZSrnd9v+4Cf0Uirnd9v+4Af0Upo7v3vpX0Mvpbnza2P1HfN/Ii+Y/xN5wfyfyAvmf6O+Q/5M5AXz78TqI6/P'
+    'yjR3/p+Vae78PyvT3PndS38JeinNnV8bq4/6H/l8ljT1f7I/0NT/yOezpKn/k/2Bpv5HPp4lTf2e5HdN/e+lfw39a+gr6uckv2rq'
+    '78bqI6/PyjRT/xv3Bx/wPKWZ+t+4P3iP5ynNnd+99LfxPKW582tj9WdZfV8w/yf1fcH8n9TnBfO/l75YHxfMv43Vd8z/RrlD/jfK'
+    'HfJ3pXKH/Hlv5bPsfF9T/yf7A039n5zva+r/ZH+gqf+T83lN/Z7kd03976Uvno9r6uckv2rq78bqu5zv2/YHtvN92/7A4Xzflt+9'
+    '9B3O1235tbH6jvnfdv5vy/+2839b/rad/3vpO+RP2/l7Y/Udz/9t+d92/m/L/5XW9w75/97W9zb9xcHn+2L8+b44fBzzMY3l3yD/'
+    'Bvk3yL9B/hXyr5B/hfyro/wK8ivIryC/GpP8EvJLyC8hv5wC+fBB7G+C/7P8N/DfNPxX8F8L8lfgr2riL8FfTiE/nBfvMD/eYX68'
+    'w/x4B/lbyN9C/hbyt5C/gfwN5G8gf+Mo34R8E/JNyDfHJN+AfAPyDcg3pkA+fPAO8+Gdhn8L/q2GfwP+TUF+E/xmTfwG+I0p5JH/'
+    'ieV/YvmfWP4nlv+J5Xdi+d8ov4JcyM/E8nel8kvIhfxILH/eWznyPbH8Tyz/E8v/xPI/sfyei78Cf1UTfwn+cgp55H9i+Z9Y/ieW'
+    '/4nlf2L5nVj+N8o3IRfyM7H8Xal8A3IhPxLLn/dWjnxPLP8Ty//E8j+x/E8sv+fiN8Fv1sRvgN+YRh71P2nqf0L9T5r6n1Dfk6a+'
+    'd5FfQa6qz8chv4RcWR/fd3mo/6e6/ifU/6Sp/wn1P2nqf0J9T5r63kW+CbmqPh+HfANyZX183+Wh/p/q+h/5n0hT/yP/E2nqf+R3'
+    'Ik197yK/glxVn49Dfgm5sj6+7/JQ/091/Y/8T6Sp/5H/iTT1P/I7kaa+d5FvQq6qz8ch34BcWR/fd3mo/6e6/u8OPheDf8O/hjTm'
+    'h+IRpe6XSC7S0fNY/0v8OKIxT+Dj9067XUYppbF+F/pdUut3ZSrrX8D+RdyMqv+Myv0/h/1z4D+H/nlD8J/D/jnwK/pvxH8G+2fA'
+    'fwb9s4bgP4P9M+BX9D/gN+A/hf1T4D+F/mlJ+E9gN6WUUgf8J7CbUln/FPZPgV/R/4A/4A/4NfhPYP8E+E+gf9IQ/CewfwL8iv4H'
+    '/AF/wF8Q/wXspnT03A2/yb4LftP4u+C/gN2Uyv234T+H3ZSOnjcD/znsplTuvw3/GeymdPS8GfjPYDelcv+nHb9ov5uz/uiy+rub'
+    's/4mdv5AOc8fiI0/5ay/ysAv1t/dnPU3sfMHynn+MAn4xfqzm7P+JFZ/U876O+CvHr9p/9Fl9Uc3Z/1BrP6inPWXC37T/ivgD/gD'
+    'fj/84v6jm7P+ILb/opz1V8Af8Af81eK3nX/Y8Jvqbxf8pvMHF/y284+q8Zvqbxf8pvOHJuA31Z8u+E31d8Dvh/948Dka/Bv+NaTD'
+    'T/d4KI5pzB+DPyYuH/7RPY5fSOnoeSJnVJAz+8TbZ/apZPvAd4z2o88W2t+CfAv2t4C/B3kP7WzBbkpHz2Pag90R3cPzvRRfYp+Y'
+    'fWL2qWT7QzwHsH8A/Edo/2hM/hftE7Nfh//5/Of+l/xTYPx7yXO1//n85/4v0/4Qzx7s7wH/Ado/GJP/RfvE7Af/j9//e2h/ryb/'
+    'i/aD/6v3fw/2ewX9fwS7RwX9L9ov4n8f+2X4n88/Pv5bsLtVkf997Kv8L+4vXPx/ALsHiR9Gfinmf2l/4+B/H/tV+J/PPz7+kn8q'
+    '8H8e+2X4fw929xI/jPwyHv/72A/+L9//Un1Tg//z2A/+P8a+IaYq/x/B/pHG/z3Y7RX0v2hf5X/RPpVs38X/fP6P2/98/lftf37+'
+    'cQD7B8Av1eeK8Zf2NwX8z88/RPtUsv0i/s9bf5Tt/zLtu/h/D/b3gF+qz8fgf9E+lWw/+D+//6X6rAb/l2k/+N/u/x7s9zT+5+cP'
+    'fPyPYPeooP9F+1Sy/XH4n8+/cfvfZL+I//PePxzA7kHiB6E+L+D/Mu3X4X8+/8ftfz7/q/b/XnLvdEyZ+nwM/jfZD/4fv//5/ee4'
+    '/c/vP6fd/9N+/92H/X5N/hftT4L/p+3+i3//oY/2+zV9/0G0H/wfvv8Q/B++/zDJ/r9v9995/d+H3X5N33/wsR/uv8r//kM/8Us9'
+    '33/IYz/4P3z/Ifg/fP8h3H/rv//Qh/1+Td9/EO1Pwvcfpu3+i3//QarPa/j+Q5n2g//D9x+C/8P3H8L9d3Xff+jDbr+m7z+Y7If7'
+    'r/F//0Gqz2v4/oNoP/g/fP8h+H96v//QGn7uWi0a0eGjuyFJKLXWM7Q1otGnDf029NvQb+P9LG2NaPR5AP0H0H8A/Qd4P0tbI1qK'
+    '/cfQfwz9x9B/jPeztDWi9wL/AvQXoL8A/QW8n6WtEQ3+vwf416G/Dv116I/ivZ+hrREN/g/xH/zfcPx96Peh34d+P+T/EP8h/qc7'
+    '/4/qAnV9YLc/eq6W2/GPnqvlpdg3+n/0XC2/F/iN8T96rpYH/zcbf/THHdaDlFJKR+uCoT4Q1pPseuNgX1jPsuudGX8p9oX1PLve'
+    'm/1/L/AL+Tyb783xH/x/D/AL+/nsfn9UFxjqg+D/EP/B/83FL5znZc/7Qv4P8R/if3rzv60+sNl3kBvxO8h97Rv97yBvOn5j/DvI'
+    'g/8bix/3/0QjGp/rtQRqXB9w/kA0ovG60hKo3f4D6KfrWkugRvyl2H8M/XRdbwnU6P97gX8B+mlebwnUGP/B//cA/zr00319S6DG'
+    '+iD4P8R/8H/D8fehn57rtQQa8n+I/xD/U5v/R3WBuj6w22+J95AZuR1/S7wHzchLsW/0f0u8B87I7wV+Y/y3xO8BZOTB/83GrzzP'
+    'k877Wun3gHT1gfG8wcG+8bzDjL8U+8bzHrP/7wV+43mfOf6D/+8BfsP3e3HvTylV1AfB/yH+g/+bi9/w+56Q/0P8h/if5vxvqw8K'
+    '3Hdyed77Ti73tZ/3vpfLm44/730/lwf/NxZ/e/j5224P2IiCJ/DD/0py4vLhH2vtNqPEqEHO2ifevk3uZz/C+w/a/wf4/0H7/wC/'
+    'ICcuH/7xD9pNKTFqkLP2ibdvk/vZj/A+QvuPgP8R2n8E/IKcuHz4xyO0m1Ji1CBn7RNv3yb3sx/8P/jMo/154J9H+/PAL8iJy4d/'
+    'zKPdlBKjBjlrn3j7Nrmf/eD/EP9T7/81tL8G/Gtofw34BTlx+fCPv2g3pcSoQc7aJ96+Te5nP/g/xH/I/yH/h/gP8T+1/j9E+4fA'
+    'f4j2D4FfkBOXl1H/i+0Tb98mD/V/iP8Q/yH/h/wf4j/Efy31/yHaTSkxapCXUP972A/+D/Ef8n/I/yH+Q/xPo/87w8+fTmfAdjqv'
+    'QfdTHnICT5AnfCT/jfdfgX5OecgJPEEu8gT7BPsE+yn/B++9Bt1n/G+89wr0M+N/472Rvc8pH/XvX/RXQSEn8BkayR/ifQWFnMCr'
+    'KMGeiZKRPsR7eko6GvXvP/RXQSEn8BkayZ/hfQWFnMCrKMGeiZKRPsN7eko6GvzfieNesw5ATqRZByL5K+gr1gHIifTrgBjnunWA'
+    'jOtAGue6dYB060Dif808SPyvmQeJ/zXzIPG/fh5MRvxr1oEk/jXrQBL/mnUgiX/9OjAZ8T/N/t9H/6O4k9cByIlG6wDJ60Ak/wz9'
+    'V9D/zfL/Z+i/gv5vlv+z+Z6vA2RcB7L5nq8DpFsHsv7vWPzfsfi/Y/F/Z8Ljv2OJ/44l/juW+O9MePxPof9H+X8f/RfWASn/76P/'
+    'wjog5f/P0BPWASn/f4aevA6Y9v0d477/D8v/+nWAdOuA3v8di/87Fv93LP7vTHj8dyzx37HEf8cS/50Jj//p8H/UkT8s/0vrAMX5'
+    'Xsz/0jpAcb4X87+0DlAc52L+l9aBeuv/ZL+n8X+y39P4P9nvafyfrPOT7H9D/Cf7fU38J/t9TfwneX5C4z/4n8Q4l/N/eg5IyTpA'
+    'fB0gMc7l/J+eA1KyDhBfB+qt/7PnPhr/J1Tj/4Rq/J/QCY3/hGriP6Ga+E+oJv4TOqHxP83+32fnfn9Y/t9n535/WP7/zM79frP8'
+    '/5md+/1m+b/G+l937qv3P1n8Txb/04THP1ninyzxT5b4pwmP/yn0v+LeL10H1Pd+6TqgvvdL1wHtvd9E1P96/5PF/2TxP1n8TxMe'
+    '/2SJf7LEP1ninyY8/qfD/zPDz6+ZGdDB05gHjeW3kN9Cfgv5LeQ3kN9AfgP5jV0+/MT2Iqrmb8Hfavgb8Df5+ahfT9G/p+jfU/Tv'
+    'KeRzkM9BPgf5HORPIH8C+RPIn9jlUT+eoj9PNfwc+DkN/wT8k/x81K9V9G8V/VtF/1YhX4F8BfIVyFcgX4Z8GfJlyJft8qgfq+jP'
+    'qoZfAb+i4ZfBL+fng/8Hn0/o3yf07xP69wnyXch3Id+FfBfyHch3IN+BfMcuj/rxCf35pOF3we9q+B3wO/n54P8Q/9Psf0L+J03+'
+    'J+R/0uR/Qn4nXX63yWvO/wT/k8b/BP+Txv8E/5LOvzb5JPh/Ff1TxD8h/kkT/4T4Jl182+Q1x3/wP/K9Jv8T8j9p8j8hv5Muv9vk'
+    'Nef/4P8Q/1Pt/2FH4nyL/K/gb8Hfavgb8DeF+Hrz/7AfT9Gfpxp+Dvychn8C/kkhvn7/r6I/qxp+BfyKhl8Gv1yIrzf+g/+R7wn5'
+    'X8Hvgt/V8Dvgdwrx9eb/4P8Q/9Pu/5D/Q/yH+A/5P+T/EP8h/qfK/7PDz/9mZ0GHjyMeNJb/hPwn5D8h/wn5D8h/QP4D8h+O8mvI'
+    'ryG/hvy6evmQxHjV+KPnPyFX4I+e/4Bcgc9Jfg25rn8VyqNxeYnxeQn5S8hfQv4C8heQv4D8BeTPIX8O+XPInzvKlyBfgnwJ8qXq'
+    '5dG4vMT4KPBHz19ArsAfPX8OuQKfk3wJcl3/KpRH4/IR4/MR8o+Qf4T8A+QfIP8A+QfI30P+HvL3kL93lG9Dvg35NuTb1cujcfmI'
+    '8VHgj55/gFyBP3r+HnIFPif5NuS6/lUoD/E/3fEfPYjzHSH/Zfmf4H9q+B/gfxTkr8Ff18RPO/6X4F9q+BfgX2j45+CfF+SXwC/V'
+    'xE87/o/gP2r4D+A/aPj34N8X5LfBb9fETzv+EP/TjT/k/5D/Q/yH/B/yf8j/If6nCz/O/0lz/k84/yfN+T/hfJ805/tO8mvIVefX'
+    'Vcun/PyfcP5HmvM/wvkfac7/COd7pDnfc5IvQa46n6paPu3nfzj/J835P+H8nzTn/4TzfdKc7zvJtyFXnV9XLZ/y8/8Q/9Md/4vD'
+    'z/fFxaFg8V1EJR5yAk+QC/xAvoH3L6Ev8ZGcwBPkCR+1/w3vv4W+wENO4AlygS/B/le8/wb6Ag85gSfIBf4e2L/C+5vQF3jICTxB'
+    'LvDBfuPtX+L9DegLPOQEniAXePP6Abl2/SjFvmH9gFy7fpRi3xC/kGvj917YN8xfyLXzN9iv1z5Z8j+55H9D/yHX99+S/8kl//va'
+    'N8WPS/5tun3T/HHJP8F+s+2b9CvO/6XY98j/pdj3yL/3wr5v/gn2a7Mf7S/e4f3v0Bd4yAk8QS7wfutP1P5bvP8N+gIPOYEnyAW+'
+    'BPtv8P5X6As85ASeIBf4e2B/E+9fQV/gISfwBLnAB/uNt284P4Bce34QtW9YPyDXrh+l2DesH5Br149S7BviF3Jt/N4L+4b5C7l2'
+    '/gb79donS/4nl/zvcf5IlvxPLvnf174pflzyb9Ptm+aPS/4J9ptt36Rfcf4vxb5H/i/Fvkf+vRf2ffNPsF+b/e7wc9Ht0vCvL0NK'
+    'nFJCTxg9HdCh/gn0T6B3BnrO9BU0+nyJX48pcTq0J9NTgcb2CfYJ9mN6gfe+6Glk/7xk/KfSONjxX1jwm8bBhP/cEf8Z+n9hwa8a'
+    'hzLwn5eM/1QaB3f85yXjP3XEf4b+X1jwq8ahDPyn6P9ZzfjPS8Z/Oib8Xxj+E4b/woL/FP0/qxn/aUX4zyvG/4XhP2H4L8aE/wvD'
+    'P3rvTD8PJPynFeE/t+A/YfgvLPi/FMR/XjH+Lwz/6L0z/TxQ4j8vGf8pGweO/4Thv7Dg/1IQ/7kFP9+/XdjX70rwn5eM/5SNgyv+'
+    '85Lxn1rwF9i/VoI/x/6tUvznJeM/HRP+Lww/H4cLC/4c+7dK8Z9WhP+8YvxfGH4+Dhdjwq+rG4X9QNdz/1YI/znD77F/9cJ/XjF+'
+    'Xd0o7Ae6nvvXQviFfNj13L964T9n+AvsX8eC/7xk/EI+7HruX73wn2rOv3LsX8eC37B/Gyv+85Lxn5aE3+P8tOu5fxsr/lMN/vOa'
+    '8Xucn5aC3+P8tOu5fyPP89Ou5/6VPM9PS8HvcX7a9dy/kuf5Yddz/0qe56ddz/1rLfjPGX6P88Ou5/6VPM8Pu57711rwi/mwTvzn'
+    'DP9pTfg9zk+7nvu3WvGfavCfjxm/x/lpqfgLnJ+Wev9d4Pz0ePg5Oj4esMfH3SGV+ejTHbIEyvnBH5GekZKWWuxTxfaBL254C/YF'
+    'PvpswV4P9iV+8McW7PRAs3z83l7yfspb7FPF9iN8B2z8D8bsf4P94P8x+H+Pjf8e8/8RG/+jkv1vsE8V23fy/2i+bbH5t5Vz/Hts'
+    '/HuO/q/QvpP/D9j4H4zZ/xXaD/4/PsZ76fj3mP/32PjvsfE/YuN9lNP/BvtUsf1S/N9l4875qv3vYb8U/x8wuwdj9r+H/eB/B//3'
+    '2Pj32PjvMbt7mXiUx/0op/8rtD8W/3fZuIv8OPxvsD8W/x8wuwdj9r/BfvD/MewS6m6Zd/J/j9ntZfwh291j/jfYp4rtS/7vsvHv'
+    'jtn/Cvtj9f8BG/+DMftfYT/4f4z+32Pjv8fOP47Y+cOR4/j3mN2exv8K+1Sx/Vz+t50/Ve3/Cuzn8v8BG/+DMfu/AvvB/8J499j4'
+    '95j/99j477HzhyNm9yin/xX2qWL7pfrfdv5Utf8L2C/V/wds/A/G7P8C9oP/c/jfdv+wx8Z/j50/HLF+HOX0fwX2x+p/3fnXuPyv'
+    'O/8al/8P2PgfjNn/CvvB/+H+87jPxr8/Zv8b7Af/h+8/1O7/ab//7rPx74/5/rtC+8H/4fsP4f7T8/67z+z2x3z/7WE/+D98/yHc'
+    'f1d8/91ndvtjvv822A/+D99/CPefsNdn50/9Md9/K+yH++/w/YeJ8f+033/32flTf8z33xXYD/4P338I958l3X/32bzrj/n+u4D9'
+    '4P/w/Ydw/z2m++8+m4f9Md9/K+wH/0/39x9a0eeuFT1otVvEeRo+6Zv4wYMH4O8sfD/Dx582+AewL/Bk44dP2qw/ufhW2h8V37Lw'
+    'wyd3rD+c72t5Gf8dw3+H/rTF8eO8F/7485j5/zHDa+JFfz4uwnN/5uVLwP+A4X+QY34MHzxm/XHnZf8/Zv5/zOa7ii9j/i/48II/'
+    'F3Lz9viv1v/lxP8C608uXsCzUISvOP7Jxlcc/3Wv/9MQ/+sGvmXhRX+uF+EnfP13if911p9cvIBnXcG3LHyz4/9+7P+qjH+y8SX4'
+    'f4H5f4HhNfF++f9+7P+K53/Z/wvM/wtsvqv4Mub/Yx++4vhvwv6vePw7xPcY4r/P5n+f4b0z8Ob63uF84B7s//qWel9/PiDP/z6b'
+    '/32G907BVx3/1db/dcd/Ofu/KuO/2v2/Pf/XXf83If6rzP911//h/K/K+r/u+LfX/1beq/6/H/u/Kut/K3/P4z+c/9V7/l9t/X8/'
+    '9n9Vnv9XW/+H879Jj/9q6/+4vTsDrzoPKO/+/37s/4rf/8t47hS86TygPwXnf/f7/H8yzv8m+fy/Wv+H8/9w/jfZ53/jiP91hn+S'
+    '6v8m7P+K1/8y/nWGv/r6v+74D+d/k3D+N8nf/2vC/u8+f//vfp//he//Wr/fbzkf8Lv/vx/7v+L3/w7f77ecD4Tv/4bzv+ae/9+P'
+    '7/829/w/nP+F7/+a6/+6v//fhP1flfV/td//n/bv/4bzv3q//3c/9n/N/f5fOP+b7u//tqPP3zbRiA7/OBTp4K+/jB6mNNI/hH78'
+    'HO0kVHpf0V67/Y+RkoWy99uMGvXjzyP0/xHakSlZaNtCTfrx5x/Yz99/yuoXGL95IyULZe+3GTXqt0vpf/H5o/A/p2b/lzJ/6p7/'
+    'a+j/GtqRKVlo20JN+pMx/4vHr+L9XPNnMub/POznj1/K6hdYP8L6X+/8PxSpsA9wyN+e+4ew/vvNX/KcP+1S4rf4/mEC139f/zdw'
+    '/ZfyP6fm/F/K/qHu+R/2/0X37+S5fwjrf73zX1Wvs/2Auf733D9M+/o/Gfvfidr/1zD/J6r+q2H+S/naN//n05+8+m8K1/+JOv8L'
+    '6//Y57/v+b3v/iGs/3Xtf+ve/0/7+d9kzP/i5/e++4fJmP9h/1/X+V9Y/+ud/53o86cz4Ab0305EIjr8479O9F4sH9B/Gf0vVu88'
+    'xPvPoP8M/EO8N6LPGI2fdzr7oP8yOrK/r7Ufvzdq5xmjdvvxZ4R3gDMzHqK9P4rxGL7/O8WbGY/hX79ZP+T+pHj3leOR2t9Xjken'
+    '85mNgzweBLnafmfk5xgvHw9hnEk5HiLe39nxkOz9Vo5HJ/Hjv8rx0NvfZ3g/K8cjtf85Mx6y///Ljodivon9iT/ifOfjkZ3vfDz4'
+    'fOfjYbKvmu98PPT2P6O/rzX+H9l5bYg/Nt87ReL/tSX+X48p/l9nx0Oy9zrTn/jzSuP/kZ1XjvH/WjkeJvvxe68s8a+3H3908f/a'
+    'En+vGd5X0H+l8f8rZX/08e9iX8T7SjkeZvtsvnfyxX8237HxMMbfq4rj324//uxb8v9+xfn/jyX+/1QW/zLeffh/X+N/Vf4dvv/Z'
+    'kv8/O8b/H+V4mPcfw/d+W+L/t3v88/Gw5F/Z/5+z42HJv+b4d9l/iHh/K8fDtP/I5H/f+M+Mhy3/Vhn/LvuPkvM/hfzfpPxv3v/f'
+    '//xf7f5/8vN/3N8/lvj/U/H+v776X853f7LjYcm/8ee3Jf4nt/435397/pXz/2/4vzn1f+n7/06z6v/489qy/39d8f6/vvwv430N'
+    '/7nn/1j/lWX/36D8T/nyv+z/V9nxmLb832li/t+35P/9ivN/ffW/7P/97HhY8m/8+WzJ/5Nb/5v3/y75l9W7nWbV/9l8V+b+f/Lr'
+    '/9Lzfyfk/0af/09Z/q92/z/5+X8m+vyaGbIzM09mhv+V+eGDJ+DnLPyvDB9/bln7Ij/845OJF9q7zfDx50bQ4/yQ7rL2Of8U/E2G'
+    'l9vfZe3vgu5Iell+jrUv8FH7oh7nRTqn4Ufj8TTLR+3Psfaldgb8qqjHeaG9uSwftT/iV9G+yA8frLD2V5T2ZlS81P4Ka38F7y8z'
+    'e8tK+zPM/pCfEcY/1uO82N6KhX+a4WeE8U/bF3lxvil5ob25DD8jjE+sx3lxvi1reH38ye3Psfbn2Dz5pOFt8feL6f1Szr803p5o'
+    '4u+Xhr9lerds/j1l8aCLv1sNf8Pi74bNBx5vcxp7NypeaG9OxQvx8FTDz7H2Uz7+rLL1ebXg+r+a4ePPCmt/hfl/1cQr4j3l48+y'
+    'oMf5IeX2VjTrfzb+5PZXWPujdWyZxdtyzvh7amlnmcXbsib+nmr4OUs7rvE3Z+F17dji75OJ1+kp4u+Tih+0t8vaT/kZKf/esPzL'
+    '429XxQ/e32HxtqNc/9P251j7o/m2o+KF9uYyfL71f0fD6+Mv3/q/quFt8bdqaecJi7cnmvhb1fArlnZc42/FwpvjXxN/wnxT8s7x'
+    'r9z/Sev9coaPP2K8zWjjT7n/k9bjTxk+/uyy9gU+V/2xm+Hjz45QfzDeqf7Qx5/c/i1r/xbt37D4u8kZf/r6Q25/jrWfb/1X1h+5'
+    '4s+2/pvjXxN/zvWHLf5nWPy71B/y+r/M1v9l1t6Kinfe/xPb/0d8rvrDvP+fYes/r/809Yci3n4p1/8Ztv5n679fTD46D7hl7eeo'
+    '/6X2b1n7o/MAqd4vtf6X29tV8X71f676o0D9b6k/xP0/sf1//vXfvP8ntv9P13/X+sO8/59h+/+It9cfinhT7/9n2P4/4iX5UyaX'
+    'x3+G5V+n+l9qf461L48/sfqvjPpfbm9OxTe6/p/Jdf6Wv/6fsZ2/5ao/svV/nvVfU38Yz9/yrf/m8z/V+Zu1/s9x/kfs/K+M+l9u'
+    'b0XFh/rfp/7PUX8Uqv9t9Ueu8zdF/S/VB09ZfWA/f/t/e9fTI8WtxGsR72lFlKc5REQCgfbIAZELSiRQ0HwEjhwQ7JEDgj1EZAXL'
+    'wEfZjzDHPYxmvwJHDohcOSByiYiUKNGbmban7Rr/L3e7Z1x9qXGbsvvXP5erynYv3vxfa/8yaj92/o/P/+Pmf87/o/P/iPwjKf/3'
+    '5R8R62/+/Z9f0fzsX3/z5R96+y9Q+3j97U9L2Zd/hK6/fbWU/0D2lzH/19q7bCpvd/4fkX8k5f++/CNi/c2Y/0fE/6b1N1/+ERP/'
+    '+/Z/TPnHaHX9PgKQcnGNbjrlaHRDlSMkQbazlM31RbT/xdLuDU362/+yls31WbT/2diep/3Fj981KdtZypT2cXuwxv3F0v4n0f6n'
+    'wPa/IPlZk7KdpfS2v6r/QdT/YGwvtn3Zzkqu6m+J+luWdj9p0t/+rVau6m+K+pvG9lztN/d/0ORoPc5vJrWP24M17luW9m+I9m8E'
+    'tn8LSYd9+ttf3H+uyjj7N7Qv22nbfabKOPs3tv9MlYv7T1WZYP/PNSnbQe0Gt4/bgzXuZ5b2n6gyoP1nSD7VpGwHtWtsf2S0/6dO'
+    '6Wtftf+R0f5xu0806W+/tf+R0T6fOCVq32n/Ke3H2P/IaJ++9sPtP6B96feT/P/IaJ+/q1L6/ST/b27/iyqlX+7E/6e0H+P/m3Y/'
+    'qTKr/w9oX9p9kv83ta/5/9X9W6qM8v/m9m+pUtplN/4/of0o/2+Ib7P6f0/7zfVc2NfzTPF/6/+b65lo/1mm+L/1/831VLSf3/+n'
+    'tB/j/5vriWg/v/8PaN9g/+H+39S+3/7D/b+5fZ/95/P/Ke3T7T+f//e233H+Dx3n/9Bx/g8d5//Qcf7va39EzP/Bk/+PiPk/ePL/'
+    'Ucf5/6jj/H/Ucf4/6jj/H3Wc/484/+80/4eO83/oOP+HjvN/6Dj/h47zf+g4/4eO83/g/J/zf87/O8v/oeP8HzrO/6Hj/B86zv+h'
+    '4/wfOs7/oeP8Hzj/7zT/P1hdvx2AlItLlc31UdR/FPdb2VwfRP0Hcb+VYfXvRf17cb+V/dS/E/XvxP1W7nr9SjR8G/lv7n9UJSAp'
+    'eTXyG1b/XpWAZA/171RpeD+7W99cj8X4eCzut7K5Hon6R+J+K5vroah/KO63Mqz+gah/IO63sp/6+6L+vrjfyl2vb8bFY1UCkpJ3'
+    'I//N/YeqBCQD6h+oEpDsof6+Kg3vZ5frpd8/sMz/0u8fWOZ/6dcPLPN7SP17ReL5uY/6d4rE8+eu17P/r9n/N+PisSLx/C/9/oFl'
+    '/pd+/cAyv4fUP1Aknp/7qL+vSNP8uMv17P/r9v/LH7955EeP/ECU7wvLd5VL5r9u+dgjH3nkQ6J8UFjer1wy/3VLnv/Z/zP/7P95'
+    '/mf/z/zXJMer63y8LI7Hp+OV0MuLH1KebZZX+lOkP0X6Z452lvqn4t9Phb5WVvRmhnJI/3Ok15abS/Y3R/3P/c9PfX9Bzz9zvAfa'
+    '+2uuGep/Znn+6WaZ+v6inj//+9P5n6H+Z3bcGv+E9wd92s9mO811hvo/S+Q/4f1BH/Zjf386/2fo+c8C+Se8P8hhP+nvLy//Ce8P'
+    'cthP+vsbFv+p9pP+/sZB/rtr/su9P51/2/zp45/w/qDs+wvj/xzpnSP8hPeXlf/49xfGvyOOpL6/reDfEX9S3x+UtZ84/g3vYdxH'
+    '/O7jP/39jan527iP/C3UfuLfXxz/pfPfVPuxvz8d/znq/zwz/6Xz383311xz1P88cv2D8P56Wf/oOv8lvD8ou36Ud/0jNX7v2n66'
+    'zn9y5W9d289Q81+q/aS/v93If9Pf326tf5TKf8vlb8Na/9j1/NcQR1ax/mHfPwLq+9sq/lPzX8f7g7L20+/6R2r8Hsr/UPPfXPmb'
+    'zX62Zf0jNX6n2o/9/b1dXW/ewkqO3y7uKnJxH+T9pTwU9w/Vf7f49UbIMZL4/iGSzf23a3mEJK4/RhL3d4Qkrj9GUsB/O7HgnwTi'
+    'n1j6m2wJ/hML/pNA/CeW/k4YfxT+QyRj8Zvb9+M/tuA/DsR/7OkvF37z+AjHvzk+GD/jZ/xHFvxHgfiPPP1tO341DsLxUQh+d3w0'
+    'fPwTC/5JIH53fDR8/CcW/CeB+N3xAeMPxW+uD8e/WR+G/9iC/zgQv9s/MH7GXxb/oQX/YSB+X3/bjv/Igv8osD/3+GD8teN/Y8H7'
+    'JhB/+vrbMPBPLPgngfjT19+Ggf/Egv8kEH/6+hPjHwL+Y896nw9/+voD4w/Bf2jBH+9vTPWMv3b8R55834c/ff1tO/C74yPK+tt2'
+    '4HfHR5T1t+3A744PKOtPjF/gkucA2nVttO7vwo/zDVvekYrf7R8o6y86/om6rp2Af+LJO4aO/0Rd103Af+KJuxm/Gb9vvcOHP339'
+    'Tcd/rK7rJeA/9sRdqfjd44OSfzB+xs/4Jf4jNa9PwH/kyTu2Ff9YOQeA46OY82fm+Gh78Jvioxj85vhoe/Cb4oMY/Ob4gPHH7ffg'
+    'ekr+FYff5B9i8Jv9A+Nn/MPAbzrfF4M//vzxduE3jQ/a+SvGz/g39/tt+/42/Onrb8PCP/Hs+/vwx6+/DQv/iWff24c/fv2J8Q8J'
+    '/7Fn39OHP379gfHH4Ld9/5B+/ozxM37/94+h+OPX37YDvzs+oqy/bRd+c3xEWX/bLvzm+ICy/lQ7/r3m+hca+b/l7VW5kasytPK6'
+    'obzUu96Itf51i/7EWIa1/J+lLOV1S/m6599J+S8uC/wXQMrmuTUJbin0kvWXP4pJgf+/IGXz3JoEtxR6yfrLH8Uk87+22z1s97K8'
+    '+HEP2a1aFvp7e9ju99r54rpzHrHbvSzfQ/fv5Zof9lre67b/tR1Xav9183+9tWOn/zbMAyJ+gOT4IcZ/2+aB5PiBzv9e5fa/V7n9'
+    '7+2S/0/w3+T4IWd8Hx0/5OMfKrd/qNz+t5r/e8j/3wv339T4odv43hc/MP9s/8z/2n/fQ/5b2uu/yG7/tfh/av6fPb7vPv9n+2f7'
+    '33r+Q/23YR6gxg/dxvf95f9s/2z/1ef/CfFDt/G9L35g/tn+mf+VPaj+e9JR/m+eBwz78h3l/xvzAPPP9s/8r/33BPnviX/9Pmv+'
+    'b5sHBrz/z/bP9l9N/m/b/yfED1ni++T4gfln+2f+s+X/CfFD1vg+On5g/tn+mX/e/2f7Z/tn/29dvzd/t9Pf/n9n64PMP9s/8x/s'
+    'vw3zQK/7/9nXB5l/tn/mv/P9/4lzHul+/98aPzD/bP818w/tdzuJ3+9R4wf3+Zwe1geZ/4rtn/kXdiv/DgjEfr+XNf/v/fv/NW/J'
+    'f/9hR+w/+e9/7Ij9183/dfT3f2LW74nxQ5b4nhI/ZPr7L7XaP1Ru/7BL/j/Ff6t//2frvv/Px/9e5fa/V7n9bzX/95D/j1m/j/n7'
+    'f4Pb/2f+2f6Z/7X/T/l+L+ff/+v9+3/mn+2f+Q/O/03zgJg39rby+3/mn+2f+c+W/2/d9//MP9s/87+wB93/x3y/F5P/D+77f+af'
+    '7Z/5X/v/lO/3cub/vX//z/yz/TP/5P3/CfL/W/P9P/PP9s/8Z8v/t+77f+af7Z/55/1/tn+2f/b/Sd/v9bH/3+X6IPPP9s/5f1j+'
+    'b5oH+tz/72J9kPln+2f/3+3+/2C//2f+2f5r5l9c/0Ajv13cbMqN/Hb1z5ryUprLsJbX4surfqWU/V9D/V9D/V+z9P9zSnnRj5Tf'
+    'msogymArk/Cv+rmG+r+G+g/F/09sWfD/H5Cyee+qXP5yS6BI2W+p/lcdOeUu939B2r2cB1q7k2W73V9Yj6fXaFxFlKXdX8B2L8v2'
+    'cX9hbU/XKHZos/sLPru/sJ5PfqbMQza77wM/2z/b/2qcXcjifxPmATnvlIo/svrfrYs/2P7Z/hX/X8D/av6/QPxR1v+Wjj/Y/tn+'
+    'V+NM9/8/I//bYf6bNf9PmgfkPKPY3T/I/+5s/MH2z/av+P+fkf/tIf8dVP5vnAd2Of5g+2f7z5j/J8wDct4pFX9k9b9bF3+w/bP9'
+    'Dyj/LxB/DCr/7z3+YPtn+19cr5H/f43872s07l7z/v9uxB9s/2z/iv9/jfyv2+4vrMdT9LkT3v/n/J/tf+fy/4R5QM47peIP3v9n'
+    '+2f/P5D8v0D8wfv/bP+8/78j+/9J84CcZxS7e438787GH2z/bP+8/2+2+xriD7Z/tn/e/y/3/V3p+IPtn+2f9/8Hk//3Hn+w/ddt'
+    '/xeb6+9laSG/EfIuKr9y1UMrr8aWRf9/ifYuCXkHlV+66qGVV5LK0OBfyG+EvIvKrzz1Ul5NLP8l5CUh76DyS0+9lFdiy+L9fwOE'
+    'cQBCT+H1Liq/stWL/i8BYRyA0FN4vYPKL531LR+p44A6fi4Rx0Hy+BHv/yrIcdC816uIZ2dZ4TV6HIj+r4AcB027VxDPzrLCa9o4'
+    'SLfbbzKNnytEO04eP8j+o3i/2M7nV1P9ALL/KN4vtvP5FZIfoM/f1PFziTgOksePeP93W/uP9wMZ/P+d1v7j/UAG/3+XaMfU8XOH'
+    'aMe5/P9d8f6jxoFhng/2A8j+74h+o8aBYZ6P8wN2nkPHAXX8XCKOg+Txs+n/pR8IjwccPHvHwab/l34gPB5w8Bw2DvL5/9RxkMv/'
+    'R4+DTf+Px0Hf/h+PA/b/Pfj/V8j+FT8AXj+Qwf+/RPav+AHw+oEM/v8V0Y6p4+cl0Y5z+f9XyP7vivfvHAeu/N7nB5D9v0T2f0f0'
+    '6xwH3vze5wfC83TbOKCOn0vEcZA8fgL8v/QDFwP8f/Q4CPD/0g9cDPD/aeMgn/9PHQe5/H/0OAjw/3gc9O3/8Thg/999/v8K2b/T'
+    'D3SQ/79E9u/0Ax3k/7F2nDv/j7XjrvL/V4h34ziIWe/HfsCT/79EvBvHQfR6P/YD6ev2f2caP5eI4yB5/CT4/414IGXfR46DBP+/'
+    'EQ8k7/tcXL+HrvL/0HHQVf7vHQcJ/n8jHujZ/2/EA+z/aeNnNY+783+XHyD5f9H/X5783+UHeP+fOH6UeP5vT/5vGgek/X8Uz//l'
+    'yf9N44D3/4njR8/rSP4/aRzoeR3J//P+f8I40PP5fv3/Zj7P/r+A/79r9wPg8wM5/P8dux8Anx/g/f98/t8wDsA3Dkj7/579/b88'
+    '+T/v/2cYP559Xkr+HzQOPPu8lPyf9/8DxoFnf79n/79RZv/fvf9/RfADOfz/S4If4P3/fP4/ZRyQ9v9d5zoDxwHv/xPHT+S5b5f/'
+    'TxoHkee+Xf6f9/8TxkHkef++/b8vHmD/nz//j/EDXeT/MX6A9/+7y/9DxgFp/9/Dc8g44P1/4vhJ/e4rx/5/gv+POf/P+/8B4yCV'
+    '90L+n8//ZfT/+83157Ik5eLH95qE/Z+Q/L6VVH0oqi/wXxb6l4Xej5oEcb+VL1pJ1Yei+gL/baF/W+h9p0nY/wXJ71pJ1Yei+gL/'
+    'd0Jf6v2iSb2/pbzdSqo+lNVv8P8q9H9NtH+CPpTVT7P/r62k6kNZ/TD7/wPJWPt36ENZfbP9/6HJePuP0Iei+mL++17oS7v5U5O6'
+    'vSF7oupDUX2B/6vQ/yr0LmsS1nZksCeqPhTVt/i/25rcHD+KP6XqQ1H92uMfMNv/r5qMt/8IfSir3+B/IfRfJNo/QR/K6qfZv+JP'
+    'qfpQVr/y+EfMfz8J/Z8s8fOfSOL4n6APRfUt+f9XTW7Gz4o9UfWhqL7A/4fQ/8Myfm4jicc/QR+K6tce/0CY/f+KZKz9O/ShrL7Z'
+    '/l9oMt7+I/ShrH6D/xeh/0ui/RP0oax+5fGPJf//SZOb8bPiT6n6UFRf4P9R6P9oiZ+/Ionjf4I+FNXf5/WvquMfSLN/xZ9S9aGs'
+    'fpj9v0Ay1v4d+lBWn/e/qo5/9ivf/9uvfP9vn9e/qo5/oPLzP1D5+R/g/a+q45/9yvf/9ivf/9vn9S8+/1Tx+R+o/PwP8P4Xn3+u'
+    'eP9vv/L9v31e/+LzTxWf/4HKz/8A73/x+eeK9//2K9//2+f1Lz7/VPH5H6j8/A/w/lfV8c+ouX5vyo1clJ+L8vOm6Kxf3vhBlH+I'
+    'L5ftX+D/IspfRPvPRPmZ6N9Vv7xxS5RvxZfL9i/wfxblz6L9p6L8VPTvql/euCnKN+PLZftn/Kvrkyh/Eu0/EeUnon9X/fLGDVG+'
+    'EV8u2z/jZ/w144fK/T9U7v+hcv/H+Hn+Y/yMv/L4R/OPqOyrX97Q/DNs+mdHfdn+BX7NP6Kyr355Q/PPsOmfHfVl+xf4Nf+Ayr76'
+    '5Q3NP8Gmf3LUl+2f8a8ubX5AZV/98oY2P8Hm/OSoL9s/42f8NeOHyv0/VO7/oXL/x/h5/mP8jL/y+Efzl2i93VefY/2/WP8Cv+Yv'
+    '0Xq7rz7H+n+x/gV+zV+g9WZffY7172L9M/7Vpc0XaL3RV59j/bNY/4yf8deMHyr3/1C5/4fK/R/j5/mP8TP+yuMf6vp7xHo/ri/b'
+    'f6b9/4j1flxftv9M+98R6924vmz/jD/L+mPEeieuL9s/42f8NeOHyv0/VO7/oXL/x/h5/mP8jL9W/AfN9duyJOXi12NNHhzc1yQc'
+    'vGslVR+K6gv8H4X+R3H/kSb9+An6UFRf4P8g9D+I+w816cdP0Iei+ox/db0X+u/F/Qea9OMn6ENRfcbP+Bl/U5Zy8eu+JqVfNfpX'
+    'qj4U1Q/E/1GTmn+l6kNR/UD8HzSp+ReqPhTVZ/xBz/9ek9r8QtWHovqMn/HXjB/C8v93mtTap+pDWf2w/N+Hn6APZfXD8l8ffoI+'
+    'lNVn/CH5gw8/QR/K6jN+xs/4q83/ofL8HyrPfxk/5z+Mn/FXvv7xWOhLv/ibJv3xD0EfiuoL/I+EvvSLHzXpx0/Qh6L6Av9DoS/9'
+    'wgdN+vET9KGoPuNfXQ+EvpwX3mvSj5+gD0X1GT/jZ/xN+cB8vmBZ8ViTmn+l6kNR/UD8jzSp+VeqPhTVD8T/UJOaf6HqQ1F9xh/0'
+    '/A80qc0vVH0oqs/4GX/N+CEs//edfyToQ1n9sPzfh5+gD2X1w/JfH36CPpTVZ/wh+YMPP0EfyuozfsbP+KvN/6Hy/B8qz38ZP+c/'
+    'jJ/x14p/3Fzny9JCTqH5IeXp6u5K2upXP6Q8QxLXz5A8bZpdSOU5oJVTUT9VnwNaORXtTC39BT2PaNfU/jmq9+FPeh7ZrqF/X/3U'
+    'g29qeN/a8wj+5wPhfy7anffM/7mF/3lP/J8qz6GO/1D+px7+zzz8zyztn0fyn4Jf5X8m2p0p7VP49+IXuOYW/mc984/Hf2n+55Xw'
+    'PxsI/yb8ffB/Zml/Jt77eU/8n4l2zxD/p+pzoPggBP80kf+zkPggoj9jPYH/UyL/00D+5wPh3xQf5OD/zMO/Mz7IyL8Jvzc+IOD3'
+    '8X8m3rsjPiDjj+HfaB8U/IH8O+ODHvk3xgcF+Z9Xwv9sIPxnxy/4n3r4d/iH1Y/zTPyb/IvKv/H9KO2fpzyPg/9pSHxgaBc/Tyn+'
+    'T3vifz4Q/ucpzzNu1xls/J95+D+3tD+P5N8YX/nGh2P8U/mfevg/86wvnffM/8zyPF3zP/esd/XF/9wz7vrmf14J/7OB8B+NP5D/'
+    'qYd/33rveSb+qevPxviAwL93fT0kPijI/2lP/M8Hwr8xPgjgf+rh/8zDvzM+iOA/9/in8h+K3xUf9Mm/0T564H8esP/YB/8b8UFh'
+    '/ueV8D8bCP8b+AX/p0T+Kfuvzbr+2Li/E8s/Zf997Nl/HXex/+7h97wS/ueF+T9dP4d9/7XL/cdz1/pql/uviH/D+CfxH4K/Wdc1'
+    '83/eM/+u/beuzx+AZ/+5D/4N478o//NK+J8NhH8Dfp9/IO+/Nus6Zv7b+ACs/iHX/svYsf7ujA8o++8e/oPigwr4nxfm3xkfZNp/'
+    'BM/5g072XxH/Bvy++ICM38V/6x9g3PX5mxD+u9x/Bs/5A+hi/zmS/y7GP4X/eSX8zwbCvw3/KZH/qYf/Mwv/M8/6aiz/rvUX1/7T'
+    'NHX/1cN/UHzgwHdeCf/zwvwn77+qcZ1n/wm6OH+A+Pd9/5H9/IGH/6mH/xznD3LyT9l/pvCffP4gM/8p479L/ueV8D8bCP8zz/Ok'
+    '8j/18B96/sD4HBH8p66/O+MDAv+x5w824oNK+J8X5t85PwbwT91/tcYHkfxnP39A5D/H+YM++XftP3fJvzU+6Jl/0/gvyf+8Ev6t'
+    '8cHb5noDUsLq11iRy19vkBy38q34d29VvUNFon+/koeaBHG/lYdIxtYfIemslzgVeahK3/NT9Q3Pd4xkbP0JktZ6wf8EpDTzP0GS'
+    '+e+W/6jnp4wfwf8JSGnm/wRJ5p/5Z/53h/9jkNLM/zGSmP83rYyNHzrhP6qe+SfzP2llbPzA/HfAf3B9Jv5PWhnrP5h/5p/5L8z/'
+    'EUhp5u8IScz/cStjxw/zz/wX5/8Nkhqfvvi1A/57y3+Y/9WDTpDE/DvjV+Z/6/k/QRLz74xfmP/l/VR95p/5L87/MZKYf+f8RY0f'
+    'SuJn/rPwT4ofmP+t55/kPwbA/yFIaebvEMnc/L9BEj+vr575327+J0ji5/XVU/k/QhLz53x+6vhh/sPPqzD/zD/zPzj+D1sZqx+3'
+    'X50YHzjrmf+t558UP2Tgn6TP/Pd33pX5Z/6Z/8Hx39t5N+af+Tfwf4gk5s/5/Bn4L7b+xfwPgv9i61/M/yD4L7b+sSP8k+qZf+af'
+    'yD9Jv+T6F/O/E/wnxw/M/07wn+w/BP9jeKt9v/lGkabza8p5piz8U/NZ5j8v/xNFmvhXzjMx/xn4L5b/WPg/UaSJf+U8C/PP/DP/'
+    'O8b/sSJN/Cv72ca//xARP/S73s3898J/RPzA/JfMfzriP8J/MP/MP/M/MP6PFGniT1nPNvIfMX6Yf+a/OP9Yat/z+eLXDPwXy3+Y'
+    'fyP/2vd8vviV+d85/rXvuXzxC/O/wX+EPvPP/A+Of+17Dt/8RY0fSuJn/jvhPyp+YP53jv8o/zFA/g8h+O83Z+EfP2/seSbmf7f4'
+    'jz3PlJt/7Tyn7/mp44f5J59nYf6Zf+Z/OPxH6Ofdz06JH5j/neM/Kn7ogP8ofea/3P9/xfwz/8z/4Pjv9Twc88/8I6nt5yT8/w+x'
+    '/Bdb/2L+B8l/b+tfzP8g+e9t/WNH+S/9/z8y/3XzH6Vfcv2L+d9J/oPjB+a/7v///f83pyDS'
+)
+
+BISHOP_MASKS = [
+    0x0040201008040200, 0x0000402010080400, 0x0000004020100A00, 0x0000000040221400,
+    0x0000000002442800, 0x0000000204085000, 0x0000020408102000, 0x0002040810204000,
+    0x0020100804020000, 0x0040201008040000, 0x00004020100A0000, 0x0000004022140000,
+    0x0000000244280000, 0x0000020408500000, 0x0002040810200000, 0x0004081020400000,
+    0x0010080402000200, 0x0020100804000400, 0x004020100A000A00, 0x0000402214001400,
+    0x0000024428002800, 0x0002040850005000, 0x0004081020002000, 0x0008102040004000,
+    0x0008040200020400, 0x0010080400040800, 0x0020100A000A1000, 0x0040221400142200,
+    0x0002442800284400, 0x0004085000500800, 0x0008102000201000, 0x0010204000402000,
+    0x0004020002040800, 0x0008040004081000, 0x00100A000A102000, 0x0022140014224000,
+    0x0044280028440200, 0x0008500050080400, 0x0010200020100800, 0x0020400040201000,
+    0x0002000204081000, 0x0004000408102000, 0x000A000A10204000, 0x0014001422400000,
+    0x0028002844020000, 0x0050005008040200, 0x0020002010080400, 0x0040004020100800,
+    0x0000020408102000, 0x0000040810204000, 0x00000A1020400000, 0x0000142240000000,
+    0x0000284402000000, 0x0000500804020000, 0x0000201008040200, 0x0000402010080400,
+    0x0002040810204000, 0x0004081020400000, 0x000A102040000000, 0x0014224000000000,
+    0x0028440200000000, 0x0050080402000000, 0x0020100804020000, 0x0040201008040200,
+]
+BISHOP_MAGICS = [
+    0x0104109006008810, 0x002818CE80820000, 0x0088080060800080, 0x10020A020010000A,
+    0x11C404200020000A, 0x0012021004100000, 0x0405040202420480, 0x0000220A10092804,
+    0x0108C04801042091, 0x0000480811004210, 0x8040080820608004, 0x0000840400880000,
+    0x0060020210800402, 0xC680010C20440000, 0x4404840488241050, 0x1050002B14062020,
+    0x0440111090820094, 0x0010004410220040, 0x0042009040820A00, 0x0004080124028001,
+    0x0002040400A20044, 0x0804081290041000, 0x0001230401280201, 0x2000450034020811,
+    0x0024400044100400, 0x10010400D1240800, 0x0084020104081012, 0x0001080014004010,
+    0x8021040026002100, 0x4159090006044101, 0x0808009905040100, 0x0008808001040080,
+    0x0004904800042002, 0x090C04020C200A62, 0x1000841000810040, 0x1000208020080200,
+    0x1020002081540084, 0x0008100040018820, 0x5010024201088881, 0x0802004100804400,
+    0x2041301004091000, 0x4011080802110502, 0x0A30084402001000, 0x2000001044002020,
+    0x0800241014001210, 0x0040080800250240, 0x0044901091014200, 0x0010120200500020,
+    0x1300841082100810, 0x2082840401848800, 0x020002005A280800, 0x5160C00046080410,
+    0x810000A020411000, 0x040A102001E10080, 0x0022184141040004, 0x002001010A008480,
+    0x00008208490C4002, 0x0201020901011080, 0x0014203210840422, 0x2101111220208802,
+    0x25C8100010020206, 0x000040302091110C, 0x00800A1044180846, 0x00E0202080810144,
+]
+BISHOP_SHIFTS = [
+    58, 59, 59, 59, 59, 59, 59, 58, 59, 59, 59, 59, 59, 59, 59, 59,
+    59, 59, 57, 57, 57, 57, 59, 59, 59, 59, 57, 55, 55, 57, 59, 59,
+    59, 59, 57, 55, 55, 57, 59, 59, 59, 59, 57, 57, 57, 57, 59, 59,
+    59, 59, 59, 59, 59, 59, 59, 59, 58, 59, 59, 59, 59, 59, 59, 58,
+]
+BISHOP_OFFSETS = [
+    0, 64, 96, 128, 160, 192, 224, 256, 320, 352, 384, 416, 448, 480, 512, 544,
+    576, 608, 640, 768, 896, 1024, 1152, 1184, 1216, 1248, 1280, 1408, 1920, 2432, 2560, 2592,
+    2624, 2656, 2688, 2816, 3328, 3840, 3968, 4000, 4032, 4064, 4096, 4224, 4352, 4480, 4608, 4640,
+    4672, 4704, 4736, 4768, 4800, 4832, 4864, 4896, 4928, 4992, 5024, 5056, 5088, 5120, 5152, 5184,
+]
+BISHOP_ATTACKS = (
+    'eNrtXUGO47gOpQQ3YPTKBfQBjKz6GCogB+gjGVnVMeaofyp5ksknynLiVKdn5tfmgcUwtCRToqlnReIwTnNa5IYiUW5/BT//r7HS'
+    'E/52/TgZvF9v8W79y9t/6Pq/3YZfvin5ilku/2/IY+dz6/f68u22e5n/72/X5n/iTZ4gT3PRC+lF64NYFMKe/o1wIuzpD/r/cXpf'
+    'rnhr9t9ysnK8Gf7In8eNU+QT9HOWxcpd+3d8PkFOVv5i/z/Pl3DDCFzwf+gT5NSQzxdglIfsB/gtmP8PlA4OkfA++18fN8efeJPz'
+    '/4FLBz8GwjvtR/gf4X/M/wdKB8eB8D77v6bbBXwiZDGYP9fCqYNd+1vDX+U/zbcOSIiXJIRz+VxDP63fs2n/8PdfO6hvLw9e362j'
+    'n9F++aL277OXR64vIvGLSBAgi5alg58rqbWXe+zllfgNCdA3JB7fkBgozJ9r4djBrv1nRvEq/9+RAH1HgvMdCdB3JDjfkQBZvWh9'
+    'EItC2NO/EU6EPf0h/z+QAP1A4vMDiY/Ca4LyA4nJDyQmCq/L1w8kFj+QWCjs6U/QnyDPhD39If8/kQD9ROLyEwmKwmuCs6G/Lp8/'
+    'kXD8RGKh8Lq8bejPsD9DToRn2Lf0h/z/QgL0CwnMLyQmCkdCIRxhPw6+/oOQvz/7vSZgD/kv13G//7+QAP2FhEDhpPSyqbdy9bmO'
+    '3vH3kF4euZ6EBCNhQUxYSLfkzy8wcufzlX31fYO8yv+ABR8IWQzmz7Vw6OCWvU04OJHYt5AfSTBGLMDAq5z/v+otar23gNcLfHtB'
+    'H7FQa6z8b+j3LPhb+jckAG9YICcs+BPkNyy8Rg/8lAPsg1pgc8JQ9MBAC3n+/gn+Bd87wX++vglY9EDB907wnxf2nKAUPVAocVjb'
+    'T+2b5c72U/tUYrSv/dS+We5sP7Vvljvbn6j9ablz/Kn9twTyjvGn9t/83zH+1P6b//+Pf7/9J5UAf+ZRJ5X4XqdJJJ4zEsiIxHOG'
+    'fob9CfYz7E86wYVdVIlrhP6EBHfW/tX3R5V4F/9pTWBn2Bv/+N7iP5H/tPqPuP7sP+L6Z3196I8odf/kB4ioEu3rdoq+PvRHlLp/'
+    'okrwi3+VoJ+o/7l/8gOC8a/6d4a98a/650T+T+Q/4vrN+Kv+2df/C/X/Ysf/ncY/0fgLjb/Q+L+T/yS7779I9x/f3yfyz/1ztP+j'
+    'esBc7z8a/0Tjn2j838l/Iv+J/Kv+OeMB8IwHvAEPTAMemAY8KGU8EybYJ/WAuPXAlQjPeJDM6Pn7fEA84wGQry/BLqkHUvb3aZ/U'
+    'A6S+vgHXP+D6z3jgPSs5yYp8ffwAnWCflJxkRb6+QbVb94Puj8/rH3D9ZzwQn/UDsXog9/pDP2An2Cf1fQP6d+0PKf0xqHbrfjir'
+    'dg3o30EaBQP1wM79wfeT1x/V9WH8z8795PVHdX2qoDBAn++nM+6Ps5Kr61PIBYgE+6Tk6voU9uKrd329+Opd3wcKICNwUYWET1yo'
+    'YLBQgeEDBYwRuJiChOy0j7CPV/n6nAP8gN240/+99ospAMXQs/+A3Wjs10LOY/axFIAWKvhw//X832v/gcLQCOzZu/3/RPsPFNRG'
+    '4K7xr+zR/8PO8VcFMviHfdw3fpV923/PfjEFxVs8dse/sm/HH9tPKPABb3L+PxUAc+FtUgW5CQU1g5W9X5jLn5MNlA4etZ9RgJsb'
+    'BbkZBbO5UUCDPelHucteSC+/Tz8OqvCmCnK5QDcOTiFOFQbHwSm0qcJfT5/9jaagWF2PkL76vpELkjv1ky78rTtwBScuwFFBbfIK'
+    'cgp36XWBkQqGX+1/RgEIKDMKQMCbfoJ+gn6CPhcecgHozdkx1AWaqd5BnFFYKTgRovBRcLJYCivB2ekLqvARnJ1BLoDlwk8ugObC'
+    'UC5Q5cJMLlA+of2lsKQLTBrf1HWKKvw8qf0zClwFJ0IUoApOFk2B683ZsdUFqKnewf0zxl/hRKgLcBMV4J7Q/leP/zsKgO+m0LXu'
+    'GCfoU0MPe2C9Iw57YK1/RwHq3RRa2D4A5en2AYWSjBUDQBeKHH3D3i80OnrfvlGocvRH7RMKuAmFyoDxDhhv1peCsdXje/5uD8Yb'
+    '9sL6UvAz+gAU2AWgVPpSsGzo77VnRoTbn0IFUe7Pf7D9Owqn77pAmAvin+MLfWroG/al8NiwL3rfPpTCqW+/6p9iP6MdXNgX2M/o'
+    'B0cPu4IN+4K+/Yq+/YrPtk8ofCcUmAP6K6C/WF8K7Q39P9J+xjw2Y/5TyPqyAWT1+XsEdgVZXwr4Ri8Fw8ki68sGREN/r33ABlgw'
+    'Gz3BbvjlDS5HD3tgkob9upHn2gegNOwDbUQ+z/79pOJI1AbdrOI+x5Gjb9gXbNgX9O1X9O1XPGrPDMjqfmCGJN8PxJCs7gdmUPL9'
+    'QAzHajyZAcnjedA+zWoeFMSNQtabjVP559sHbBwGvUHK4503JmPjfqntaeO9srf3S2VP41XZ03gftc95PG9si9rwbuhhV7Bhv6Jr'
+    'v6Jv3yBePMHefR7i/tQMYq8//+n2/Dyn7wfveVCj9zyn7wfveVCj9zynx9N7npuJCHHA/gICwAUb3hEbrhEbjBdsOF4gR2wQR71B'
+    'rDfQecOSN+xpg/2CDf4LNrT3+Y9AqTfId/lfN9AXbJQurQ1kD0XaSBvwCyFv0Pr+O9j1v+JC6Pr/e/wWTVhQG+YLNoyXrQ1+foOA'
+    'GfmacEEEiQUEjSWpDf2uf3ojgN8g6PpfCRAXEC0yRmy8Z7wQRhATIhMVhgaBxdvgVwSPC4gUGff5X1E87PpfMSJeIuIjYj6IJj4v'
+    'QvOD5PhcEK/LuUGo8QglKh59/4j/PD5nxP86P3T803ygCSPk/7H4fPb80InPL5wfXIKIInRhfhCaH4TiM9D8EGh+EJofhOKT/K+E'
+    'LcwPQvNDxz/NBzxfKP9xUHGV4y7PA2peaM0PC6FszQvO/OD7X7E3P/j+O8j+P+Md8VnFI+KF5gfJ88OC+WLRhDlF2EJ8ytIgmGE9'
+    'D3k93+cf8X/G958R/w6hzfev5oMvWb+Pzg93rt9H54fD6/fR/OHx9fto/sDreWzFZWN+WAiZwNebH3g93+d/xYVwn/8VkV8Hyu/t'
+    'fKDyfY5Hl6CoCMWYH4Tmh0Jg9P3TfKDy/X3+V8Iw5geh+cESKH97fs/zwhfn9xvzw9es30fzh/3r99H8oZff9+aHXn7fmx96+X1v'
+    'fujl9735YQABdwAxELIMmiiYCbqrbAmImii8OMTDkd5sHtc3rYdR+61lQ6D0ZE0sHR1ZEz4deUD7il+0b9AEWU0E/SBiZ6d9heC7'
+    'EGF3Ue3M/fBRy4Y4Ojpyp30u0VXJA9pX/KJ9g+7nTIhdZUuo3WifebNd6I333N/Fby0bwqond9pn7kNHHtC+4hftG3Q/Z2K6Jpx/'
+    '7GtfLz5K3KE9LLtEbS132teLjxHE33EyRN2hEHY7hNoRRN9xImJvi+DrEXgL8bj2P07KT9OeCccr9uwnEHgnTdTNhN5M1M2EXkee'
+    'QKzNKIyyjRMIupMm6mqUbTzsPxOAx8F5o14RgFv66qSA+/TwL+R/JP8iLX110sB9+nkaG4Rb0cRbRcwdGwTcG6F2du29N/5v+pns'
+    '+ft8e49ArAnLlT+6/lWfDAE4E33f8P8JGIBSyVKIw2+K0MvEUSZyrnIyhONMLH7D/ydgAEolSyEqT4qg/EZE1UDEUSWbN8AzIZeJ'
+    'n0zEZPmIvX7jPBOM34hoGoj4yfIR+2CIypbQOhHBVBryEXt7tJR/1FNoHOn0DPv/dvuXTAAuRM8bQWrJxKmg31DmN43//ty7IYJm'
+    'wqAsyRB0kv8mviIQF6LoSRO2uv4L8TgZwqHIXv9Bv4HOb5Lv8B/0G9r8pvWf778QH5MlPC2JCA4VoflGIDxqX4iTiQlTv8k+nCwh'
+    'S04+weNfao/4Rbx/op0PCqHKnHSw3o+wx3h/op0PiIhFJ3pkAnAhaIf1hYF9/gvxP2nCr5oPev6DPoGkEMPXeOz5D/qEjhOd2PDn'
+    '+0f8YvxmKUTnQmiNHoGk3E9H7QtxOWnCoibUfrF9OBEhkuLpX26fCfx5vUf8lvmgEKrMCSXr/Qj7st7DvswHRMSiE10Ugb8QtWk+'
+    '6PgvxP+83ieaD3r+A623QvHY8x9ovRWKxz/cfyYw5/Ua8VviuX6RxN5PR+0LcbkQVSmev9o+0HopFE//cns//jn/5/uP83+Of87/'
+    '+f7j/J/jn/P/tn8//jn/3/Dvxh/n3xv+3fjj/PvP9e/HL+fv3gtkOn983N6PX87fv9DejR/On/+99uFiNugvhWiEDcNCDF40IVBv'
+    'LJoN3ku1Ib2YjeCK8BaiIQRfCrEBG5iFiCiagMgnUBVCyqUmuOmN5/pErhANIenCxMpgic5LTbw0G+SXxhHWS+tErJf7v1iCSLgY'
+    'wkRs6KUQKhaPaFA23GNDXzBEuyEdoiFox4Ze1hPQknPyVSEIxYa+YKCN9BANQSw29NImkBnCQmzoC77av1D883gLxX+ld+O/Gm+K'
+    'f6Wn+OfxFor/Su/GfzXeFP9KT/HH/U0vOiyV3o2/qr8p/pT+1f798S7x39A/Lf7FH+8S/w390+Jf/P4u8dfQPy/+Xuw/XAxBthrv'
+    'QsxbzpYwZeK/ECwb4z0QrvoQDSGvGu/yIlAm7LnxXwhdjfEepHUiY4jmhYCqv4MlGjrEK0NIa/T3IK0TUV/u/2IJanw/NPTr/bB4'
+    'REi+Hyp9uR9CtIQ5vh8a+vV+qE489e6HSl/uh0Av8vB4NPTreDR+EsVipS/j8Wr/4o/3mt/TeAc3/6/Gm/J/jn+l98dbvaBkxztE'
+    '/wRaGm/K/zn+ld7v7zW/pv4O0T8Blvqb8m+OP6V/tX+Kb3HXg0r/tPgXim9x14NK/7T4r17kc+fjSv+8+Hux/zhoQmMmJuqTfDXx'
+    'UxSB8EZwjIMmBI+DJUAqYmkhTC72JFbrnwikoxRiZsO/WP9EwBxXQm3DfzRE45GIo4qQut1+IqR+FALuzvbjc6X/V+LovvbjOkr/'
+    'r0Rk+C8Eb/YvmvDtjD/8F4I0+xdNmK7HvxClO/7j4I9/uf86/uPQGH/Z1X5FOKbxl13tV4RdO/472y8Uf1LFX8+/NMZftu+/QvwF'
+    'gXeoCLPeyb5M6D3wE2CWgFz8Dr/Jf0X8ZSIt6WuirSUG+0Tbtn4k4m/D/0oI9v07J/vKLv08mRN6ByF5tsRcEZbtibpDQ+bPi1QE'
+    'X3NS7+Cc3Ks//zT/iQi7ae4QehsE292E3waBt0ko7uqP+V8s4fdtsQTct/4JsbtOQG3qF0s0nhZL/J12nkC7dcLqnhNYeyfAbukP'
+    'tX/HCbN7TqB9uP2LJXSHxRKsQ/+E3l0n0Db1iyWWy2KJ3rLzBOCtE373nADcO4F3S3+o/TtO+N1zAvDj7S8EvryRngl1Wc4Es+DL'
+    'K/FvVhvvp3UDvhDTfHklDJ2IwHMiQosvH/VfCHJ5o/xe2fw27yNypJ+oulc+5r8Q+MxJgopYY06UrOWV+KdPmpvViXOzc/LYKq+E'
+    'oZNzYqnQiZW1fNS/PTHrAdmcsPWIHJ2Tmu+Rj/kvG7qlwGTlstEQfbkUpPKGQRzsm8amkChU2FMbEvYNcLFviGt9cvTJeUNenDfe'
+    'HRkbWaWwjY0lewKZ6g+3fxJt5CqZ+ke4f+yb7W15s3+SesOfTgLo9E/ZUM4F3qh/amxYN/qof3IhrhSEy4aF91NpiTYulLwkam/a'
+    '1x9c0KxOOKD2t/oH93Og+9ueQLP2j7j9o4gUhrgi68k9Qid4yOBsiLbu717/7Ljf/f4JawFsoTfsr4WCsBa4hN5IF1VYGVXBRBca'
+    'coFM/yTUaH+CyfoPa8FsoTfhBXrrX8i/LfQIFWZGKuTwm9TqDfxSKKH2s3+h9rN/ofb3/EvHv3T8S8c/9X9n/KUz/qEz/uHO8ZfO'
+    '+Etn/ENn/MP/x9/4j6XwJroAuPFGvcVoC3VcuJNGQc45QUD4JIFd/qlQKbW87X9AAW5YC29UKJu48Pbcn+DKBcAX+U+z/ektYVkV'
+    'znzkz99rL/z532q/qIKf/xNZ81N+4uvh709f7H9JXGBxCyQaNwsMS+oWaGwB48n+5V7/5cHX/CTKKpcHS/OTGc5Prpgj1TUTW5wj'
+    't2uGdnkAzvbJ2jevI9D1s9zyax4AmZHFDClmLHkMwmSPpjQMS2Y8Cj2A6SPKyF4G5zeTn2avEgZeOPUOcVOvEgpe2PUOcVsvHf99'
+    'fe/7t/Qh+jt+uxfQrv3B7z9sv42xLPwjH6Uz7TxCR+YObtq/2P+CBECwIGqs/u/Je+wb+tv/a/uu36P2/veV73m6Pdt17LvtOGqv'
+    'ZSRAggRBkDAouae/JhKP46v93xIgQeIiSEQECYQgcRAkHK6Mz8vUkLft4V9e5f+aAAkSH0ECofCaeAgSDkECofCauAgSFkHio7Bn'
+    'f014tlCkg7GD2/bXBEiQSAgSCY0d/TUhEiQWgsRCY0d/TbgEiYsgcdHY0R/0f0uABAmGILHQ+JlACBIIQeKw4i0Bauul//3b+t73'
+    'S1e/9f1IgAQJgQjLt8RjQx46cs/+msi8Sg5IgAQJiCDx0CjSwbmDm/b/cf8v7v//AU+oAec='
+)
+
@@ -0,0 +1,49 @@
+#
+# Magic bitboard sliding attacks
+# The magics and attack tables are generated offline by generate_magics.py; this module only decompresses them.
+# A rook or bishop attack set is then one mask, one multiply, one shift and one list lookup, with no ray walking.
+#
+import base64
+import sys
+import zlib
+from array import array
+
+import magic_data
+
+FULL_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def _decode_attacks(text):
+    attacks = array('Q')
+    attacks.frombytes(zlib.decompress(base64.b64decode(text)))
+    if sys.byteorder == "big":
+        attacks.byteswap()
+    # plain lists index faster than arrays, which box a new int on every read
+    return attacks.tolist()
+
+
+ROOK_MASKS = magic_data.ROOK_MASKS
+ROOK_MAGICS = magic_data.ROOK_MAGICS
+ROOK_SHIFTS = magic_data.ROOK_SHIFTS
+ROOK_OFFSETS = magic_data.ROOK_OFFSETS
+ROOK_ATTACK_TABLE = _decode_attacks(magic_data.ROOK_ATTACKS)
+
+BISHOP_MASKS = magic_data.BISHOP_MASKS
+BISHOP_MAGICS = magic_data.BISHOP_MAGICS
+BISHOP_SHIFTS = magic_data.BISHOP_SHIFTS
+BISHOP_OFFSETS = magic_data.BISHOP_OFFSETS
+BISHOP_ATTACK_TABLE = _decode_attacks(magic_data.BISHOP_ATTACKS)
+
+
+def rook_attacks(square, occupied):
+    return ROOK_ATTACK_TABLE[ROOK_OFFSETS[square] + (
+            ((occupied & ROOK_MASKS[square]) * ROOK_MAGICS[square] & FULL_MASK) >> ROOK_SHIFTS[square])]
+
+
+def bishop_attacks(square, occupied):
+    return BISHOP_ATTACK_TABLE[BISHOP_OFFSETS[square] + (
+            ((occupied & BISHOP_MASKS[square]) * BISHOP_MAGICS[square] & FULL_MASK) >> BISHOP_SHIFTS[square])]
+
+
+def queen_attacks(square, occupied):
+    return rook_attacks(square, occupied) | bishop_attacks(square, occupied)
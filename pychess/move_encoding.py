@@ -0,0 +1,35 @@
+#
+# Packed moves
+# A move fits in 16 bits: bits 0-5 hold the starting square, bits 6-11 the ending square (row * 8 + col) and
+# bits 12-15 the flags, so move lists can live in array('H') buffers instead of lists of nested tuples.
+#
+from attack_tables import square_coordinates
+
+NO_FLAGS = 0
+CASTLE = 1
+EN_PASSANT = 2
+PROMOTE_KNIGHT = 4
+PROMOTE_BISHOP = 5
+PROMOTE_ROOK = 6
+PROMOTE_QUEEN = 7
+
+PROMOTION_FLAGS = {'n': PROMOTE_KNIGHT, 'b': PROMOTE_BISHOP, 'r': PROMOTE_ROOK, 'q': PROMOTE_QUEEN}
+PROMOTION_PIECES = {flags: name for name, flags in PROMOTION_FLAGS.items()}
+
+
+def encode_move(starting_square, ending_square, flags=NO_FLAGS):
+    return starting_square[0] * 8 + starting_square[1] | (ending_square[0] * 8 + ending_square[1]) << 6 | flags << 12
+
+
+def decode_move(move):
+    # (starting square, ending square, flags), with squares as (row, col)
+    return square_coordinates(move & 63), square_coordinates(move >> 6 & 63), move >> 12
+
+
+def move_flags(move):
+    return move >> 12
+
+
+# Name of the piece the pawn is promoted to, None if the move is not a promotion
+def promotion_piece(move):
+    return PROMOTION_PIECES.get(move >> 12)
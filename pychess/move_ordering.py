@@ -0,0 +1,96 @@
+#
+# Move ordering
+# Alpha beta prunes the most when the best move is searched first. Moves are searched in this order:
+#   the hash or principal variation move, captures by most valuable victim / least valuable attacker (MVV-LVA),
+#   the two killer moves of the ply (quiet moves that caused a beta cutoff in a sibling node), the other quiet moves
+#   by their history score (how often and how deep moving from that square to that square cut off), and last the
+#   captures that lose material by static exchange evaluation (see static_exchange.py), the least losing first
+#
+from array import array
+
+from bitboard import NO_PIECE
+from move_encoding import CASTLE, PROMOTE_KNIGHT
+from evaluation import PIECE_VALUES
+from static_exchange import static_exchange
+
+FIRST_MOVE_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 28
+KILLER_SCORES = (1 << 27, (1 << 27) - 1)
+# below every history score
+LOSING_CAPTURE_SCORE = -(1 << 16)
+# Killer slots kept, one pair per ply
+MAX_PLY = 128
+# History scores are halved once one of them passes this, so old cutoffs fade and quiet moves stay below killers
+MAX_HISTORY = 1 << 20
+
+
+class move_orderer:
+    def __init__(self):
+        self.killers = [[0, 0] for _ in range(MAX_PLY)]
+        # indexed by the packed move without its flags, from square + 64 * to square
+        self.history = array('l', [0]) * 4096
+
+    # Forget the killers of the last search and weaken its history
+    def new_search(self):
+        for killers in self.killers:
+            killers[0] = killers[1] = 0
+        self.history = array('l', [value >> 1 for value in self.history])
+
+    # A capture or promotion; castling can land the rook on a piece, but the king's square is always empty
+    @staticmethod
+    def is_tactical(game_state, move):
+        return move >> 12 >= PROMOTE_KNIGHT or \
+            (move >> 12 != CASTLE and game_state.piece_code_at(move >> 6 & 63) != NO_PIECE)
+
+    def order_moves(self, game_state, moves, ply, first_move=None):
+        '''
+        the packed moves of the side to move as a list, in the order they should be searched
+        first_move, the hash or principal variation move, goes first when it is among them
+        '''
+        killers = self.killers[ply] if ply < MAX_PLY else (0, 0)
+        history = self.history
+        piece_code_at = game_state.piece_code_at
+        scores = {}
+        for move in moves:
+            if move == first_move:
+                scores[move] = FIRST_MOVE_SCORE
+                continue
+            flags = move >> 12
+            victim = piece_code_at(move >> 6 & 63) if flags != CASTLE else NO_PIECE
+            if victim != NO_PIECE or flags >= PROMOTE_KNIGHT:
+                # promotions count as capturing the new piece's value
+                score = CAPTURE_SCORE + (flags - PROMOTE_KNIGHT + 1 if flags >= PROMOTE_KNIGHT else 0) * 8
+                attacker = piece_code_at(move & 63) % 6
+                if victim != NO_PIECE:
+                    score += (victim % 6 + 1) * 8
+                    # taking a piece worth at least the attacker never loses material, the rest are checked
+                    if PIECE_VALUES[victim % 6] < PIECE_VALUES[attacker]:
+                        exchange = static_exchange(game_state, move)
+                        if exchange < 0:
+                            score = LOSING_CAPTURE_SCORE + exchange
+                scores[move] = score - attacker
+            elif move == killers[0]:
+                scores[move] = KILLER_SCORES[0]
+            elif move == killers[1]:
+                scores[move] = KILLER_SCORES[1]
+            else:
+                scores[move] = history[move & 4095]
+        return sorted(moves, key=scores.__getitem__, reverse=True)
+
+    def record_cutoff(self, game_state, move, depth, ply):
+        '''
+        move caused a beta cutoff at ply with depth left to search; game_state is the position it was played in
+        only quiet moves are remembered, captures are already searched early
+        '''
+        if self.is_tactical(game_state, move):
+            return
+        if ply < MAX_PLY:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        history = self.history
+        history[move & 4095] += depth * depth
+        if history[move & 4095] > MAX_HISTORY:
+            for index in range(4096):
+                history[index] >>= 1
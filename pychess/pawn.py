@@ -1,14 +1,15 @@
 
 from enums import Player
 from piece import Piece
+from attack_tables import square_index, PAWN_CAPTURE_TARGETS
 
 
 class Pawn(Piece):
     def get_valid_piece_moves(self, game_state):
         if self.is_player(Player.PLAYER_1):
-            original_row_num, move_one_row, move_two_row = 1, 1, 2
+            original_row_num, move_one_row, move_two_row, color = 1, 1, 2, 0
         else:
-            original_row_num, move_one_row, move_two_row = 6, -1, -2
+            original_row_num, move_one_row, move_two_row, color = 6, -1, -2, 1
 
         opposing_player = Player.PLAYER_1 if self.is_player(Player.PLAYER_2) else Player.PLAYER_2
 
@@ -22,10 +23,11 @@ class Pawn(Piece):
             _peaceful_moves.append((current_row + move_two_row, current_col))
 
         _piece_takes = []
-        for col in (current_col - 1, current_col + 1):
-            if game_state.is_valid_piece(current_row + move_one_row, col) and \
-                    game_state.get_piece(current_row + move_one_row, col).is_player(opposing_player):
-                _piece_takes.append((current_row + move_one_row, col))
+        board = game_state.board
+        for new_row, new_col in PAWN_CAPTURE_TARGETS[color][square_index(current_row, current_col)]:
+            evaluating_piece = board[new_row][new_col]
+            if evaluating_piece != Player.EMPTY and evaluating_piece.is_player(opposing_player):
+                _piece_takes.append((new_row, new_col))
 
         if game_state.can_en_passant(current_row, current_col):
             _piece_takes.append((current_row + move_one_row, game_state.previous_piece_en_passant()[1]))
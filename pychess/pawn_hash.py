@@ -0,0 +1,45 @@
+#
+# The Pawn Hash Table class
+# A fixed-size, direct-mapped table of pawn structure evaluations keyed by pawn key (see zobrist.py). Pawns rarely
+# move, so most positions of a search share their pawn structure with many others and find it here instead of
+# scoring the pawns again. An entry keeps the packed pawn structure score and both colours' passed pawns, as
+# evaluation.pawn_structure returns them.
+#
+from array import array
+
+from direct_mapped_table import direct_mapped_table
+
+ENTRY_BYTES = 32
+DEFAULT_SIZE_MB = 1
+
+
+class pawn_hash_table(direct_mapped_table):
+    def __init__(self, size_mb=DEFAULT_SIZE_MB):
+        super().__init__(size_mb, ENTRY_BYTES)
+        self.keys = array('Q', [0]) * len(self)
+        self.scores = array('q', [0]) * len(self)
+        self.white_passed = array('Q', [0]) * len(self)
+        self.black_passed = array('Q', [0]) * len(self)
+
+    def clear(self):
+        self.keys[:] = array('Q', [0]) * len(self)
+        self.scores[:] = array('q', [0]) * len(self)
+        self.white_passed[:] = array('Q', [0]) * len(self)
+        self.black_passed[:] = array('Q', [0]) * len(self)
+        self.reset_statistics()
+
+    def probe(self, key):
+        # (score, white passed pawns, black passed pawns) stored for the key, None if its entry holds another key
+        index = key & self.mask
+        if self.keys[index] == key:
+            self.hits += 1
+            return self.scores[index], self.white_passed[index], self.black_passed[index]
+        self.misses += 1
+        return None
+
+    def store(self, key, score, white_passed, black_passed):
+        index = key & self.mask
+        self.keys[index] = key
+        self.scores[index] = score
+        self.white_passed[index] = white_passed
+        self.black_passed[index] = black_passed
@@ -1,3 +1,6 @@
+from bitboard import COLOR_OF_PLAYER, iterate_squares, square_coordinates
+
+
 class Piece:
     # Initialize the piece
     def __init__(self, name, row_number, col_number, player):
@@ -35,4 +38,12 @@ class Piece:
 
     # Get moves
     def get_valid_piece_moves(self, game_state):
-        pass
\ No newline at end of file
+        pass
+
+    # Split an attack set from the bitboard backend into moves to empty squares followed by takes
+    def moves_from_attacks(self, bitboards, attacks):
+        own_pieces = bitboards.occupancy[COLOR_OF_PLAYER[self.get_player()]]
+        _peaceful_moves = [square_coordinates(square) for square in iterate_squares(attacks & ~bitboards.occupied)]
+        _piece_takes = [square_coordinates(square)
+                        for square in iterate_squares(attacks & bitboards.occupied & ~own_pieces)]
+        return _peaceful_moves + _piece_takes
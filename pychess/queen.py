@@ -1,11 +1,15 @@
-
 from enums import Player
 from rook import Rook
 from bishop import Bishop
+from attack_tables import square_index
+from magics import queen_attacks
 
 
 class Queen(Rook, Bishop):
     # Get moves
     def get_valid_piece_moves(self, game_state):
-        return (Rook.get_valid_piece_moves(Rook(self.get_name(), self.get_row_number(), self.get_col_number(), self.get_player()), game_state) +
-                Bishop.get_valid_piece_moves(Bishop(self.get_name(), self.get_row_number(), self.get_col_number(), self.get_player()), game_state))
\ No newline at end of file
+        bitboards = getattr(game_state, 'bitboards', None)
+        if bitboards is not None:
+            square = square_index(self.get_row_number(), self.get_col_number())
+            return self.moves_from_attacks(bitboards, queen_attacks(square, bitboards.occupied))
+        return Rook.get_valid_piece_moves(self, game_state) + Bishop.get_valid_piece_moves(self, game_state)
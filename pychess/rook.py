@@ -1,6 +1,7 @@
-
 from enums import Player
 from piece import Piece
+from attack_tables import square_index, ROOK_RAYS
+from magics import rook_attacks
 
 
 class Rook(Piece):
@@ -11,47 +12,28 @@ class Rook(Piece):
 
     # Get moves
     def get_valid_piece_moves(self, game_state):
+        # with the bitboard backend the whole attack set is a single magic lookup
+        bitboards = getattr(game_state, 'bitboards', None)
+        if bitboards is not None:
+            square = square_index(self.get_row_number(), self.get_col_number())
+            return self.moves_from_attacks(bitboards, rook_attacks(square, bitboards.occupied))
+
         _peaceful_moves = []
         _piece_takes = []
-        def check_new_position(new_row, new_col):
-            # when the square to the left is empty
-            if game_state.get_piece(new_row, new_col) == Player.EMPTY:
-                _peaceful_moves.append((new_row, new_col))
-            # when the square contains an opposing piece
-            elif game_state.is_valid_piece(new_row, new_col) and \
-                    not game_state.get_piece(new_row, new_col).is_player(self.get_player()):
-                _piece_takes.append((new_row, new_col))
-                self._breaking_point = True
-            else:
-                self._breaking_point = True
-
-        _up = 1
-        _down = 1
-        _left = 1
-        _right = 1
-
-        # Left of the Rook
-        self._breaking_point = False
-        while self.get_col_number() - _left >= 0 and not self._breaking_point:
-            check_new_position(self.get_row_number(), self.get_col_number() - _left)
-            _left += 1
-
-        # Right of the Rook
-        self._breaking_point = False
-        while self.get_col_number() + _right < 8 and not self._breaking_point:
-            check_new_position(self.get_row_number(), self.get_col_number() + _right)
-            _right += 1
-
-        # Below the Rook
-        self._breaking_point = False
-        while self.get_row_number() + _down < 8 and not self._breaking_point:
-            check_new_position(self.get_row_number() + _down, self.get_col_number())
-            _down += 1
-
-        # Above the Rook
-        self._breaking_point = False
-        while self.get_row_number() - _up >= 0 and not self._breaking_point:
-            check_new_position(self.get_row_number() - _up, self.get_col_number())
-            _up += 1
-        
-        return _peaceful_moves + _piece_takes
\ No newline at end of file
+        board = game_state.board
+        player = self.get_player()
+
+        # Left, right, below and above the Rook, nearest square first
+        for ray in ROOK_RAYS[square_index(self.get_row_number(), self.get_col_number())]:
+            for new_row, new_col in ray:
+                evaluating_piece = board[new_row][new_col]
+                # when the square is empty
+                if evaluating_piece == Player.EMPTY:
+                    _peaceful_moves.append((new_row, new_col))
+                    continue
+                # when the square contains an opposing piece
+                if not evaluating_piece.is_player(player):
+                    _piece_takes.append((new_row, new_col))
+                break
+
+        return _peaceful_moves + _piece_takes
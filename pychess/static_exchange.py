@@ -0,0 +1,68 @@
+#
+# Static exchange evaluation
+# Whether a capture wins or loses material, found without making any moves: both sides keep recapturing on the
+# target square with their least valuable attacker, each side may stop when going on no longer pays, and the gains
+# of that swap sequence are folded back from the last capture to the first. Attackers come from the attack lookups
+# of bitboard.attackers_to; every piece that captures is taken out of the occupancy, which uncovers the sliders
+# lined up behind it (x-rays). Pins and checks are ignored.
+#
+from bitboard import attackers_to, PAWN, KNIGHT, QUEEN, KING, NO_PIECE
+from move_encoding import CASTLE, EN_PASSANT, PROMOTE_KNIGHT
+from evaluation import PIECE_VALUES, piece_bitboards
+
+
+def static_exchange(game_state, move):
+    '''
+    material the side to move wins with the packed move, in PIECE_VALUES units (a pawn is 10), when the exchange on
+    its target square is played out; 0 for castling
+    a promotion counts the new piece's value over the pawn's, also when a pawn recaptures on the last row
+    '''
+    flags = move >> 12
+    if flags == CASTLE:
+        return 0
+    starting_square = move & 63
+    ending_square = move >> 6 & 63
+    pieces = game_state.bitboards.pieces if game_state.bitboards is not None else piece_bitboards(game_state)
+    occupied = 0
+    for mask in pieces:
+        occupied |= mask
+    code = game_state.piece_code_at(starting_square)
+    victim = game_state.piece_code_at(ending_square)
+    if flags == EN_PASSANT:
+        victim = code ^ 6 if victim == NO_PIECE else victim
+        occupied ^= 1 << (starting_square & ~7 | ending_square & 7)
+    promotion_row = ending_square >> 3 in (0, 7)
+
+    # gains[n]: what the side making the n-th capture has won if the exchange stops after it
+    gains = [PIECE_VALUES[victim % 6] if victim != NO_PIECE else 0]
+    on_square = PIECE_VALUES[code % 6]
+    if flags >= PROMOTE_KNIGHT:
+        on_square = PIECE_VALUES[flags - PROMOTE_KNIGHT + KNIGHT]
+        gains[0] += on_square - PIECE_VALUES[PAWN]
+    occupied ^= 1 << starting_square
+    color = 1 - code // 6
+    while True:
+        attackers = attackers_to(pieces, ending_square, color, occupied) & occupied
+        if not attackers:
+            break
+        for kind in range(6):
+            least_valuable = attackers & pieces[color * 6 + kind]
+            if least_valuable:
+                break
+        least_valuable &= -least_valuable
+        # the king may only take last, when the square is no longer defended
+        if kind == KING and attackers_to(pieces, ending_square, 1 - color, occupied ^ least_valuable) & occupied:
+            break
+        gain = on_square - gains[-1]
+        on_square = PIECE_VALUES[kind]
+        if kind == PAWN and promotion_row:
+            on_square = PIECE_VALUES[QUEEN]
+            gain += on_square - PIECE_VALUES[PAWN]
+        gains.append(gain)
+        occupied ^= least_valuable
+        color = 1 - color
+
+    # each side only makes its capture when that beats stopping before it
+    for index in range(len(gains) - 1, 0, -1):
+        gains[index - 1] = -max(-gains[index - 1], gains[index])
+    return gains[0]
@@ -0,0 +1,26 @@
+#
+# Test positions
+# Shared by the tests that need a position other than the starting one
+#
+from enums import Player
+
+
+def set_up_position(state, pieces, white_turn=True):
+    '''
+    replace the board of state with pieces, given as (piece class, name, row, col, player) tuples; the king
+    locations follow the kings among them, castling is switched off and the bitboards, key and score are rebuilt
+    returns state
+    '''
+    state.board = [[Player.EMPTY] * 8 for _ in range(8)]
+    for piece_class, name, row, col, player in pieces:
+        state.board[row][col] = piece_class(name, row, col, player)
+        if name == 'k':
+            if player == Player.PLAYER_1:
+                state._white_king_location = (row, col)
+            else:
+                state._black_king_location = (row, col)
+    state.white_turn = white_turn
+    state.white_king_can_castle = [False, False, False]
+    state.black_king_can_castle = [False, False, False]
+    state.reload_board()
+    return state
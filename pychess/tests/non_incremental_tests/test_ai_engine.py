@@ -0,0 +1,124 @@
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from ai_engine import chess_ai, MATE_SCORE
+from move_encoding import encode_move
+from king import King
+from pawn import Pawn
+from queen import Queen
+from rook import Rook
+from board_setup import set_up_position
+
+
+def back_rank_position(player, backend=Backend.LIST):
+    # player's rook can mate the other king behind its own pawns
+    opponent = Player.PLAYER_2 if player == Player.PLAYER_1 else Player.PLAYER_1
+    home_row, mate_row, pawn_row = (0, 7, 6) if player == Player.PLAYER_1 else (7, 0, 1)
+    state = set_up_position(game_state(backend=backend),
+                            [(King, 'k', home_row, 3, player), (Rook, 'r', home_row, 7, player),
+                             (King, 'k', mate_row, 0, opponent), (Pawn, 'p', pawn_row, 0, opponent),
+                             (Pawn, 'p', pawn_row, 1, opponent)], player == Player.PLAYER_1)
+    return state, encode_move((home_row, 7), (mate_row, 7))
+
+
+class TestChessAi(unittest.TestCase):
+    def test_finds_mate_in_one_for_either_side(self):
+        ai = chess_ai()
+        for player in (Player.PLAYER_1, Player.PLAYER_2):
+            for backend in (Backend.LIST, Backend.BITBOARD):
+                for depth in (1, 2, 3):
+                    state, mate = back_rank_position(player, backend)
+                    best_move, score, pv = ai.search(state, depth)
+                    self.assertEqual(best_move, mate)
+                    self.assertEqual(score, MATE_SCORE - 1)
+                    self.assertEqual(pv, [mate])
+
+    def test_search_leaves_position_unchanged(self):
+        ai = chess_ai()
+        state = game_state()
+        key = state.zobrist_key
+        best_move, score, pv = ai.search(state, 2)
+        self.assertEqual(len(pv), 2)
+        self.assertEqual(pv[0], best_move)
+        self.assertIn(best_move, state.get_legal_move_list(Player.PLAYER_1))
+        self.assertEqual(state.zobrist_key, key)
+        self.assertEqual(len(state.move_log), 0)
+
+    def test_no_legal_moves(self):
+        state, mate = back_rank_position(Player.PLAYER_1)
+        state.make_move(mate)
+        self.assertEqual(chess_ai().search(state, 2), (None, -MATE_SCORE, []))
+
+    def test_iterative_deepening_limits(self):
+        ai = chess_ai()
+        state = game_state()
+        best_move, score, pv = ai.iterative_deepening(state, nodes=300)
+        self.assertLess(ai.nodes, 300 + 64)
+        self.assertGreaterEqual(ai.completed_depth, 1)
+        self.assertEqual(pv, ai.previous_pv)
+        self.assertEqual(best_move, pv[0])
+        self.assertEqual(len(state.move_log), 0)
+
+        ai.iterative_deepening(state, movetime=1)
+        self.assertEqual(ai.completed_depth, 1)
+
+    def test_iterative_deepening_matches_fixed_depth(self):
+        ai = chess_ai()
+        state = game_state()
+        self.assertEqual(ai.iterative_deepening(state, max_depth=2)[1], ai.search(state, 2)[1])
+        mate_state, mate = back_rank_position(Player.PLAYER_2)
+        self.assertEqual(ai.iterative_deepening(mate_state, movetime=1000)[0], mate)
+        self.assertEqual(ai.completed_depth, 1)
+
+    def test_aspiration_window_widens_to_exact_score(self):
+        state, mate = back_rank_position(Player.PLAYER_1)
+        state.make_move(encode_move((0, 3), (1, 3)))
+        exact_score = chess_ai().search(state, 3)[1]
+        # a guess far off on either side fails, and the widened windows still end on the exact score
+        for guess in (exact_score - 500, exact_score + 500, exact_score):
+            ai = chess_ai()
+            score, pv = ai.aspiration_search(state, 3, guess)
+            self.assertEqual(score, exact_score)
+            self.assertIn(pv[0], state.get_legal_move_list(Player.PLAYER_2))
+
+    def test_selective_search_toggles(self):
+        options = ('null_move_pruning', 'late_move_reductions', 'futility_pruning', 'razoring')
+        for option in options:
+            only = chess_ai(**{name: name == option for name in options})
+            self.assertEqual([getattr(only, name) for name in options], [name == option for name in options])
+            state, mate = back_rank_position(Player.PLAYER_2, Backend.BITBOARD)
+            self.assertEqual(only.iterative_deepening(state, max_depth=4)[0], mate)
+        state = game_state()
+        for move in (encode_move((1, 3), (3, 3)), encode_move((6, 4), (4, 4))):
+            state.make_move(move)
+        full_width = chess_ai(**{name: False for name in options})
+        selective = chess_ai()
+        full_width.iterative_deepening(state, max_depth=4)
+        selective.iterative_deepening(state, max_depth=4)
+        self.assertLess(selective.nodes, full_width.nodes)
+
+    def test_only_pawns_left(self):
+        state, mate = back_rank_position(Player.PLAYER_1)
+        self.assertTrue(state.has_non_pawn_material(Player.PLAYER_1))
+        self.assertFalse(state.has_non_pawn_material(Player.PLAYER_2))
+
+    def test_quiescence_sees_recapture(self):
+        # taking the pawn on (5, 3) loses the queen to the pawn on (6, 4)
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = set_up_position(game_state(backend=backend),
+                                    [(King, 'k', 0, 3, Player.PLAYER_1), (Queen, 'q', 3, 3, Player.PLAYER_1),
+                                     (King, 'k', 7, 6, Player.PLAYER_2), (Pawn, 'p', 5, 3, Player.PLAYER_2),
+                                     (Pawn, 'p', 6, 4, Player.PLAYER_2)])
+            ai = chess_ai()
+            # standing pat beats the capture
+            static_score = ai.evaluate(state, Player.PLAYER_1)
+            self.assertEqual(ai.quiescence(state, -MATE_SCORE, MATE_SCORE, 0), static_score)
+            best_move, score, pv = ai.search(state, 1)
+            self.assertNotEqual(best_move, encode_move((3, 3), (5, 3)))
+            self.assertLess(abs(score - static_score), 10)
+            self.assertEqual(len(state.move_log), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from attack_tables import square_index, KNIGHT_TARGETS, KING_TARGETS, PAWN_CAPTURE_TARGETS, RAYS, ROOK_RAYS, \
+    BISHOP_RAYS, KNIGHT_ATTACKS, RAY_MASKS, LEFT, DOWN_RIGHT
+from chess_engine import game_state
+from enums import Player
+from queen import Queen
+from knight import Knight
+
+
+class TestAttackTables(unittest.TestCase):
+    def test_knight_targets(self):
+        self.assertEqual(KNIGHT_TARGETS[square_index(0, 0)], [(1, 2), (2, 1)])
+        self.assertEqual(len(KNIGHT_TARGETS[square_index(4, 4)]), 8)
+
+    def test_king_targets(self):
+        self.assertEqual(len(KING_TARGETS[square_index(0, 0)]), 3)
+        self.assertEqual(len(KING_TARGETS[square_index(3, 3)]), 8)
+
+    def test_pawn_capture_targets(self):
+        self.assertEqual(PAWN_CAPTURE_TARGETS[0][square_index(1, 0)], [(2, 1)])
+        self.assertEqual(PAWN_CAPTURE_TARGETS[1][square_index(6, 3)], [(5, 2), (5, 4)])
+
+    def test_rays_are_ordered_nearest_first(self):
+        self.assertEqual(RAYS[LEFT][square_index(3, 3)], [(3, 2), (3, 1), (3, 0)])
+        self.assertEqual(RAYS[DOWN_RIGHT][square_index(5, 5)], [(6, 6), (7, 7)])
+        self.assertEqual(sum(len(ray) for ray in ROOK_RAYS[square_index(3, 3)]), 14)
+        self.assertEqual(sum(len(ray) for ray in BISHOP_RAYS[square_index(0, 0)]), 7)
+
+    def test_masks_match_lists(self):
+        for square in range(64):
+            self.assertEqual(bin(KNIGHT_ATTACKS[square]).count("1"), len(KNIGHT_TARGETS[square]))
+            self.assertEqual(bin(RAY_MASKS[LEFT][square]).count("1"), len(RAYS[LEFT][square]))
+
+
+class TestTableDrivenPieces(unittest.TestCase):
+    def setUp(self):
+        self.game_state = game_state()
+
+    def test_knight_moves(self):
+        self.assertEqual(self.game_state.get_piece(0, 1).get_valid_piece_moves(self.game_state), [(2, 0), (2, 2)])
+
+    def test_queen_moves_without_temporary_pieces(self):
+        self.game_state.board[3][3] = Queen('q', 3, 3, Player.PLAYER_1)
+        moves = self.game_state.get_piece(3, 3).get_valid_piece_moves(self.game_state)
+        self.assertIn((6, 3), moves)
+        self.assertIn((6, 6), moves)
+        self.assertNotIn((7, 3), moves)
+        self.assertNotIn((1, 3), moves)
+        self.assertEqual(len(moves), 19)
+
+    def test_knight_takes_come_last(self):
+        self.game_state.board[2][0] = Knight('n', 2, 0, Player.PLAYER_2)
+        moves = self.game_state.get_piece(0, 1).get_valid_piece_moves(self.game_state)
+        self.assertEqual(moves, [(2, 2), (2, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from bitboard import bitboard_position, square_index, square_coordinates, iterate_squares, PIECE_CODES, \
+    NO_PIECE, KNIGHT_ATTACKS, rook_attacks, bishop_attacks
+from rook import Rook
+from king import King
+from queen import Queen
+from board_setup import set_up_position
+
+
+class TestBitboardPosition(unittest.TestCase):
+    def test_square_index_round_trip(self):
+        for row in range(0, 8):
+            for col in range(0, 8):
+                self.assertEqual(square_coordinates(square_index(row, col)), (row, col))
+
+    def test_iterate_squares(self):
+        self.assertEqual(list(iterate_squares((1 << 0) | (1 << 9) | (1 << 63))), [0, 9, 63])
+        self.assertEqual(list(iterate_squares(0)), [])
+
+    def test_load_initial_board(self):
+        bitboards = bitboard_position(game_state().board)
+        self.assertEqual(bin(bitboards.occupancy[0]).count("1"), 16)
+        self.assertEqual(bin(bitboards.occupancy[1]).count("1"), 16)
+        self.assertEqual(bitboards.occupied, bitboards.occupancy[0] | bitboards.occupancy[1])
+        self.assertEqual(bitboards.piece_at(square_index(0, 3)), PIECE_CODES[('k', Player.PLAYER_1)])
+        self.assertEqual(bitboards.piece_at(square_index(3, 3)), NO_PIECE)
+        self.assertEqual(bitboards.king_square(1), square_index(7, 3))
+
+    def test_knight_attacks_corner(self):
+        self.assertEqual(set(iterate_squares(KNIGHT_ATTACKS[square_index(0, 0)])),
+                         {square_index(1, 2), square_index(2, 1)})
+
+    def test_slider_attacks_stop_at_blockers(self):
+        occupied = (1 << square_index(3, 5)) | (1 << square_index(5, 3))
+        attacks = set(iterate_squares(rook_attacks(square_index(3, 3), occupied)))
+        self.assertIn(square_index(3, 5), attacks)
+        self.assertNotIn(square_index(3, 6), attacks)
+        self.assertIn(square_index(5, 3), attacks)
+        self.assertNotIn(square_index(6, 3), attacks)
+        self.assertIn(square_index(0, 3), attacks)
+        self.assertEqual(len(set(iterate_squares(bishop_attacks(square_index(0, 0), 0)))), 7)
+
+
+class TestBitboardBackend(unittest.TestCase):
+    def setUp(self):
+        self.list_state = game_state()
+        self.bitboard_state = game_state(backend=Backend.BITBOARD)
+
+    def assert_same_moves(self):
+        for player in (Player.PLAYER_1, Player.PLAYER_2):
+            self.assertEqual(sorted(self.list_state.get_all_legal_moves(player)),
+                             sorted(self.bitboard_state.get_all_legal_moves(player)))
+
+    def test_backend_selection(self):
+        self.assertIsNone(self.list_state.bitboards)
+        self.assertIsNotNone(self.bitboard_state.bitboards)
+        self.assertEqual(self.bitboard_state.backend, Backend.BITBOARD)
+
+    def test_get_piece_and_valid_moves(self):
+        self.assertIsInstance(self.bitboard_state.get_piece(0, 0), Rook)
+        self.assertFalse(self.bitboard_state.is_valid_piece(8, 8))
+        self.assertEqual(self.bitboard_state.get_valid_moves((1, 0)), [(2, 0), (3, 0)])
+        self.assertIsNone(self.bitboard_state.get_valid_moves((2, 0)))
+        self.assert_same_moves()
+
+    def test_move_and_undo_keep_bitboards_in_sync(self):
+        for starting_square, ending_square in [((1, 4), (3, 4)), ((6, 3), (4, 3)), ((0, 4), (4, 0)),
+                                               ((6, 2), (5, 2)), ((4, 0), (4, 3))]:
+            self.list_state.move_piece(starting_square, ending_square, True)
+            self.bitboard_state.move_piece(starting_square, ending_square, True)
+            self.assertEqual(self.bitboard_state.bitboards.pieces, bitboard_position(self.bitboard_state.board).pieces)
+            self.assert_same_moves()
+        for _ in range(5):
+            self.list_state.undo_move()
+            self.bitboard_state.undo_move()
+            self.assertEqual(self.bitboard_state.bitboards.pieces, bitboard_position(self.bitboard_state.board).pieces)
+        self.assertEqual(self.bitboard_state.bitboards.pieces, bitboard_position(game_state().board).pieces)
+
+    def test_pinned_piece_and_check(self):
+        for state in (self.list_state, self.bitboard_state):
+            set_up_position(state, [(King, 'k', 0, 3, Player.PLAYER_1), (Rook, 'r', 2, 3, Player.PLAYER_1),
+                                    (Queen, 'q', 7, 3, Player.PLAYER_2), (King, 'k', 7, 0, Player.PLAYER_2)])
+        self.assertEqual(sorted(self.bitboard_state.get_valid_moves((2, 3))),
+                         [(1, 3), (3, 3), (4, 3), (5, 3), (6, 3), (7, 3)])
+        self.assert_same_moves()
+
+
+if __name__ == '__main__':
+    unittest.main()
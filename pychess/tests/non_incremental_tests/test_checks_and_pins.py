@@ -0,0 +1,61 @@
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from attack_tables import square_index
+from rook import Rook
+from knight import Knight
+from bishop import Bishop
+from queen import Queen
+from king import King
+from pawn import Pawn
+from board_setup import set_up_position
+
+
+def bit(row, col):
+    return 1 << square_index(row, col)
+
+
+class TestChecksAndPins(unittest.TestCase):
+    def setUp(self):
+        self.states = [game_state(), game_state(backend=Backend.BITBOARD)]
+
+    def place(self, pieces):
+        for state in self.states:
+            set_up_position(state, pieces)
+
+    def assert_result(self, king_location, player, expected):
+        for state in self.states:
+            board_before = [row[:] for row in state.board]
+            self.assertEqual(state.checks_and_pins(king_location, player), expected)
+            self.assertEqual(state.board, board_before)
+
+    def test_initial_position_has_no_checks_or_pins(self):
+        self.assert_result((0, 3), Player.PLAYER_1, (0, 0, 0))
+        self.assert_result((7, 3), Player.PLAYER_2, (0, 0, 0))
+
+    def test_rook_check_and_bishop_pin(self):
+        self.place([(King, 'k', 0, 3, Player.PLAYER_1), (Rook, 'r', 5, 3, Player.PLAYER_2),
+                    (Knight, 'n', 1, 4, Player.PLAYER_1), (Bishop, 'b', 3, 6, Player.PLAYER_2)])
+        pin_ray = bit(1, 4) | bit(2, 5) | bit(3, 6)
+        self.assert_result((0, 3), Player.PLAYER_1, (bit(5, 3), bit(1, 4), pin_ray))
+
+    def test_two_own_pieces_are_not_pinned(self):
+        self.place([(King, 'k', 0, 3, Player.PLAYER_1), (Queen, 'q', 0, 7, Player.PLAYER_2),
+                    (Knight, 'n', 0, 4, Player.PLAYER_1), (Bishop, 'b', 0, 5, Player.PLAYER_1)])
+        self.assert_result((0, 3), Player.PLAYER_1, (0, 0, 0))
+
+    def test_knight_and_pawn_checks(self):
+        self.place([(King, 'k', 4, 4, Player.PLAYER_1), (Knight, 'n', 6, 5, Player.PLAYER_2),
+                    (Pawn, 'p', 5, 3, Player.PLAYER_2), (Pawn, 'p', 3, 5, Player.PLAYER_2)])
+        # only the black pawn on the row above the white king (towards row 7) attacks it
+        self.assert_result((4, 4), Player.PLAYER_1, (bit(6, 5) | bit(5, 3), 0, 0))
+
+    def test_own_king_is_transparent(self):
+        self.place([(King, 'k', 0, 3, Player.PLAYER_1), (Rook, 'r', 0, 7, Player.PLAYER_2)])
+        # the king stepping from (0, 3) to (0, 2) stays on the rook's rank
+        self.assert_result((0, 2), Player.PLAYER_1, (bit(0, 7), 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import random
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from evaluation import compute_score, PIECE_SCORES, PIECE_VALUES, ENDGAME_PIECE_VALUES, MIDGAME_SCORES, \
+    ENDGAME_SCORES, MAX_PHASE, unpack_score, tapered_score, taper, piece_planes, evaluate_planes, \
+    piece_bitboards, evaluate_batch
+from move_encoding import encode_move, CASTLE, PROMOTE_QUEEN
+from bitboard import PIECE_CODES
+from king import King
+from pawn import Pawn
+from rook import Rook
+from board_setup import set_up_position
+
+
+class TestEvaluation(unittest.TestCase):
+    def test_tables_are_mirrored_for_black(self):
+        self.assertEqual(unpack_score(game_state().score), (0, 0, MAX_PHASE))
+        for name, value, endgame_value in zip('pnbrqk', PIECE_VALUES, ENDGAME_PIECE_VALUES):
+            white = PIECE_CODES[(name, Player.PLAYER_1)]
+            black = PIECE_CODES[(name, Player.PLAYER_2)]
+            for square in range(64):
+                for scores in (MIDGAME_SCORES, ENDGAME_SCORES):
+                    self.assertEqual(scores[black][square ^ 56], -scores[white][square])
+                self.assertEqual(unpack_score(PIECE_SCORES[white][square])[:2],
+                                 (MIDGAME_SCORES[white][square], ENDGAME_SCORES[white][square]))
+                # square bonuses stay at most a pawn
+                self.assertLessEqual(abs(MIDGAME_SCORES[white][square] - value), 5)
+                self.assertLessEqual(abs(ENDGAME_SCORES[white][square] - endgame_value), 10)
+
+    def test_taper(self):
+        self.assertEqual(taper(40, 100, MAX_PHASE), 40)
+        self.assertEqual(taper(40, 100, 0), 100)
+        self.assertEqual(taper(40, 100, MAX_PHASE // 2), 70)
+        # both colours round alike
+        self.assertEqual(taper(-7, 0, 1), -taper(7, 0, 1))
+        for score in (-40000, -1, 0, 5, 123456):
+            for endgame in (-300, 0, 77):
+                packed = score % 30000 - 15000 + (endgame << 16) + (17 << 32)
+                self.assertEqual(unpack_score(packed), (score % 30000 - 15000, endgame, 17))
+
+    def test_planes_match_incremental_score(self):
+        rng = random.Random(21)
+        state = game_state()
+        for _ in range(60):
+            moves = state.get_legal_move_list(Player.PLAYER_1 if state.whose_turn() else Player.PLAYER_2)
+            if not moves:
+                break
+            state.make_move(rng.choice(moves))
+            planes = piece_planes(state)
+            self.assertEqual(sum(sum(plane) for plane in planes), sum(piece != Player.EMPTY for row in state.board
+                                                                     for piece in row))
+            self.assertEqual(evaluate_planes(planes), tapered_score(state.score))
+
+    def test_score_follows_moves_and_undos(self):
+        rng = random.Random(8)
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = game_state(backend=backend)
+            for _ in range(120):
+                if state.move_log and rng.random() < 0.25:
+                    state.unmake_move()
+                else:
+                    moves = state.get_legal_move_list(Player.PLAYER_1 if state.whose_turn() else Player.PLAYER_2)
+                    if not moves:
+                        break
+                    if rng.random() < 0.5:
+                        state.make_move(rng.choice(moves))
+                    else:
+                        state.move_piece(rng.choice(moves))
+                self.assertEqual(state.score, compute_score(state))
+
+    def test_undo_stack_keeps_packed_scores(self):
+        # the phase weight sits above bit 32, so the undo stack needs 64-bit entries on every platform
+        state = game_state()
+        self.assertGreater(state.score, 2 ** 31)
+        self.assertEqual(state._undo_scores.itemsize, 8)
+        start = state.score
+        state.make_move(encode_move((1, 3), (3, 3)))
+        after_first = state.score
+        state.move_piece(encode_move((6, 4), (4, 4)))
+        self.assertEqual(state._undo_scores[:2].tolist(), [start, after_first])
+        state.undo_move()
+        self.assertEqual(state.score, after_first)
+        state.undo_move()
+        self.assertEqual(state.score, start)
+
+    def test_castling_and_promotion(self):
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = set_up_position(game_state(backend=backend),
+                                    [(King, 'k', 0, 3, Player.PLAYER_1), (Rook, 'r', 0, 0, Player.PLAYER_1),
+                                     (Pawn, 'p', 6, 6, Player.PLAYER_1), (King, 'k', 7, 0, Player.PLAYER_2)])
+            state.white_king_can_castle = [True, True, False]
+            state.reload_board()
+            start = state.score
+            for move in (encode_move((0, 3), (0, 1), CASTLE), encode_move((7, 0), (7, 1))):
+                state.make_move(move)
+                self.assertEqual(state.score, compute_score(state))
+            before_promotion = state.score
+            state.move_piece(encode_move((6, 6), (7, 6), PROMOTE_QUEEN))
+            self.assertEqual(state.score, compute_score(state))
+            self.assertEqual(state.score - before_promotion, PIECE_SCORES[PIECE_CODES[('q', Player.PLAYER_1)]][62] -
+                             PIECE_SCORES[PIECE_CODES[('p', Player.PLAYER_1)]][54])
+            for _ in range(3):
+                state.undo_move()
+                self.assertEqual(state.score, compute_score(state))
+            self.assertEqual(state.score, start)
+
+    def test_batch_matches_incremental_scores(self):
+        rng = random.Random(22)
+        positions, expected = [], []
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = game_state(backend=backend)
+            for _ in range(40):
+                moves = state.get_legal_move_list(Player.PLAYER_1 if state.whose_turn() else Player.PLAYER_2)
+                if not moves:
+                    break
+                state.make_move(rng.choice(moves))
+                positions.append(piece_bitboards(state))
+                expected.append(tapered_score(state.score))
+        self.assertEqual([int(score) for score in evaluate_batch(positions)], expected)
+        self.assertEqual(len(evaluate_batch([])), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
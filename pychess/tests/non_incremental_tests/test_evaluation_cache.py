@@ -0,0 +1,47 @@
+import unittest
+
+from enums import Player
+from chess_engine import game_state
+from ai_engine import chess_ai
+from evaluation_cache import evaluation_cache, ENTRY_BYTES
+from move_encoding import encode_move
+
+
+class TestEvaluationCache(unittest.TestCase):
+    def test_size_is_capped(self):
+        cache = evaluation_cache(1)
+        self.assertLessEqual(cache.size_in_bytes(), 1024 * 1024)
+        self.assertGreater(cache.size_in_bytes(), 512 * 1024 - ENTRY_BYTES)
+        self.assertEqual(len(evaluation_cache(0).keys), 1)
+
+    def test_probe_store_and_statistics(self):
+        cache = evaluation_cache(1)
+        key = 0x1234567890ABCDEF
+        self.assertEqual(cache.hit_rate(), 0.0)
+        self.assertIsNone(cache.probe(key))
+        cache.store(key, -42)
+        self.assertEqual(cache.probe(key), -42)
+        # direct-mapped: a key with the same index replaces the entry
+        other = key + cache.mask + 1
+        cache.store(other, 7)
+        self.assertIsNone(cache.probe(key))
+        self.assertEqual(cache.probe(other), 7)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        self.assertEqual(cache.hit_rate(), 0.5)
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+        self.assertIsNone(cache.probe(other))
+
+    def test_search_hits_cache_without_changing_results(self):
+        state = game_state()
+        for move in (encode_move((1, 3), (3, 3)), encode_move((6, 4), (4, 4))):
+            state.make_move(move)
+        cached = chess_ai()
+        tiny = chess_ai(eval_cache_size_mb=0)
+        self.assertEqual(cached.search(state, 3), tiny.search(state, 3))
+        self.assertGreater(cached.evaluation_cache.hit_rate(), 0.0)
+        self.assertEqual(cached.evaluate_board(state, Player.PLAYER_1), -cached.evaluate(state, Player.PLAYER_1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from rook import Rook
+from knight import Knight
+from bishop import Bishop
+from queen import Queen
+from king import King
+from board_setup import set_up_position
+
+
+class TestLegalMoves(unittest.TestCase):
+    def setUp(self):
+        self.states = [game_state(), game_state(backend=Backend.BITBOARD)]
+
+    def place(self, pieces):
+        for state in self.states:
+            set_up_position(state, pieces)
+
+    def assert_moves(self, square, expected):
+        for state in self.states:
+            board_before = [row[:] for row in state.board]
+            self.assertEqual(sorted(state.get_valid_moves(square)), sorted(expected))
+            self.assertEqual(state.board, board_before)
+
+    def test_pinned_piece_moves_along_pin_ray(self):
+        self.place([(King, 'k', 0, 3, Player.PLAYER_1), (Rook, 'r', 2, 3, Player.PLAYER_1),
+                    (Queen, 'q', 5, 3, Player.PLAYER_2), (Knight, 'n', 1, 4, Player.PLAYER_1),
+                    (Bishop, 'b', 3, 6, Player.PLAYER_2)])
+        self.assert_moves((2, 3), [(1, 3), (3, 3), (4, 3), (5, 3)])
+        self.assert_moves((1, 4), [])
+
+    def test_single_check_is_captured_or_blocked(self):
+        self.place([(King, 'k', 0, 3, Player.PLAYER_1), (Rook, 'r', 5, 3, Player.PLAYER_2),
+                    (Rook, 'r', 3, 0, Player.PLAYER_1), (Bishop, 'b', 3, 1, Player.PLAYER_1)])
+        self.assert_moves((3, 0), [])
+        self.assert_moves((3, 1), [(1, 3), (5, 3)])
+        self.assertTrue(all(state._is_check for state in self.states))
+
+    def test_double_check_only_moves_the_king(self):
+        self.place([(King, 'k', 0, 3, Player.PLAYER_1), (Rook, 'r', 5, 3, Player.PLAYER_2),
+                    (Knight, 'n', 2, 4, Player.PLAYER_2), (Rook, 'r', 4, 4, Player.PLAYER_1)])
+        self.assert_moves((4, 4), [])
+        self.assert_moves((0, 3), [(0, 2), (0, 4), (1, 4)])
+
+    def test_king_cannot_step_back_along_checking_ray(self):
+        self.place([(King, 'k', 0, 3, Player.PLAYER_1), (Rook, 'r', 0, 6, Player.PLAYER_2),
+                    (Knight, 'n', 3, 4, Player.PLAYER_2)])
+        # (0, 2) stays on the rook's rank and (1, 3) is covered by the knight
+        self.assert_moves((0, 3), [(1, 2), (1, 4)])
+
+    def test_generator_matches_move_list(self):
+        for state in (game_state(), game_state(backend=Backend.BITBOARD)):
+            for player in (Player.PLAYER_1, Player.PLAYER_2):
+                moves = state.generate_legal_moves(player)
+                self.assertEqual(next(moves), state.get_all_legal_moves(player)[0])
+                self.assertEqual(list(state.generate_legal_moves(player)), state.get_all_legal_moves(player))
+
+    def test_capture_generator_skips_quiet_moves(self):
+        self.place([(King, 'k', 0, 3, Player.PLAYER_1), (Rook, 'r', 2, 3, Player.PLAYER_1),
+                    (Queen, 'q', 5, 3, Player.PLAYER_2), (Knight, 'n', 1, 4, Player.PLAYER_1),
+                    (Bishop, 'b', 3, 6, Player.PLAYER_2), (King, 'k', 7, 0, Player.PLAYER_2)])
+        for state in self.states:
+            # the pinned rook may take the pinner, the pinned knight nothing
+            self.assertEqual(list(state.generate_legal_captures(Player.PLAYER_1)), [((2, 3), (5, 3))])
+            self.assertEqual(sorted(state.generate_legal_captures(Player.PLAYER_2)),
+                             [((3, 6), (1, 4)), ((5, 3), (2, 3))])
+        for state in (game_state(), game_state(backend=Backend.BITBOARD)):
+            self.assertEqual(len(state.get_capture_move_list(Player.PLAYER_1)), 0)
+
+    def test_has_legal_move(self):
+        self.place([(King, 'k', 0, 3, Player.PLAYER_1), (Queen, 'q', 1, 3, Player.PLAYER_2),
+                    (Rook, 'r', 2, 3, Player.PLAYER_2), (King, 'k', 7, 3, Player.PLAYER_2)])
+        for state in self.states:
+            self.assertFalse(state.has_legal_move(Player.PLAYER_1))
+            self.assertTrue(state.has_legal_move(Player.PLAYER_2))
+            self.assertEqual(state.checkmate_stalemate_checker(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
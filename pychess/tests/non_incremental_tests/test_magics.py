@@ -0,0 +1,47 @@
+import random
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from attack_tables import ROOK_DIRECTIONS, BISHOP_DIRECTIONS
+from generate_magics import walked_attacks, relevant_occupancy_mask
+from magics import rook_attacks, bishop_attacks, queen_attacks, ROOK_MASKS, BISHOP_MASKS
+from queen import Queen
+
+
+class TestMagics(unittest.TestCase):
+    def test_masks_match_generator(self):
+        for square in range(64):
+            self.assertEqual(ROOK_MASKS[square], relevant_occupancy_mask(square, ROOK_DIRECTIONS))
+            self.assertEqual(BISHOP_MASKS[square], relevant_occupancy_mask(square, BISHOP_DIRECTIONS))
+
+    def test_lookups_match_walked_rays(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            square = rng.randrange(64)
+            occupied = rng.getrandbits(64) & rng.getrandbits(64)
+            self.assertEqual(rook_attacks(square, occupied), walked_attacks(square, occupied, ROOK_DIRECTIONS))
+            self.assertEqual(bishop_attacks(square, occupied), walked_attacks(square, occupied, BISHOP_DIRECTIONS))
+            self.assertEqual(queen_attacks(square, occupied),
+                             rook_attacks(square, occupied) | bishop_attacks(square, occupied))
+
+    def test_empty_board(self):
+        self.assertEqual(bin(rook_attacks(27, 0)).count("1"), 14)
+        self.assertEqual(bin(bishop_attacks(27, 0)).count("1"), 13)
+
+
+class TestMagicPieceMoves(unittest.TestCase):
+    def test_sliders_match_list_backend(self):
+        list_state = game_state()
+        bitboard_state = game_state(backend=Backend.BITBOARD)
+        for state in (list_state, bitboard_state):
+            state.board[3][3] = Queen('q', 3, 3, Player.PLAYER_1)
+            state.board[1][4] = Player.EMPTY
+            state.reload_board()
+        for row, col in [(3, 3), (0, 0), (0, 2), (0, 4), (0, 5), (7, 4)]:
+            self.assertEqual(sorted(list_state.get_piece(row, col).get_valid_piece_moves(list_state)),
+                             sorted(bitboard_state.get_piece(row, col).get_valid_piece_moves(bitboard_state)))
+
+
+if __name__ == '__main__':
+    unittest.main()
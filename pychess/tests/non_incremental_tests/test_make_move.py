@@ -0,0 +1,71 @@
+import random
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from move_encoding import encode_move, CASTLE
+
+
+def snapshot(state):
+    board = [[None if piece == Player.EMPTY else
+              (piece.get_name(), piece.get_player(), piece.get_row_number(), piece.get_col_number())
+              for piece in row] for row in state.board]
+    return (board, list(state.white_king_can_castle), list(state.black_king_can_castle),
+            tuple(state._white_king_location), tuple(state._black_king_location), state.previous_piece_en_passant(),
+            state.white_turn, state.zobrist_key, len(state.move_log))
+
+
+class TestMakeMove(unittest.TestCase):
+    def test_make_move_matches_move_piece(self):
+        rng = random.Random(4)
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            checked = game_state(backend=backend)
+            trusted = game_state(backend=backend, verify_zobrist_key=True)
+            for _ in range(80):
+                if checked.move_log and rng.random() < 0.2:
+                    checked.undo_move()
+                    trusted.unmake_move()
+                else:
+                    moves = checked.get_legal_move_list(Player.PLAYER_1 if checked.whose_turn() else Player.PLAYER_2)
+                    if not moves:
+                        break
+                    move = rng.choice(moves)
+                    checked.move_piece(move)
+                    trusted.make_move(move)
+                self.assertEqual(snapshot(checked), snapshot(trusted))
+                if backend == Backend.BITBOARD:
+                    self.assertEqual(checked.bitboards.mailbox, trusted.bitboards.mailbox)
+
+    def test_castling(self):
+        state = game_state(verify_zobrist_key=True)
+        for row, col in [(0, 1), (0, 2)]:
+            state.board[row][col] = Player.EMPTY
+        state.reload_board()
+        before = snapshot(state)
+        state.make_move(encode_move((0, 3), (0, 1), CASTLE))
+        self.assertEqual(state.get_piece(0, 1).get_name(), 'k')
+        self.assertEqual(state.get_piece(0, 2).get_name(), 'r')
+        self.assertEqual(state.white_king_can_castle, [False, False, True])
+        self.assertEqual(tuple(state._white_king_location), (0, 1))
+        self.assertIsNone(state.unmake_move())
+        self.assertEqual(snapshot(state), before)
+
+    def test_null_move(self):
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = game_state(backend=backend, verify_zobrist_key=True)
+            state.make_move(encode_move((1, 3), (3, 3)))
+            self.assertEqual(state.en_passant_file(), 3)
+            before = snapshot(state)
+            state.make_null_move()
+            self.assertTrue(state.whose_turn())
+            self.assertIsNone(state.en_passant_file())
+            self.assertNotEqual(state.zobrist_key, before[7])
+            state.make_move(encode_move((1, 4), (2, 4)))
+            state.unmake_move()
+            state.unmake_null_move()
+            self.assertEqual(snapshot(state), before)
+            self.assertFalse(state.whose_turn())
+
+
+if __name__ == '__main__':
+    unittest.main()
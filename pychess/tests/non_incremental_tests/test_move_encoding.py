@@ -0,0 +1,47 @@
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from move_encoding import encode_move, decode_move, promotion_piece, NO_FLAGS, CASTLE, PROMOTE_KNIGHT, \
+    PROMOTE_QUEEN
+from pawn import Pawn
+from king import King
+from board_setup import set_up_position
+
+
+class TestMoveEncoding(unittest.TestCase):
+    def test_round_trip(self):
+        for starting_square, ending_square, flags in [((0, 0), (7, 7), NO_FLAGS), ((0, 3), (0, 1), CASTLE),
+                                                      ((6, 2), (7, 3), PROMOTE_KNIGHT)]:
+            move = encode_move(starting_square, ending_square, flags)
+            self.assertTrue(0 <= move < 1 << 16)
+            self.assertEqual(decode_move(move), (starting_square, ending_square, flags))
+        self.assertEqual(promotion_piece(encode_move((6, 2), (7, 2), PROMOTE_KNIGHT)), 'n')
+        self.assertEqual(promotion_piece(encode_move((6, 2), (5, 2))), None)
+
+    def test_move_list_matches_legal_moves(self):
+        for state in (game_state(), game_state(backend=Backend.BITBOARD)):
+            for player in (Player.PLAYER_1, Player.PLAYER_2):
+                move_list = state.get_legal_move_list(player)
+                self.assertEqual(move_list.typecode, 'H')
+                self.assertEqual([decode_move(move)[:2] for move in move_list], state.get_all_legal_moves(player))
+
+    def test_move_piece_accepts_packed_moves(self):
+        state = game_state()
+        state.move_piece(encode_move((1, 4), (3, 4)))
+        self.assertEqual(state.get_piece(3, 4).get_name(), 'p')
+        self.assertFalse(state.whose_turn())
+        state.undo_move()
+        self.assertTrue(state.whose_turn())
+        self.assertEqual(state.get_piece(1, 4).get_name(), 'p')
+
+    def test_promotion_flags(self):
+        state = set_up_position(game_state(), [(King, 'k', 0, 3, Player.PLAYER_1), (King, 'k', 7, 0, Player.PLAYER_2),
+                                               (Pawn, 'p', 6, 5, Player.PLAYER_1)])
+        self.assertIn(encode_move((6, 5), (7, 5), PROMOTE_QUEEN), state.get_legal_move_list(Player.PLAYER_1))
+        state.move_piece(encode_move((6, 5), (7, 5), PROMOTE_KNIGHT))
+        self.assertEqual(state.get_piece(7, 5).get_name(), 'n')
+
+
+if __name__ == '__main__':
+    unittest.main()
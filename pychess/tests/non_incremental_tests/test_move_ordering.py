@@ -0,0 +1,66 @@
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from move_encoding import encode_move, PROMOTE_QUEEN
+from move_ordering import move_orderer
+from king import King
+from knight import Knight
+from pawn import Pawn
+from queen import Queen
+from rook import Rook
+from board_setup import set_up_position
+
+
+class TestMoveOrdering(unittest.TestCase):
+    def setUp(self):
+        self.orderer = move_orderer()
+
+    def position(self, backend):
+        # the white rook and pawn can both take the black queen, the knight can take a pawn
+        return set_up_position(game_state(backend=backend),
+                               [(King, 'k', 0, 3, Player.PLAYER_1), (Rook, 'r', 2, 0, Player.PLAYER_1),
+                                (Pawn, 'p', 4, 4, Player.PLAYER_1), (Knight, 'n', 2, 6, Player.PLAYER_1),
+                                (King, 'k', 7, 3, Player.PLAYER_2), (Queen, 'q', 5, 5, Player.PLAYER_2),
+                                (Pawn, 'p', 4, 7, Player.PLAYER_2), (Pawn, 'p', 6, 0, Player.PLAYER_2)])
+
+    def test_captures_by_victim_then_attacker(self):
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = self.position(backend)
+            moves = state.get_legal_move_list(Player.PLAYER_1)
+            ordered = self.orderer.order_moves(state, moves, 0)
+            self.assertEqual(sorted(ordered), sorted(moves))
+            self.assertEqual(ordered[:3], [encode_move((4, 4), (5, 5)), encode_move((2, 6), (4, 7)),
+                                           encode_move((2, 0), (6, 0))])
+            self.assertFalse(self.orderer.is_tactical(state, ordered[3]))
+
+    def test_first_move_and_killers(self):
+        state = self.position(Backend.LIST)
+        moves = state.get_legal_move_list(Player.PLAYER_1)
+        quiet = [move for move in moves if not self.orderer.is_tactical(state, move)]
+        self.orderer.record_cutoff(state, quiet[-1], 3, 2)
+        self.orderer.record_cutoff(state, quiet[-2], 3, 2)
+        ordered = self.orderer.order_moves(state, moves, 2, quiet[0])
+        self.assertEqual(ordered[0], quiet[0])
+        self.assertEqual(ordered[4:6], [quiet[-2], quiet[-1]])
+        # killers belong to their ply, history is shared by all of them
+        ordered = self.orderer.order_moves(state, moves, 3)
+        self.assertEqual(ordered[3:5], [quiet[-2], quiet[-1]])
+        self.orderer.new_search()
+        self.assertEqual(self.orderer.killers[2], [0, 0])
+
+    def test_captures_do_not_become_killers(self):
+        state = self.position(Backend.BITBOARD)
+        capture = encode_move((4, 4), (5, 5))
+        self.orderer.record_cutoff(state, capture, 4, 0)
+        self.assertEqual(self.orderer.killers[0], [0, 0])
+        self.assertEqual(max(self.orderer.history), 0)
+
+    def test_queen_promotion_is_tactical(self):
+        state = game_state()
+        self.assertTrue(self.orderer.is_tactical(state, encode_move((6, 0), (7, 0), PROMOTE_QUEEN)))
+        self.assertFalse(self.orderer.is_tactical(state, encode_move((1, 0), (2, 0))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from ai_engine import chess_ai
+from move_encoding import encode_move
+
+
+def opening_position(backend=Backend.LIST):
+    state = game_state(backend=backend)
+    for move in (encode_move((1, 3), (3, 3)), encode_move((6, 4), (4, 4)), encode_move((0, 1), (2, 2)),
+                 encode_move((7, 6), (5, 5))):
+        state.make_move(move)
+    return state
+
+
+class TestParallelSearch(unittest.TestCase):
+    def test_snapshot_round_trip(self):
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = opening_position(backend)
+            state.black_king_can_castle[2] = False
+            state.reload_board()
+            copy = game_state.from_snapshot(state.snapshot())
+            self.assertEqual(copy.snapshot(), state.snapshot())
+            self.assertEqual(copy.zobrist_key, state.zobrist_key)
+            self.assertEqual(copy.backend, backend)
+            self.assertEqual(copy.black_king_can_castle, [True, True, False])
+            for player in (Player.PLAYER_1, Player.PLAYER_2):
+                self.assertEqual(copy.get_legal_move_list(player), state.get_legal_move_list(player))
+
+    def test_snapshot_after_double_pawn_step(self):
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = game_state(backend=backend)
+            state.make_move(encode_move((1, 3), (3, 3)))
+            copy = game_state.from_snapshot(state.snapshot())
+            self.assertEqual(copy.en_passant_file(), 3)
+            self.assertEqual(copy.zobrist_key, state.zobrist_key)
+            self.assertEqual(copy.snapshot(), state.snapshot())
+            # the file only lasts for one move
+            move = encode_move((6, 4), (5, 4))
+            state.make_move(move)
+            copy.make_move(move)
+            self.assertIsNone(copy.en_passant_file())
+            self.assertEqual(copy.zobrist_key, state.zobrist_key)
+
+    def test_one_worker_is_deterministic(self):
+        state = opening_position()
+        first, second = chess_ai(), chess_ai()
+        result = first.parallel_search(state, 3)
+        self.assertEqual(second.parallel_search(state, 3), result)
+        self.assertEqual(first.nodes, second.nodes)
+        self.assertEqual(result[1], chess_ai().search(state, 3)[1])
+        self.assertEqual(len(state.move_log), 4)
+
+    def test_worker_processes_agree(self):
+        state = opening_position(Backend.BITBOARD)
+        ai = chess_ai(tt_size_mb=1)
+        try:
+            best_move, score, pv = ai.parallel_search(state, 3, workers=2)
+        finally:
+            ai.close()
+        self.assertEqual(score, chess_ai().parallel_search(state, 3)[1])
+        self.assertEqual(pv[0], best_move)
+        self.assertGreater(ai.nodes, 0)
+
+    def test_lazy_smp_fills_shared_table(self):
+        state = opening_position(Backend.BITBOARD)
+        ai = chess_ai(tt_size_mb=1)
+        try:
+            best_move, score, pv = ai.lazy_smp_search(state, 3, workers=2)
+            self.assertIn(best_move, state.get_legal_move_list(Player.PLAYER_1))
+            self.assertEqual(pv[0], best_move)
+            self.assertGreater(ai.nodes, 0)
+            # the workers' root entry is in the table this process sees
+            self.assertIsNotNone(ai._smp_pool[2].probe(state.zobrist_key))
+            self.assertIsNone(ai.transposition_table.probe(state.zobrist_key))
+        finally:
+            ai.close()
+        self.assertIsNone(ai._smp_pool)
+
+    def test_resizing_one_pool_keeps_the_other(self):
+        state = opening_position(Backend.BITBOARD)
+        ai = chess_ai(tt_size_mb=1)
+        try:
+            ai.parallel_search(state, 1, workers=2)
+            ai.lazy_smp_search(state, 1, workers=2)
+            pool, smp_pool = ai._pool, ai._smp_pool
+            ai.lazy_smp_search(state, 1, workers=1)
+            self.assertIs(ai._pool, pool)
+            self.assertIsNot(ai._smp_pool, smp_pool)
+            smp_pool = ai._smp_pool
+            ai.parallel_search(state, 1, workers=3)
+            self.assertIs(ai._smp_pool, smp_pool)
+            self.assertEqual(ai._pool[0], 3)
+        finally:
+            ai.close()
+        self.assertIsNone(ai._pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import random
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from ai_engine import chess_ai
+from evaluation import pawn_structure, unpack_score, DOUBLED_PAWN_PENALTY, ISOLATED_PAWN_PENALTY, \
+    PASSED_PAWN_BONUSES
+from move_encoding import encode_move
+from pawn_hash import pawn_hash_table
+from zobrist import compute_pawn_key
+from attack_tables import square_index
+
+
+def pawns(*squares):
+    mask = 0
+    for row, col in squares:
+        mask |= 1 << square_index(row, col)
+    return mask
+
+
+class TestPawnStructure(unittest.TestCase):
+    def test_pawn_key_follows_moves_and_undos(self):
+        rng = random.Random(24)
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = game_state(backend=backend, verify_zobrist_key=True)
+            for _ in range(150):
+                if state.move_log and rng.random() < 0.25:
+                    state.unmake_move()
+                else:
+                    moves = state.get_legal_move_list(Player.PLAYER_1 if state.whose_turn() else Player.PLAYER_2)
+                    if not moves:
+                        break
+                    if rng.random() < 0.5:
+                        state.make_move(rng.choice(moves))
+                    else:
+                        state.move_piece(rng.choice(moves))
+                self.assertEqual(state.pawn_key, compute_pawn_key(state))
+
+    def test_terms(self):
+        # white: doubled and isolated pawns on column 0, a passed pawn on (5, 3) backed by (4, 4)
+        # black: an isolated passed pawn on (6, 7)
+        white = pawns((1, 0), (2, 0), (5, 3), (4, 4))
+        black = pawns((6, 7))
+        score, white_passed, black_passed = pawn_structure(white, black)
+        self.assertEqual(white_passed, pawns((2, 0), (5, 3), (4, 4)))
+        self.assertEqual(black_passed, pawns((6, 7)))
+        expected = -DOUBLED_PAWN_PENALTY - 2 * ISOLATED_PAWN_PENALTY + PASSED_PAWN_BONUSES[2] + \
+            PASSED_PAWN_BONUSES[5] + PASSED_PAWN_BONUSES[4] + ISOLATED_PAWN_PENALTY - PASSED_PAWN_BONUSES[1]
+        self.assertEqual(score, expected)
+        # an enemy pawn ahead on an adjacent file stops a pawn from being passed
+        self.assertEqual(pawn_structure(pawns((3, 3)), pawns((5, 2)))[1:], (0, 0))
+        self.assertEqual(unpack_score(pawn_structure(white, 0)[0])[2], 0)
+        # the starting pawns are mirrored
+        self.assertEqual(pawn_structure(pawns(*((1, col) for col in range(8))), pawns(*((6, col) for col in range(8)))),
+                         (0, 0, 0))
+
+    def test_pawn_hash(self):
+        table = pawn_hash_table(1)
+        self.assertLessEqual(table.size_in_bytes(), 1024 * 1024)
+        self.assertIsNone(table.probe(99))
+        table.store(99, -5, 1, 2)
+        self.assertEqual(table.probe(99), (-5, 1, 2))
+        self.assertEqual(table.hit_rate(), 0.5)
+
+    def test_search_reuses_pawn_hash(self):
+        state = game_state(backend=Backend.BITBOARD)
+        for move in (encode_move((1, 3), (3, 3)), encode_move((6, 4), (4, 4))):
+            state.make_move(move)
+        ai = chess_ai()
+        ai.search(state, 3)
+        # the opening is full of pawn moves; the hit rate grows as the pawns settle
+        self.assertGreater(ai.pawn_hash.hit_rate(), 0.5)
+        entry = ai.pawn_hash.probe(state.pawn_key)
+        self.assertIsNotNone(entry)
+        self.assertEqual(ai.pawn_structure_score(state), entry[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from ai_engine import chess_ai, INFINITY
+from move_encoding import encode_move
+from move_ordering import move_orderer
+from static_exchange import static_exchange
+from king import King
+from pawn import Pawn
+from queen import Queen
+from rook import Rook
+from board_setup import set_up_position
+
+PIECE_CLASSES = {'k': King, 'p': Pawn, 'q': Queen, 'r': Rook}
+
+
+def position(backend, pieces):
+    # pieces: (name, row, col, player); both kings have to be among them
+    return set_up_position(game_state(backend=backend),
+                           [(PIECE_CLASSES[name], name, row, col, player) for name, row, col, player in pieces])
+
+
+KINGS = [('k', 0, 7, Player.PLAYER_1), ('k', 7, 6, Player.PLAYER_2)]
+
+
+class TestStaticExchange(unittest.TestCase):
+    def test_defended_and_undefended_pawn(self):
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            capture = encode_move((1, 0), (4, 0))
+            undefended = position(backend, KINGS + [('r', 1, 0, Player.PLAYER_1), ('p', 4, 0, Player.PLAYER_2)])
+            self.assertEqual(static_exchange(undefended, capture), 10)
+            defended = position(backend, KINGS + [('r', 1, 0, Player.PLAYER_1), ('p', 4, 0, Player.PLAYER_2),
+                                                  ('p', 5, 1, Player.PLAYER_2)])
+            self.assertEqual(static_exchange(defended, capture), -40)
+
+    def test_x_ray_attackers(self):
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            pieces = KINGS + [('r', 1, 0, Player.PLAYER_1), ('p', 4, 0, Player.PLAYER_2), ('r', 6, 0, Player.PLAYER_2)]
+            capture = encode_move((1, 0), (4, 0))
+            self.assertEqual(static_exchange(position(backend, pieces), capture), -40)
+            # the second rook behind the first one recaptures once the first has gone
+            backed = position(backend, pieces + [('r', 0, 0, Player.PLAYER_1)])
+            self.assertEqual(static_exchange(backed, capture), 10)
+            # so does a black queen behind the black rook: taking the pawn loses the exchange
+            self.assertEqual(static_exchange(position(backend, pieces + [('r', 0, 0, Player.PLAYER_1),
+                                                                         ('q', 7, 0, Player.PLAYER_2)]),
+                                             capture), -40)
+
+    def test_king_only_takes_undefended_pieces(self):
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            pieces = [('k', 0, 7, Player.PLAYER_1), ('k', 7, 3, Player.PLAYER_2), ('q', 2, 3, Player.PLAYER_1),
+                      ('p', 6, 3, Player.PLAYER_2)]
+            capture = encode_move((2, 3), (6, 3))
+            self.assertEqual(static_exchange(position(backend, pieces), capture), -90)
+            self.assertEqual(static_exchange(position(backend, pieces + [('r', 0, 3, Player.PLAYER_1)]), capture), 10)
+
+    def test_losing_captures_are_ordered_last_and_skipped_in_quiescence(self):
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = position(backend, KINGS + [('r', 1, 0, Player.PLAYER_1), ('p', 4, 0, Player.PLAYER_2),
+                                               ('p', 5, 1, Player.PLAYER_2)])
+            moves = state.get_legal_move_list(Player.PLAYER_1)
+            ordered = move_orderer().order_moves(state, moves, 0)
+            self.assertEqual(ordered[-1], encode_move((1, 0), (4, 0)))
+            ai = chess_ai()
+            self.assertEqual(ai.quiescence(state, -INFINITY, INFINITY, 0), ai.evaluate(state, Player.PLAYER_1))
+            self.assertEqual(ai.nodes, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+from chess_engine import game_state
+from ai_engine import chess_ai, MATE_SCORE, score_to_table, score_from_table
+from move_encoding import encode_move
+from transposition_table import transposition_table, ENTRY_BYTES, EXACT, LOWER_BOUND, UPPER_BOUND
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def setUp(self):
+        self.table = transposition_table(1)
+        self.move = encode_move((1, 3), (3, 3))
+
+    def test_size_stays_under_cap(self):
+        for size_mb in (0.5, 1, 3):
+            table = transposition_table(size_mb)
+            self.assertLessEqual(table.size_in_bytes(), size_mb * 1024 * 1024)
+            self.assertGreater(table.size_in_bytes() * 2, size_mb * 1024 * 1024)
+        self.assertEqual(transposition_table(0).size_in_bytes(), 2 * ENTRY_BYTES)
+
+    def test_store_and_probe(self):
+        key = 0x123456789abcdef0
+        self.assertIsNone(self.table.probe(key))
+        self.table.store(key, 5, -4321, LOWER_BOUND, self.move)
+        self.assertEqual(self.table.probe(key), (5, -4321, LOWER_BOUND, self.move))
+        self.table.store(key, 3, MATE_SCORE - 7, EXACT, 0)
+        self.assertEqual(self.table.probe(key), (3, MATE_SCORE - 7, EXACT, 0))
+        self.assertIsNone(self.table.probe(key ^ 1 << 63))
+        self.table.clear()
+        self.assertIsNone(self.table.probe(key))
+
+    def test_shallower_entry_goes_to_always_replace_slot(self):
+        deep, shallow, newer = 1 << 40, 2 << 40, 3 << 40
+        self.table.store(deep, 6, 10, EXACT, self.move)
+        self.table.store(shallow, 2, 20, UPPER_BOUND, self.move)
+        self.assertEqual(self.table.probe(deep)[:2], (6, 10))
+        self.assertEqual(self.table.probe(shallow)[:2], (2, 20))
+        # the always-replace slot is overwritten, the deeper entry is kept
+        self.table.store(newer, 1, 30, EXACT, self.move)
+        self.assertIsNone(self.table.probe(shallow))
+        self.assertEqual(self.table.probe(deep)[:2], (6, 10))
+        # an entry of an older search no longer keeps its slot
+        self.table.new_search()
+        self.table.store(shallow, 1, 40, EXACT, self.move)
+        self.assertIsNone(self.table.probe(deep))
+        self.assertEqual(self.table.probe(shallow)[:2], (1, 40))
+
+    def test_shared_table(self):
+        table = transposition_table(1, shared=True)
+        other = transposition_table(1, shared_memory_name=table.shared_memory.name)
+        try:
+            key = 0x0123456789abcdef
+            table.store(key, 4, -77, UPPER_BOUND, self.move)
+            self.assertEqual(other.probe(key), (4, -77, UPPER_BOUND, self.move))
+            # an entry whose words do not belong together, as when a write is caught halfway, is a miss
+            index = (key & other.mask) << 1
+            other.data[index] ^= 1 << 40
+            self.assertIsNone(table.probe(key))
+        finally:
+            other.close()
+            table.close()
+
+    def test_mate_scores_are_stored_relative_to_node(self):
+        for score in (MATE_SCORE - 9, -MATE_SCORE + 9, 150, -150):
+            self.assertEqual(score_from_table(score_to_table(score, 4), 4), score)
+        # mated 9 plies from the root at ply 4 is mated 5 plies from the node, i.e. 7 plies from the root at ply 2
+        self.assertEqual(score_from_table(score_to_table(-MATE_SCORE + 9, 4), 2), -MATE_SCORE + 7)
+        self.assertEqual(score_to_table(150, 4), 150)
+
+
+class TestSearchWithTable(unittest.TestCase):
+    def test_table_persists_across_searches(self):
+        state = game_state()
+        ai = chess_ai(1)
+        first = ai.iterative_deepening(state, max_depth=3)
+        first_nodes = ai.nodes
+        self.assertIsNotNone(ai.transposition_table.probe(state.zobrist_key))
+        second = ai.iterative_deepening(state, max_depth=3)
+        self.assertEqual(second[:2], first[:2])
+        self.assertLess(ai.nodes, first_nodes)
+
+    def test_fixed_depth_score_matches_tiny_table(self):
+        state = game_state()
+        for move in (encode_move((1, 3), (3, 3)), encode_move((6, 4), (4, 4)), encode_move((0, 1), (2, 2))):
+            state.make_move(move)
+        for depth in (1, 2, 3):
+            # a one-bucket table keeps almost nothing, so it searches nearly every node
+            self.assertEqual(chess_ai(1).search(state, depth)[1], chess_ai(0).search(state, depth)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
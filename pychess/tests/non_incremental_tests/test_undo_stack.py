@@ -0,0 +1,62 @@
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state, UNDO_STACK_SIZE
+from pawn import Pawn
+from king import King
+from rook import Rook
+
+
+class TestUndoStack(unittest.TestCase):
+    def test_undo_restores_castling_rights_and_en_passant(self):
+        state = game_state()
+        state.move_piece((1, 3), (3, 3), True)
+        state.move_piece((6, 4), (4, 4), True)
+        self.assertEqual(state.previous_piece_en_passant(), (4, 4))
+        state.move_piece((0, 3), (1, 3), True)
+        self.assertFalse(state.white_king_can_castle[0])
+        state.undo_move()
+        self.assertEqual(state.white_king_can_castle, [True, True, True])
+        self.assertEqual(tuple(state._white_king_location), (0, 3))
+        state.undo_move()
+        self.assertEqual(state.previous_piece_en_passant(), (3, 3))
+
+    def test_undo_restores_captured_and_promoted_pieces(self):
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = game_state(backend=backend)
+            state.board = [[Player.EMPTY] * 8 for _ in range(8)]
+            state.board[0][3] = King('k', 0, 3, Player.PLAYER_1)
+            state.board[7][3] = King('k', 7, 3, Player.PLAYER_2)
+            state.board[6][6] = Pawn('p', 6, 6, Player.PLAYER_1)
+            state.board[7][7] = Rook('r', 7, 7, Player.PLAYER_2)
+            state.reload_board()
+            key = state.zobrist_key
+            state.move_piece((6, 6), (7, 7), True)
+            self.assertEqual(state.get_piece(7, 7).get_name(), 'q')
+            self.assertFalse(state.black_king_can_castle[2])
+            state.undo_move()
+            pawn = state.get_piece(6, 6)
+            rook = state.get_piece(7, 7)
+            self.assertEqual((pawn.get_name(), pawn.get_row_number(), pawn.get_col_number()), ('p', 6, 6))
+            self.assertEqual((rook.get_name(), rook.get_player()), ('r', Player.PLAYER_2))
+            self.assertEqual(state.black_king_can_castle, [True, True, True])
+            self.assertEqual(state.zobrist_key, key)
+            if state.bitboards is not None:
+                before = state.bitboards.mailbox[:]
+                state.reload_board()
+                self.assertEqual(state.bitboards.mailbox, before)
+
+    def test_stack_grows_for_long_games(self):
+        state = game_state(verify_zobrist_key=True)
+        key = state.zobrist_key
+        knight_tour = [((0, 1), (2, 2)), ((7, 1), (5, 2)), ((2, 2), (0, 1)), ((5, 2), (7, 1))]
+        for index in range(UNDO_STACK_SIZE + 4):
+            state.move_piece(*knight_tour[index % 4], is_ai=True)
+        while state.move_log:
+            state.undo_move()
+        self.assertEqual(state.zobrist_key, key)
+        self.assertIsNone(state.undo_move())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from enums import Player, Backend
+from chess_engine import game_state
+from zobrist import compute_key
+
+
+class TestZobrist(unittest.TestCase):
+    def test_transposition_has_same_key(self):
+        first = game_state()
+        second = game_state()
+        for starting_square, ending_square in [((0, 1), (2, 2)), ((7, 1), (5, 2)), ((0, 6), (2, 5)), ((7, 6), (5, 5))]:
+            first.move_piece(starting_square, ending_square, True)
+        for starting_square, ending_square in [((0, 6), (2, 5)), ((7, 1), (5, 2)), ((0, 1), (2, 2)), ((7, 6), (5, 5))]:
+            second.move_piece(starting_square, ending_square, True)
+        self.assertEqual(first.zobrist_key, second.zobrist_key)
+        self.assertNotEqual(first.zobrist_key, game_state().zobrist_key)
+
+    def test_side_to_move_castling_and_en_passant_change_key(self):
+        state = game_state()
+        initial_key = state.zobrist_key
+        state.white_turn = False
+        state.reload_board()
+        self.assertNotEqual(state.zobrist_key, initial_key)
+
+        state = game_state()
+        state.white_king_can_castle[2] = False
+        state.reload_board()
+        self.assertNotEqual(state.zobrist_key, initial_key)
+
+        state = game_state()
+        state.move_piece((1, 4), (3, 4), True)
+        self.assertEqual(state.en_passant_file(), 4)
+        double_step_key = state.zobrist_key
+        # the same position, reached with a knight move last
+        for starting_square, ending_square in [((7, 1), (5, 2)), ((0, 6), (2, 5)), ((5, 2), (7, 1)),
+                                               ((2, 5), (0, 6))]:
+            state.move_piece(starting_square, ending_square, True)
+        self.assertEqual(state.en_passant_file(), None)
+        self.assertNotEqual(state.zobrist_key, double_step_key)
+
+    def test_incremental_key_matches_recomputation(self):
+        rng = random.Random(3)
+        for backend in (Backend.LIST, Backend.BITBOARD):
+            state = game_state(backend=backend, verify_zobrist_key=True)
+            for _ in range(60):
+                player = Player.PLAYER_1 if state.whose_turn() else Player.PLAYER_2
+                moves = state.get_all_legal_moves(player)
+                if not moves:
+                    break
+                starting_square, ending_square = rng.choice(moves)
+                state.move_piece(starting_square, ending_square, True)
+            while state.move_log:
+                state.undo_move()
+                self.assertEqual(state.zobrist_key, compute_key(state))
+
+
+if __name__ == '__main__':
+    unittest.main()
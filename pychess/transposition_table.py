@@ -0,0 +1,98 @@
+#
+# The Transposition Table class
+# A fixed-size hash table of search results keyed by zobrist key, so a position reached again by another move order
+# is not searched from scratch.
+#
+# Every bucket holds two entries: the first is only replaced by a search at least as deep (or by any search once it
+# is left over from an older one), the second is always replaced. An entry is two 64-bit words, a packed data word
+#   bits 0-15 best move (packed, see move_encoding.py), 16-17 bound, 18-25 depth, 26-31 age, 32-63 score
+# and the key XORed with the data word. A probe only accepts an entry whose two words XOR back to its key, so when
+# processes share the table (see lazy SMP in ai_engine.py) an entry half written by one while another reads it is
+# seen as a miss instead of wrong data, and no lock is needed.
+#
+from array import array
+from multiprocessing import shared_memory
+
+EXACT = 0
+# the score is at least the stored one (the search failed high)
+LOWER_BOUND = 1
+# the score is at most the stored one (the search failed low)
+UPPER_BOUND = 2
+
+ENTRY_BYTES = 16
+ENTRIES_PER_BUCKET = 2
+DEFAULT_SIZE_MB = 16
+
+
+class transposition_table:
+    '''
+    shared=True puts the table in a new multiprocessing.shared_memory block, which other processes open by passing
+    its name (self.shared_memory.name) as shared_memory_name with the same size_mb; the process that created the
+    block removes it in close()
+    '''
+    def __init__(self, size_mb=DEFAULT_SIZE_MB, shared=False, shared_memory_name=None):
+        # the number of buckets is the largest power of two that fits in size_mb, so a key is mapped to its bucket
+        # with a mask
+        buckets = 1
+        while buckets * 2 * ENTRIES_PER_BUCKET * ENTRY_BYTES <= size_mb * 1024 * 1024:
+            buckets *= 2
+        self.mask = buckets - 1
+        entries = buckets * ENTRIES_PER_BUCKET
+        self.age = 0
+        self.shared_memory = None
+        self.owns_shared_memory = False
+        if shared or shared_memory_name is not None:
+            if shared_memory_name is None:
+                self.shared_memory = shared_memory.SharedMemory(create=True, size=entries * ENTRY_BYTES)
+                self.owns_shared_memory = True
+            else:
+                self.shared_memory = shared_memory.SharedMemory(shared_memory_name)
+            self.keys = self.shared_memory.buf[:entries * 8].cast('Q')
+            self.data = self.shared_memory.buf[entries * 8:entries * ENTRY_BYTES].cast('Q')
+        else:
+            self.keys = array('Q', [0]) * entries
+            self.data = array('Q', [0]) * entries
+
+    def size_in_bytes(self):
+        return len(self.keys) * ENTRY_BYTES
+
+    def clear(self):
+        self.keys[:] = array('Q', [0]) * len(self.keys)
+        self.data[:] = array('Q', [0]) * len(self.data)
+        self.age = 0
+
+    # Let go of the shared memory block, if the table lives in one
+    def close(self):
+        if self.shared_memory is not None:
+            self.keys.release()
+            self.data.release()
+            self.shared_memory.close()
+            if self.owns_shared_memory:
+                self.shared_memory.unlink()
+            self.shared_memory = None
+
+    # Start a new search; entries of earlier searches stay usable but lose their protection from replacement
+    def new_search(self):
+        self.age = (self.age + 1) & 63
+
+    def probe(self, key):
+        # (depth, score, bound, best move) stored for the key, None if there is no entry for it
+        index = (key & self.mask) << 1
+        keys = self.keys
+        data = self.data[index]
+        if keys[index] ^ data != key:
+            data = self.data[index + 1]
+            if keys[index + 1] ^ data != key:
+                return None
+        return data >> 18 & 0xFF, (data >> 32 ^ 0x80000000) - 0x80000000, data >> 16 & 3, data & 0xFFFF
+
+    def store(self, key, depth, score, bound, move):
+        index = (key & self.mask) << 1
+        data = (score & 0xFFFFFFFF) << 32 | self.age << 26 | depth << 18 | bound << 16 | move
+        stored = self.data[index]
+        if self.keys[index] ^ stored == key or depth >= stored >> 18 & 0xFF or stored >> 26 & 63 != self.age:
+            self.keys[index] = key ^ data
+            self.data[index] = data
+        else:
+            self.keys[index + 1] = key ^ data
+            self.data[index + 1] = data
@@ -0,0 +1,61 @@
+#
+# Zobrist hashing
+# A position key is the XOR of one random 64-bit number per (piece, square), one for black to move, one per
+# castling right and one per en passant file, so a move only has to XOR in and out the keys of what it changed.
+# The pawn key is the XOR of the pawns' piece keys alone; it only changes when a pawn moves, is taken or promotes,
+# and keys the pawn structure evaluation (see pawn_hash.py).
+#
+import random
+
+from enums import Player
+from bitboard import PIECE_CODES, PAWN
+from attack_tables import square_index
+
+# fixed seed, so that keys are the same in every run
+_random = random.Random(1945)
+
+# PIECE_KEYS[piece code][square]
+PIECE_KEYS = [[_random.getrandbits(64) for _ in range(64)] for _ in range(12)]
+BLACK_TO_MOVE_KEY = _random.getrandbits(64)
+# one key per flag of white_king_can_castle followed by black_king_can_castle
+CASTLING_KEYS = [_random.getrandbits(64) for _ in range(6)]
+EN_PASSANT_KEYS = [_random.getrandbits(64) for _ in range(8)]
+
+
+def piece_key(piece, row, col):
+    return PIECE_KEYS[PIECE_CODES[(piece.get_name(), piece.get_player())]][square_index(row, col)]
+
+
+def castling_key(white_king_can_castle, black_king_can_castle):
+    key = 0
+    for index, can_castle in enumerate(list(white_king_can_castle) + list(black_king_can_castle)):
+        if can_castle:
+            key ^= CASTLING_KEYS[index]
+    return key
+
+
+def en_passant_key(col):
+    return 0 if col is None else EN_PASSANT_KEYS[col]
+
+
+def compute_key(game_state):
+    # Full recomputation, used to initialise the key and to verify the incremental updates
+    key = 0
+    for row, pieces in enumerate(game_state.board):
+        for col, piece in enumerate(pieces):
+            if piece != Player.EMPTY:
+                key ^= piece_key(piece, row, col)
+    if not game_state.white_turn:
+        key ^= BLACK_TO_MOVE_KEY
+    key ^= castling_key(game_state.white_king_can_castle, game_state.black_king_can_castle)
+    return key ^ en_passant_key(game_state.en_passant_file())
+
+
+def compute_pawn_key(game_state):
+    # Full recomputation of the pawn key, used to initialise it and to verify the incremental updates
+    key = 0
+    for row, pieces in enumerate(game_state.board):
+        for col, piece in enumerate(pieces):
+            if piece != Player.EMPTY and PIECE_CODES[(piece.get_name(), piece.get_player())] % 6 == PAWN:
+                key ^= piece_key(piece, row, col)
+    return key